@@ -1,48 +1,119 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.Component.Cache.AnalysisCache import AnalysisCache
 from metripy.Component.Debug.Debugger import Debugger
 from metripy.Component.Output.CliOutput import CliOutput
 from metripy.Component.Output.ProgressBar import ProgressBar
 from metripy.Dependency.Composer.Composer import Composer
+from metripy.Dependency.Composer.Packegist import Packegist
 from metripy.Dependency.Dependency import Dependency
 from metripy.Dependency.Npm.Npm import Npm
+from metripy.Dependency.Npm.NpmOrg import NpmOrg
 from metripy.Dependency.Pip.Pip import Pip
+from metripy.Dependency.Pip.PyPi import PyPi
+from metripy.Dependency.RegistryCache import RegistryCache
+from metripy.Dependency.RegistryClient import RegistryClient
 from metripy.Git.GitAnalyzer import GitAnalyzer
+from metripy.Git.GitChangedFiles import GitChangedFiles
+from metripy.Git.GitCommitStore import GitCommitStore
 from metripy.Import.Json.JsonImporter import JsonImporter
 from metripy.LangAnalyzer.AbstractLangAnalyzer import AbstractLangAnalyzer
-from metripy.LangAnalyzer.Php.PhpAnalyzer import PhpAnalyzer
-from metripy.LangAnalyzer.Python.PythonAnalyzer import PythonAnalyzer
-from metripy.LangAnalyzer.Typescript.TypescriptAnalyzer import TypescriptAnalyzer
+from metripy.LangAnalyzer.LangAnalyzerFactory import LangAnalyzerFactory
+from metripy.LangAnalyzer.LangAnalyzerPool import LangAnalyzerPool
 from metripy.Metric.Code.FileMetrics import FileMetrics
 from metripy.Metric.Git.GitMetrics import GitMetrics
 from metripy.Metric.ProjectMetrics import ProjectMetrics
 from metripy.Trend.TrendAnalyzer import TrendAnalyzer
+from metripy.Trend.TrendSnapshot import TrendSnapshot
+from metripy.Trend.TrendSnapshotReader import TrendSnapshotReader
+from metripy.Trend.TrendStore import TrendStore
 
 
 class Analyzer:
-    def __init__(self, config: ProjectConfig, output: CliOutput, debugger: Debugger):
+    def __init__(
+        self,
+        config: ProjectConfig,
+        output: CliOutput,
+        debugger: Debugger,
+        workers: int = 1,
+        cache: AnalysisCache | None = None,
+        concurrent: bool = False,
+        offline: bool = False,
+    ):
         self.config = config
         self.output = output
         self.debugger = debugger
-        self.runners: list[AbstractLangAnalyzer] = [
-            PythonAnalyzer(self.config),
-            PhpAnalyzer(self.config),
-            TypescriptAnalyzer(self.config),
-        ]
+        self.workers = workers
+        self.cache = cache
+        self.concurrent = concurrent
+        self.offline = offline
+        # registry warnings of the dependency lookups
+        self.dependency_warnings: list[str] = []
+        self.runners: list[AbstractLangAnalyzer] = (
+            LangAnalyzerFactory.get_lang_analyzers(self.config)
+        )
+        for runner in self.runners:
+            runner.set_cache(self.cache)
 
     def analyze_git(self) -> GitMetrics:
         self.output.writeln("<info>Analyzing git history...</info>")
-        metrics = GitAnalyzer(self.config.git).analyze()
+        metrics = self._get_git_metrics()
         self.output.writeln("<success>Git history analyzed</success>")
 
         return metrics
 
+    def _get_git_metrics(self) -> GitMetrics:
+        store = GitCommitStore(
+            self.cache.get_git_commits_path() if self.cache else None
+        )
+        return GitAnalyzer(self.config.git, store).analyze()
+
+    def get_unchanged_metrics(self, files: list[str]) -> dict[str, FileMetrics]:
+        """metrics of the base report for all files that did not change since"""
+        base_report = self.config.changed.base_report
+        if not os.path.isfile(base_report):
+            self.output.writeln(
+                f"<info>No base report in {base_report}, analyzing all files</info>"
+            )
+            return {}
+
+        base_metrics = {
+            file_metric.full_name: file_metric
+            for file_metric in JsonImporter(self.output)
+            .import_data(base_report)
+            .file_metrics
+        }
+        changed_files = GitChangedFiles(self.config.base_path).get_changed_files(
+            self.config.changed.range
+        )
+        unchanged_metrics = {
+            file: base_metrics[file]
+            for file in files
+            if file in base_metrics and os.path.realpath(file) not in changed_files
+        }
+        self.output.writeln(
+            f"<info>{len(files) - len(unchanged_metrics)} of {len(files)} files "
+            f"changed since {self.config.changed.range}</info>"
+        )
+
+        return unchanged_metrics
+
     def analyze_code(self, files: list[str]) -> list[FileMetrics]:
         file_metrics = []
 
+        unchanged_metrics = {}
+        if self.config.changed:
+            unchanged_metrics = self.get_unchanged_metrics(files)
+
         # for multi language projects, register runner per language
         runner_sizes = []
         for runner in self.runners:
             runner.set_files(files)
+            if unchanged_metrics:
+                runner.set_base_metrics(unchanged_metrics)
             if not runner.is_needed():
                 continue
             runner_sizes.append(len(runner.files))
@@ -50,11 +121,21 @@ class Analyzer:
         self.debugger.debug(len(files))
         self.output.writeln("<info>Analyzing code...</info>")
         progress_bar = ProgressBar(self.output, sum(runner_sizes))
-        for runner in self.runners:
-            if not runner.is_needed():
-                continue
+        runners = [runner for runner in self.runners if runner.is_needed()]
+        for runner in runners:
             runner.before_run()
-            runner.run(progress_bar)
+
+        workers = min(self.workers, sum(runner_sizes))
+        if workers > 1:
+            self.debugger.debug(f"Analyzing code with {workers} workers")
+            LangAnalyzerPool(self.config, workers, self.cache).run(
+                runners, progress_bar
+            )
+        else:
+            for runner in runners:
+                runner.run(progress_bar)
+
+        for runner in runners:
             runner.after_run()
 
             for metric in runner.get_metrics():
@@ -65,40 +146,151 @@ class Analyzer:
 
         return file_metrics
 
+    def search_duplicates(self) -> list[dict]:
+        """duplicate code within the files of each language"""
+        self.output.writeln("<info>Searching duplicate code...</info>")
+        duplicates = []
+        for runner in self.runners:
+            if runner.is_needed():
+                duplicates.extend(runner.get_duplicates())
+        self.output.writeln(
+            f"<success>Found {len(duplicates)} duplicate code blocks</success>"
+        )
+
+        return duplicates
+
     def analyze_composer(self) -> list[Dependency]:
         self.output.writeln("<info>Analyzing composer packages...</info>")
-        dependencies = Composer().get_composer_dependencies(self.config.base_path)
+        dependencies = self._get_composer_dependencies()
+        self._write_dependency_warnings()
         self.output.writeln("<success>Composer packages analyzed</success>")
 
         return dependencies
 
+    def _get_registry_client(self) -> RegistryClient:
+        cache = None
+        if self.cache:
+            cache = RegistryCache(
+                self.cache.get_registry_path(), self.cache.registry_ttl
+            )
+        return RegistryClient(cache=cache, offline=self.offline)
+
+    def _write_dependency_warnings(self) -> None:
+        for warning in self.dependency_warnings:
+            self.output.writeln(f"<warning>{warning}</warning>")
+        self.dependency_warnings = []
+
+    def _get_composer_dependencies(self) -> list[Dependency]:
+        registry = Packegist(self._get_registry_client())
+        dependencies = Composer(registry).get_composer_dependencies(
+            self.config.base_path
+        )
+        self.dependency_warnings.extend(registry.warnings)
+        return dependencies
+
     def analyze_pip(self) -> list[Dependency]:
         self.output.writeln("<info>Analyzing pip packages...</info>")
-        dependencies = Pip().get_dependencies(self.config.base_path)
+        dependencies = self._get_pip_dependencies()
+        self._write_dependency_warnings()
         self.output.writeln("<success>Pip packages analyzed</success>")
 
         return dependencies
 
+    def _get_pip_dependencies(self) -> list[Dependency]:
+        registry = PyPi(self._get_registry_client())
+        dependencies = Pip(registry).get_dependencies(self.config.base_path)
+        self.dependency_warnings.extend(registry.warnings)
+        return dependencies
+
     def analyze_npm(self) -> list[Dependency]:
         self.output.writeln("<info>Analyzing npm packages...</info>")
-        dependencies = Npm().get_dependencies(self.config.base_path)
+        dependencies = self._get_npm_dependencies()
+        self._write_dependency_warnings()
         self.output.writeln("<success>Npm packages analyzed</success>")
 
         return dependencies
 
+    def _get_npm_dependencies(self) -> list[Dependency]:
+        registry = NpmOrg(self._get_registry_client())
+        dependencies = Npm(registry).get_dependencies(self.config.base_path)
+        self.dependency_warnings.extend(registry.warnings)
+        return dependencies
+
     def add_trends(self, project_metrics: ProjectMetrics):
         self.output.writeln("<info>Analyzing trends...</info>")
-        importer = JsonImporter(self.output)
-        historical_project_metrics = importer.import_data(self.config.history_path)
-        TrendAnalyzer().add_historical_file_trends(
-            project_metrics.file_metrics, historical_project_metrics.file_metrics
-        )
-        TrendAnalyzer().add_historical_project_trends(
-            project_metrics, historical_project_metrics
-        )
+        if TrendSnapshot.is_snapshot(self.config.history_path):
+            # only the files of this run are read from the snapshot
+            with TrendSnapshotReader(self.config.history_path) as snapshot:
+                TrendAnalyzer().add_file_trends(
+                    project_metrics.file_metrics, snapshot.get_file_metrics
+                )
+                TrendAnalyzer().add_aggregated_trends(
+                    project_metrics, snapshot.get_aggregated_metrics()
+                )
+        else:
+            importer = JsonImporter(self.output)
+            historical_project_metrics = importer.import_data(self.config.history_path)
+            TrendAnalyzer().add_historical_file_trends(
+                project_metrics.file_metrics, historical_project_metrics.file_metrics
+            )
+            TrendAnalyzer().add_historical_project_trends(
+                project_metrics, historical_project_metrics
+            )
         self.output.writeln("<success>Trends analyzed</success>")
 
+    def add_store_trends(self, project_metrics: ProjectMetrics):
+        """
+        trends against the last run in the trend store, unless a history report
+        is configured, then stores this run
+        """
+        config = self.config.trend_store
+        if directory := os.path.dirname(config.path):
+            os.makedirs(directory, exist_ok=True)
+        timestamp = int(time.time())
+        with TrendStore(config.path, self.config.name) as store:
+            run_id = store.get_last_run()
+            if run_id is not None and not self.config.history_path:
+                self.output.writeln("<info>Analyzing trends...</info>")
+                TrendAnalyzer().add_file_trends(
+                    project_metrics.file_metrics,
+                    lambda full_name: store.get_file_metrics(run_id, full_name),
+                )
+                TrendAnalyzer().add_aggregated_trends(
+                    project_metrics, store.get_aggregated_metrics(run_id)
+                )
+                self.output.writeln("<success>Trends analyzed</success>")
+            store.add_run(project_metrics, timestamp)
+            store.apply_retention(
+                timestamp, config.retention_days, config.downsample_days
+            )
+
     def run(self, files: list[str]) -> ProjectMetrics:
+        if self.concurrent:
+            git_stats, file_metrics, packages = self._run_concurrent(files)
+        else:
+            git_stats, file_metrics, packages = self._run_sequential(files)
+
+        # only once the git and dependency threads stopped writing to the cache
+        if self.cache:
+            self.cache.prune()
+
+        duplicates = None
+        if self.config.duplicates:
+            duplicates = self.search_duplicates()
+
+        project_metrics = ProjectMetrics(file_metrics, git_stats, packages, duplicates)
+
+        # analyze trends
+        if self.config.history_path:
+            self.add_trends(project_metrics)
+        if self.config.trend_store:
+            self.add_store_trends(project_metrics)
+
+        return project_metrics
+
+    def _run_sequential(
+        self, files: list[str]
+    ) -> tuple[GitMetrics | None, list[FileMetrics], list[Dependency] | None]:
         git_stats = None
         if self.config.git:
             git_stats = self.analyze_git()
@@ -116,11 +308,45 @@ class Analyzer:
         elif self.config.npm:
             packages = self.analyze_npm()
 
-        if not self.config.history_path:
-            return ProjectMetrics(file_metrics, git_stats, packages)
+        return git_stats, file_metrics, packages
 
-        # analyze trends
-        project_metrics = ProjectMetrics(file_metrics, git_stats, packages)
-        self.add_trends(project_metrics)
+    def _run_concurrent(
+        self, files: list[str]
+    ) -> tuple[GitMetrics | None, list[FileMetrics], list[Dependency] | None]:
+        """
+        git history and dependencies share no data with the code analysis,
+        both wait on subprocesses and the network in background threads.
+        Output of the threads is written once the code analysis is done,
+        writing next to the progress bar would break it.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            git_future: Future | None = None
+            if self.config.git:
+                self.output.writeln("<info>Analyzing git history...</info>")
+                git_future = executor.submit(self._get_git_metrics)
 
-        return project_metrics
+            packages_future: Future | None = None
+            if self.config.composer:
+                self.output.writeln("<info>Analyzing composer packages...</info>")
+                packages_future = executor.submit(self._get_composer_dependencies)
+            elif self.config.pip:
+                self.output.writeln("<info>Analyzing pip packages...</info>")
+                packages_future = executor.submit(self._get_pip_dependencies)
+            elif self.config.npm:
+                self.output.writeln("<info>Analyzing npm packages...</info>")
+                packages_future = executor.submit(self._get_npm_dependencies)
+
+            file_metrics = self.analyze_code(files)
+
+            git_stats = None
+            if git_future:
+                git_stats = git_future.result()
+                self.output.writeln("<success>Git history analyzed</success>")
+
+            packages = None
+            if packages_future:
+                packages = packages_future.result()
+                self._write_dependency_warnings()
+                self.output.writeln("<success>Dependencies analyzed</success>")
+
+        return git_stats, file_metrics, packages
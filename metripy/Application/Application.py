@@ -3,6 +3,7 @@ import json
 from metripy.Application.Analyzer import Analyzer
 from metripy.Application.Config.Parser import Parser
 from metripy.Application.Info import Info
+from metripy.Component.Cache.AnalysisCache import AnalysisCache
 from metripy.Component.Debug.Debugger import Debugger
 from metripy.Component.File.Finder import Finder
 from metripy.Component.Output.CliOutput import CliOutput
@@ -20,7 +21,11 @@ class Application:
         # issues and debug
         debugger = Debugger(output)
 
-        config = Parser().parse(argv)
+        try:
+            config = Parser().parse(argv)
+        except ValueError as error:
+            output.writeln(f"<error>{error}</error>")
+            exit(1)
         if config.debug:
             debugger.enable()
 
@@ -35,6 +40,10 @@ class Application:
         if config.quiet:
             output.set_quiet(True)
 
+        cache = None
+        if config.cache:
+            cache = AnalysisCache(config.cache, Info().get_version())
+
         finder = Finder()
         files = finder.fetch(config.project_configs)
 
@@ -49,9 +58,15 @@ class Application:
             debugger.debug(json.dumps(project_files))
 
             output.writeln(f"<info>Analying Project {project_config.name}...</info>")
-            project_metrics = Analyzer(project_config, output, debugger).run(
-                project_files
-            )
+            project_metrics = Analyzer(
+                project_config,
+                output,
+                debugger,
+                config.get_workers(),
+                cache,
+                config.concurrent,
+                config.offline,
+            ).run(project_files)
             project_metrics_list.append(project_metrics)
             output.writeln(
                 f"<success>Done analying Project {project_config.name}</success>"
@@ -78,7 +93,7 @@ class Application:
             )
             for report_config in project_config.reports:
                 reporter: ReporterInterface = ReporterFactory.create(
-                    report_config, output, project_config.name
+                    report_config, output, project_config.name, config.get_workers()
                 )
                 reporter.generate(project_metrics)
             output.writeln(
@@ -0,0 +1,20 @@
+import os
+
+
+class CacheConfig:
+    def __init__(self):
+        self.path = os.path.join(
+            os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+            "metripy",
+        )
+        # in megabytes
+        self.max_size = 512
+        # in seconds, older registry documents are revalidated
+        self.registry_ttl = 24 * 60 * 60
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "max_size": self.max_size,
+            "registry_ttl": self.registry_ttl,
+        }
@@ -0,0 +1,12 @@
+class ChangedConfig:
+    def __init__(self):
+        # json report of the last full analysis
+        self.base_report = ""
+        # git diff range of the changed files, e.g. origin/main...HEAD
+        self.range = "HEAD"
+
+    def to_dict(self) -> dict:
+        return {
+            "base_report": self.base_report,
+            "range": self.range,
+        }
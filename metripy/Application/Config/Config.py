@@ -1,3 +1,6 @@
+import os
+
+from metripy.Application.Config.CacheConfig import CacheConfig
 from metripy.Application.Config.ProjectConfig import ProjectConfig
 from metripy.Application.Config.FailureConfig import FailureConfig
 
@@ -11,6 +14,42 @@ class Config:
         self.version: bool = False
         self.help: bool = False
         self.debug: bool = False
+        self.workers: str | int = "auto"
+        self.cache: CacheConfig | None = CacheConfig()
+        # run git and dependency analysis in the background of code analysis
+        self.concurrent: bool = True
+        # only use cached registry documents for dependency analysis
+        self.offline: bool = False
+
+    def get_workers(self) -> int:
+        """number of processes used for code analysis, auto uses all cpus"""
+        if self.workers == "auto":
+            return os.cpu_count() or 1
+        return max(1, int(self.workers))
+
+    def validate(self) -> None:
+        """checks the settings once all arguments and config files are read"""
+        if self.offline and self.cache is None:
+            raise ValueError(
+                "--offline reads registry documents from the cache, "
+                "it can not be combined with --no-cache"
+            )
+        for project_config in self.project_configs:
+            project_config.validate()
+
+    @staticmethod
+    def _parse_workers(value: any) -> str | int:
+        if value == "auto":
+            return value
+        try:
+            workers = int(value)
+        except (TypeError, ValueError):
+            workers = 0
+        if isinstance(value, bool) or workers < 1:
+            raise ValueError(
+                f"Invalid number of workers: {value}, expected a number or auto"
+            )
+        return workers
 
     def to_dict(self) -> dict:
         return {
@@ -22,6 +61,10 @@ class Config:
                 for exit_code, failures in self.failure.items()
             },
             "html_index": self.html_index,
+            "workers": self.workers,
+            "cache": self.cache.to_dict() if self.cache else None,
+            "concurrent": self.concurrent,
+            "offline": self.offline,
         }
 
     def set(self, param: str, value: any) -> None:
@@ -33,6 +76,14 @@ class Config:
             self.help = value
         elif param == "debug":
             self.debug = value
+        elif param == "workers":
+            self.workers = self._parse_workers(value)
+        elif param == "no-cache":
+            self.cache = None
+        elif param == "sequential":
+            self.concurrent = False
+        elif param == "offline":
+            self.offline = value
         elif param.startswith("configs."):
             self._set_project_value(param[len("configs."):], value)
         else:
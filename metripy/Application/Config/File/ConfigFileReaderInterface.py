@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
 
+from metripy.Application.Config.CacheConfig import CacheConfig
+from metripy.Application.Config.ChangedConfig import ChangedConfig
 from metripy.Application.Config.Config import Config
 from metripy.Application.Config.File.PathResolver import PathResolver
 from metripy.Application.Config.GitConfig import GitConfig
 from metripy.Application.Config.ProjectConfig import ProjectConfig
 from metripy.Application.Config.ReportConfig import ReportConfig
+from metripy.Application.Config.TrendStoreConfig import TrendStoreConfig
 from metripy.Application.Config.FailureConfig import FailureConfig
 
 
@@ -44,6 +47,32 @@ class ConfigFileReaderInterface(ABC):
         if html_index := data.get("html_index"):
             config.html_index = self.resolve_path(html_index)
 
+        # workers
+        if workers := data.get("workers"):
+            config.set("workers", workers)
+
+        # concurrent
+        if "concurrent" in data:
+            config.concurrent = bool(data["concurrent"])
+
+        # offline
+        if "offline" in data:
+            config.offline = bool(data["offline"])
+
+        # cache
+        if "cache" in data:
+            cache = data["cache"]
+            if not cache:
+                config.cache = None
+            elif isinstance(cache, dict):
+                config.cache = CacheConfig()
+                if path := cache.get("path"):
+                    config.cache.path = self.resolve_path(path)
+                config.cache.max_size = cache.get("max_size", config.cache.max_size)
+                config.cache.registry_ttl = cache.get(
+                    "registry_ttl", config.cache.registry_ttl
+                )
+
     def parse_config_json(self, project_name: str, data: dict) -> ProjectConfig:
         project_config = ProjectConfig(project_name)
 
@@ -69,6 +98,16 @@ class ConfigFileReaderInterface(ABC):
         if excludes := data.get("excludes"):
             project_config.excludes = excludes
 
+        # gitignore
+        if gitignore := data.get("gitignore"):
+            project_config.gitignore = gitignore
+
+        # file source
+        if source := data.get("source"):
+            project_config.source = source
+        if untracked := data.get("untracked"):
+            project_config.untracked = untracked
+
         # reports
         if reports := data.get("reports"):
             for report_type, path in reports.items():
@@ -80,6 +119,7 @@ class ConfigFileReaderInterface(ABC):
             project_config.git = GitConfig()
             project_config.git.repo = project_config.base_path
             project_config.git.branch = git.get("branch", project_config.git.branch)
+            project_config.git.backend = git.get("backend", project_config.git.backend)
 
         # composer
         if composer := data.get("composer"):
@@ -93,10 +133,35 @@ class ConfigFileReaderInterface(ABC):
         if npm := data.get("npm"):
             project_config.npm = npm
 
+        # duplicate search
+        if duplicates := data.get("duplicates"):
+            project_config.duplicates = duplicates
+
         # trends
         if history_path := data.get("trends"):
             project_config.history_path = self.resolve_path(history_path)
 
+        # trend store
+        if trend_store := data.get("trend_store"):
+            project_config.trend_store = TrendStoreConfig()
+            if path := trend_store.get("path"):
+                project_config.trend_store.path = self.resolve_path(path)
+            project_config.trend_store.retention_days = trend_store.get(
+                "retention_days", project_config.trend_store.retention_days
+            )
+            project_config.trend_store.downsample_days = trend_store.get(
+                "downsample_days", project_config.trend_store.downsample_days
+            )
+
+        # changed files only
+        if changed := data.get("changed"):
+            project_config.changed = ChangedConfig()
+            if base_report := changed.get("base_report"):
+                project_config.changed.base_report = self.resolve_path(base_report)
+            project_config.changed.range = changed.get(
+                "range", project_config.changed.range
+            )
+
         # code smells
         code_smells = data.get("code_smells", True)
         if not isinstance(code_smells, dict):
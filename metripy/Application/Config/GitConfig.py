@@ -2,9 +2,12 @@ class GitConfig:
     def __init__(self):
         self.repo = "./"
         self.branch = "main"
+        # gitpython: diff every commit, log: read all commits from one git log
+        self.backend = "gitpython"
 
     def to_dict(self) -> dict:
         return {
             "repo": self.repo,
             "branch": self.branch,
+            "backend": self.backend,
         }
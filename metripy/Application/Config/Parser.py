@@ -25,14 +25,14 @@ class Parser:
                 argv.pop(key)
 
             # arguments with options
-            elif matches := re.search(r"^--([\w]+(?:\.[\w]+)*)=(.*)$", arg):
+            elif matches := re.search(r"^--([\w-]+(?:\.[\w-]+)*)=(.*)$", arg):
                 param = matches.group(1)
                 value = matches.group(2)
                 config.set(param, value)
                 argv.pop(key)
 
             # arguments without options
-            elif matches := re.search(r"^--([\w]+(?:\.[\w]+)*)$", arg):
+            elif matches := re.search(r"^--([\w-]+(?:\.[\w-]+)*)$", arg):
                 param = matches.group(1)
                 config.set(param, True)
                 argv.pop(key)
@@ -41,4 +41,6 @@ class Parser:
 
         # TODO handle remaining arguments
 
+        config.validate()
+
         return config
@@ -1,6 +1,10 @@
+import json
+
+from metripy.Application.Config.ChangedConfig import ChangedConfig
 from metripy.Application.Config.CodeSmellConfig import CodeSmellConfig
 from metripy.Application.Config.GitConfig import GitConfig
 from metripy.Application.Config.ReportConfig import ReportConfig
+from metripy.Application.Config.TrendStoreConfig import TrendStoreConfig
 
 
 class ProjectConfig:
@@ -9,6 +13,12 @@ class ProjectConfig:
         self.base_path: str = "./"
         self.includes: list[str] = []
         self.excludes: list[str] = []
+        # skip files ignored by .gitignore files
+        self.gitignore: bool = False
+        # filesystem: walk the includes, git: list the files in the git index
+        self.source: str = "filesystem"
+        # with the git source, also list files that are untracked but not ignored
+        self.untracked: bool = False
         self.extensions: list[str] = []
         self.git: GitConfig | None = None
         self.composer: bool = False
@@ -16,7 +26,13 @@ class ProjectConfig:
         self.npm: bool = False
         self.reports: list[ReportConfig] = []
         self.history_path: str | None = None
+        # metrics of all runs, for trends against the last run and series
+        self.trend_store: TrendStoreConfig | None = None
         self.code_smells: CodeSmellConfig = CodeSmellConfig()
+        # chunk the code of every file for the duplicate search, expensive
+        self.duplicates: bool = False
+        # only analyze changed files, take over the others from a base report
+        self.changed: ChangedConfig | None = None
 
     def to_dict(self) -> dict:
         return {
@@ -24,6 +40,9 @@ class ProjectConfig:
             "base_path": self.base_path,
             "includes": self.includes,
             "excludes": self.excludes,
+            "gitignore": self.gitignore,
+            "source": self.source,
+            "untracked": self.untracked,
             "extensions": self.extensions,
             "composer": self.composer,
             "pip": self.pip,
@@ -31,9 +50,29 @@ class ProjectConfig:
             "git": self.git.to_dict() if self.git else None,
             "reports": [report.to_dict() for report in self.reports],
             "history_path": self.history_path,
+            "trend_store": self.trend_store.to_dict() if self.trend_store else None,
             "code_smells": self.code_smells.to_dict(),
+            "duplicates": self.duplicates,
+            "changed": self.changed.to_dict() if self.changed else None,
         }
 
+    def get_analysis_settings(self) -> str:
+        """settings changing the analyzed modules, part of the analysis cache key"""
+        return json.dumps(
+            {
+                "code_smells": self.code_smells.to_dict(),
+                "duplicates": self.duplicates,
+            },
+            sort_keys=True,
+        )
+
+    def validate(self) -> None:
+        if self.trend_store is not None and not self.trend_store.path:
+            # sqlite would open a temporary database for an empty path
+            raise ValueError(f"trend_store of project {self.name} needs a path")
+        if self.changed is not None and not self.changed.base_report:
+            raise ValueError(f"changed of project {self.name} needs a base_report")
+
     @staticmethod
     def str_to_bool(value):
         if isinstance(value, bool):
@@ -53,6 +92,14 @@ class ProjectConfig:
             self.npm = self.str_to_bool(value)
         elif primary_key == "composer":
             self.composer = self.str_to_bool(value)
+        elif primary_key == "gitignore":
+            self.gitignore = self.str_to_bool(value)
+        elif primary_key == "source":
+            self.source = value
+        elif primary_key == "untracked":
+            self.untracked = self.str_to_bool(value)
+        elif primary_key == "duplicates":
+            self.duplicates = self.str_to_bool(value)
         elif primary_key == "trends":
             self.history_path = value
         elif primary_key == "git":
@@ -92,3 +139,23 @@ class ProjectConfig:
                 if not report_config:
                     return
                 self.reports.remove(report_config)
+        elif primary_key == "changed":
+            if len(keys) == 1:
+                return
+            if self.changed is None:
+                self.changed = ChangedConfig()
+            if keys[1] == "base_report":
+                self.changed.base_report = value
+            elif keys[1] == "range":
+                self.changed.range = value
+        elif primary_key == "trend_store":
+            if len(keys) == 1:
+                return
+            if self.trend_store is None:
+                self.trend_store = TrendStoreConfig()
+            if keys[1] == "path":
+                self.trend_store.path = value
+            elif keys[1] == "retention_days":
+                self.trend_store.retention_days = int(value)
+            elif keys[1] == "downsample_days":
+                self.trend_store.downsample_days = int(value)
@@ -0,0 +1,15 @@
+class TrendStoreConfig:
+    def __init__(self):
+        # sqlite database with the metrics of every run
+        self.path = ""
+        # runs older than this many days are deleted
+        self.retention_days = 90
+        # of runs older than this many days only the last one per day is kept
+        self.downsample_days = 14
+
+    def to_dict(self) -> dict:
+        return {
+            "path": self.path,
+            "retention_days": self.retention_days,
+            "downsample_days": self.downsample_days,
+        }
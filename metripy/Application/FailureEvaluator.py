@@ -1,11 +1,61 @@
 from metripy.Application.Config.FailureConfig import FailureConfig
 from metripy.Metric.ProjectMetrics import ProjectMetrics
-from metripy.Metric.Code.Segmentor import Segmentor
+from metripy.Metric.MetricStore import MetricStore
 from collections import defaultdict
 from metripy.Component.Output.CliOutput import CliOutput
 
 
 class FailureEvaluator:
+    # statistic => level, metric and segment of the metric store
+    STATISTICS = [
+        ("file_loc", MetricStore.FILE, "loc", "loc"),
+        (
+            "file_cyclomatic_complexity",
+            MetricStore.FILE,
+            "avgCcPerFunction",
+            "complexity",
+        ),
+        (
+            "file_maintainability_index",
+            MetricStore.FILE,
+            "maintainabilityIndex",
+            "maintainability",
+        ),
+        (
+            "file_cognitive_complexity",
+            MetricStore.FILE,
+            "avg_cog_complexity_per_function",
+            "complexity",
+        ),
+        ("class_loc", MetricStore.CLASS, "loc", "loc"),
+        (
+            "class_cyclomatic_complexity",
+            MetricStore.CLASS,
+            "real_complexity",
+            "complexity",
+        ),
+        ("class_lcom4", MetricStore.CLASS, "lcom4", "lcom4"),
+        ("function_loc", MetricStore.FUNCTION, "loc", "loc"),
+        (
+            "function_cyclomatic_complexity",
+            MetricStore.FUNCTION,
+            "complexity",
+            "complexity",
+        ),
+        (
+            "function_maintainability_index",
+            MetricStore.FUNCTION,
+            "maintainability_index",
+            "maintainability",
+        ),
+        (
+            "function_cognitive_complexity",
+            MetricStore.FUNCTION,
+            "cognitive_complexity",
+            "complexity",
+        ),
+    ]
+
     def __init__(self, failure: dict[int, list[FailureConfig]], output: CliOutput):
         self.failure = failure
         self.output = output
@@ -32,71 +82,14 @@ class FailureEvaluator:
         self, project_metrics_list: list[ProjectMetrics]
     ) -> dict[str, dict[str, int]]:
         statistics: dict[str, dict[str, int]] = {
-            "file_loc": defaultdict(int),
-            "file_cyclomatic_complexity": defaultdict(int),
-            "file_maintainability_index": defaultdict(int),
-            "file_cognitive_complexity": defaultdict(int),
-            "class_loc": defaultdict(int),
-            "class_cyclomatic_complexity": defaultdict(int),
-            "class_lcom4": defaultdict(int),
-            "function_loc": defaultdict(int),
-            "function_cyclomatic_complexity": defaultdict(int),
-            "function_maintainability_index": defaultdict(int),
-            "function_cognitive_complexity": defaultdict(int),
+            name: defaultdict(int) for name, _, _, _ in self.STATISTICS
         }
         for project_metrics in project_metrics_list:
-            for file_metrics in project_metrics.file_metrics:
-
-                loc_segment = Segmentor.get_loc_segment(file_metrics.loc)
-                complexity_segment = Segmentor.get_complexity_segment(
-                    file_metrics.avgCcPerFunction
-                )
-                maintainability_segment = Segmentor.get_maintainability_segment(
-                    file_metrics.maintainabilityIndex
-                )
-                cognitive_complexity_segment = Segmentor.get_complexity_segment(
-                    file_metrics.avg_cog_complexity_per_function
-                )
-
-                statistics["file_loc"][loc_segment] += 1
-                statistics["file_cyclomatic_complexity"][complexity_segment] += 1
-                statistics["file_maintainability_index"][maintainability_segment] += 1
-                statistics["file_cognitive_complexity"][
-                    cognitive_complexity_segment
-                ] += 1
-
-                for class_node in file_metrics.class_nodes:
-                    loc_segment = Segmentor.get_loc_segment(class_node.get_loc())
-                    complexity_segment = Segmentor.get_complexity_segment(
-                        class_node.real_complexity
-                    )
-                    lcom4_segment = Segmentor.get_lcom4_segment(class_node.lcom4)
-
-                    statistics["class_loc"][loc_segment] += 1
-                    statistics["class_cyclomatic_complexity"][complexity_segment] += 1
-                    statistics["class_lcom4"][lcom4_segment] += 1
-
-                for function_node in file_metrics.function_nodes:
-                    loc_segment = Segmentor.get_loc_segment(function_node.get_loc())
-                    complexity_segment = Segmentor.get_complexity_segment(
-                        function_node.complexity
-                    )
-                    maintainability_segment = Segmentor.get_maintainability_segment(
-                        function_node.maintainability_index
-                    )
-                    cognitive_complexity_segment = Segmentor.get_complexity_segment(
-                        function_node.cognitive_complexity
-                    )
-
-                    statistics["function_loc"][loc_segment] += 1
-                    statistics["function_cyclomatic_complexity"][
-                        complexity_segment
-                    ] += 1
-                    statistics["function_maintainability_index"][
-                        maintainability_segment
-                    ] += 1
-                    statistics["function_cognitive_complexity"][
-                        cognitive_complexity_segment
-                    ] += 1
+            store = project_metrics.metric_store
+            for name, level, column, segment in self.STATISTICS:
+                counts = store.count_segments(level, column, segment)
+                for severity, count in zip(MetricStore.SEGMENTS, counts):
+                    if count:
+                        statistics[name][severity] += count
 
         return statistics
@@ -1,7 +1,14 @@
+import os
 from importlib.metadata import metadata, version
 
 import toml
 
+# pyproject.toml of a source checkout, next to the metripy package
+PYPROJECT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "pyproject.toml",
+)
+
 
 class Info:
     def __init__(self):
@@ -9,9 +16,13 @@ class Info:
         self.url = self._get_homepage_url()
 
     def _get_pyproject_data(self) -> dict:
-        with open("pyproject.toml", "r") as file:
-            data = toml.load(file)
-        return data
+        """project table of the source checkout, empty if there is none"""
+        try:
+            with open(PYPROJECT_PATH, "r") as file:
+                data = toml.load(file)
+        except OSError:
+            return {}
+        return data.get("project", {})
 
     def _get_version(self) -> str:
         """Get version from installed package metadata"""
@@ -19,7 +30,7 @@ class Info:
             return version("metripy")
         except Exception:
             # Fallback for development if not installed
-            return self._get_pyproject_data()["project"]["version"]
+            return self._get_pyproject_data().get("version", "unknown")
 
     def _get_homepage_url(self) -> str:
         """Get homepage URL from installed package metadata"""
@@ -36,7 +47,8 @@ class Info:
             return homepage or "no homepage found"
         except Exception:
             # Fallback
-            return self._get_pyproject_data()["project"]["urls"]["Homepage"]
+            urls = self._get_pyproject_data().get("urls", {})
+            return urls.get("Homepage", "no homepage found")
 
     def get_version(self) -> str:
         return self.version
@@ -58,5 +70,9 @@ Options:
  --help               Show this help message and exit
  --debug              Enable debug mode
  --quiet              Disable output
+ --workers=<n|auto>   Number of processes analyzing code, defaults to auto
+ --no-cache           Analyze all files again, ignoring the analysis cache
+ --sequential         Analyze git history and dependencies after the code
+ --offline            Look up dependencies in the registry cache only
 """
         )
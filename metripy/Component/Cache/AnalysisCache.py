@@ -0,0 +1,120 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Iterator
+
+from metripy.Application.Config.CacheConfig import CacheConfig
+from metripy.Dependency.RegistryCache import RegistryCache
+from metripy.Tree.ModuleNode import ModuleNode
+
+
+class AnalysisCache:
+    """
+    On-disk cache of analyzed modules, keyed by file content.
+
+    Every entry is a pickled ModuleNode in its own file, so worker processes can
+    read and write the cache without locking. The mtime of an entry is its last
+    use, the least recently used entries are removed when the cache grows too big.
+    """
+
+    EXTENSION = ".pickle"
+    GIT_COMMITS = "git_commits.jsonl"
+    REGISTRY = "registry"
+
+    def __init__(self, config: CacheConfig, version: str):
+        self.path = config.path
+        self.max_size = int(config.max_size) * 1024 * 1024
+        self.version = version
+        self.registry_ttl = int(config.registry_ttl)
+
+    def get_key(self, lang_name: str, filename: str, code: str, settings: str) -> str:
+        # the filename is part of the results (full names, import names, code smells)
+        # settings are the serialized project settings the analysis depends on
+        digest = hashlib.sha256()
+        for part in (self.version, lang_name, settings, filename, code):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get_git_commits_path(self) -> str:
+        """file of the GitCommitStore, it lives next to the cached modules"""
+        return os.path.join(self.path, self.GIT_COMMITS)
+
+    def get_registry_path(self) -> str:
+        """directory of the RegistryCache, it lives next to the cached modules"""
+        return os.path.join(self.path, self.REGISTRY)
+
+    def _get_entry_path(self, key: str) -> str:
+        return os.path.join(self.path, key[:2], key + self.EXTENSION)
+
+    def get(self, key: str) -> ModuleNode | None:
+        entry_path = self._get_entry_path(key)
+        try:
+            with open(entry_path, "rb") as file:
+                module_node = pickle.load(file)
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # broken or outdated entry, it gets overwritten after the analysis
+            return None
+
+        return module_node
+
+    def set(self, key: str, module_node: ModuleNode) -> None:
+        entry_path = self._get_entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # write to a temp file first, other processes must never see half an entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path))
+        try:
+            with os.fdopen(fd, "wb") as file:
+                pickle.dump(module_node, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _scan_entries(path: str, extension: str) -> Iterator[os.DirEntry]:
+        if not os.path.isdir(path):
+            return
+        for directory in os.scandir(path):
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory.path):
+                if entry.name.endswith(extension):
+                    yield entry
+
+    def prune(self) -> None:
+        """remove least recently used entries until the cache fits into max_size"""
+        if not os.path.isdir(self.path):
+            return
+
+        entries = []
+        total_size = 0
+        # modules and registry documents share the layout <key[:2]>/<key><ext>
+        for path, extension in (
+            (self.path, self.EXTENSION),
+            (self.get_registry_path(), RegistryCache.EXTENSION),
+        ):
+            for entry in self._scan_entries(path, extension):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+        # the commit store only grows, it is removed as a whole when unused longest
+        git_commits_path = self.get_git_commits_path()
+        if os.path.isfile(git_commits_path):
+            stat = os.stat(git_commits_path)
+            entries.append((stat.st_mtime, stat.st_size, git_commits_path))
+            total_size += stat.st_size
+
+        entries.sort()
+        for _, size, entry_path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            total_size -= size
@@ -1,41 +1,189 @@
 import os
 
+from git import InvalidGitRepositoryError, NoSuchPathError
+from pathspec import GitIgnoreSpec
+
 from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.Git.GitFiles import GitFiles
 
 
 class Finder:
+    GITIGNORE = ".gitignore"
+    SOURCES = ["filesystem", "git"]
+
     def fetch(self, project_configs: list[ProjectConfig]) -> dict[str, list[str]]:
         """returns a list of files per project project_name => [files,...]"""
         project_files = {}
         for project_config in project_configs:
             files = []
+            extensions = tuple(project_config.extensions)
+            # excludes are gitignore patterns relative to base_path
+            excludes = GitIgnoreSpec.from_lines(project_config.excludes)
+            if project_config.source not in self.SOURCES:
+                raise ValueError(
+                    f"No file source found for name: {project_config.source}"
+                )
+            git_files = None
+            if project_config.source == "git":
+                git_files = self._get_git_files(project_config)
 
-            paths = [
-                os.path.join(project_config.base_path, inc)
-                for inc in project_config.includes
-            ]
-            for path in paths:
-                if os.path.isdir(path):
+            for include in project_config.includes:
+                path = os.path.join(project_config.base_path, include)
+                relative_path = self._get_relative_path(include)
+                if git_files is not None:
+                    self._filter(
+                        git_files, path, relative_path, extensions, excludes, files
+                    )
+                elif os.path.isdir(path):
+                    ignores = None
+                    if project_config.gitignore:
+                        ignores = self._get_parent_ignores(
+                            project_config.base_path, relative_path
+                        )
                     self._search(
-                        path, project_config.extensions, project_config.excludes, files
+                        path, relative_path, extensions, excludes, ignores, files
                     )
-                elif path not in project_config.excludes and path.endswith(
-                    tuple(project_config.extensions)
+                elif (
+                    path not in project_config.excludes
+                    and not excludes.match_file(relative_path)
+                    and path.endswith(extensions)
                 ):
                     files.append(path)
             project_files[project_config.name] = files
 
         return project_files
 
+    def _get_git_files(self, project_config: ProjectConfig) -> list[str] | None:
+        """files of base_path known to git, None if it is no git checkout"""
+        try:
+            git_files = GitFiles(project_config.base_path)
+        except (InvalidGitRepositoryError, NoSuchPathError):
+            return None
+        return git_files.get_files(project_config.untracked)
+
+    def _filter(
+        self,
+        files: list[str],
+        path: str,
+        relative_path: str,
+        extensions: tuple[str, ...],
+        excludes: GitIgnoreSpec,
+        results: list[str],
+    ):
+        """adds files below the include, files are relative to base_path"""
+        prefix = f"{relative_path}/" if relative_path else ""
+        # same as os.path.join(path, ...), without the call per file
+        head = path if path.endswith(os.sep) else path + os.sep
+        has_excludes = len(excludes) > 0
+        for file in files:
+            if not file.endswith(extensions):
+                continue
+            if file == relative_path:
+                file_path = path
+            elif file.startswith(prefix):
+                file_path = head + file[len(prefix) :]
+            else:
+                continue
+            if has_excludes and excludes.match_file(file):
+                continue
+            # a single stat for the remaining files, instead of git checking all
+            if os.path.exists(file_path):
+                results.append(file_path)
+
+    @staticmethod
+    def _get_relative_path(include: str) -> str:
+        relative_path = os.path.normpath(include).replace(os.sep, "/")
+        return "" if relative_path == "." else relative_path
+
+    def _get_parent_ignores(
+        self, base_path: str, relative_path: str
+    ) -> list[tuple[str, GitIgnoreSpec]]:
+        """gitignore files of base_path and every directory down to the include"""
+        ignores = []
+        prefix = ""
+        parts = relative_path.split("/")[:-1] if relative_path else []
+        for part in [""] + parts:
+            prefix = f"{prefix}{part}/" if part else prefix
+            spec = self._read_gitignore(os.path.join(base_path, prefix))
+            if spec is not None:
+                ignores.append((prefix, spec))
+
+        return ignores
+
+    def _read_gitignore(self, path: str) -> GitIgnoreSpec | None:
+        try:
+            with open(os.path.join(path, self.GITIGNORE), "r") as file:
+                return GitIgnoreSpec.from_lines(file.read().splitlines())
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
     def _search(
-        self, path: str, extensions: list[str], excludes: list[str], results: list[str]
+        self,
+        path: str,
+        relative_path: str,
+        extensions: tuple[str, ...],
+        excludes: GitIgnoreSpec,
+        ignores: list[tuple[str, GitIgnoreSpec]] | None,
+        results: list[str],
+    ):
+        """
+        Walks the tree depth first, in the same order as a recursive walk.
+        Excluded and ignored directories are skipped with everything below.
+        ignores are the gitignore specs with the directory they apply to,
+        None does not look at gitignore files at all.
+        """
+        use_gitignore = ignores is not None
+        prefix = f"{relative_path}/" if relative_path else ""
+        # entries still to visit per open directory, with its prefix and ignores
+        stack = [self._scan(path, prefix, use_gitignore, ignores or [])]
+        while stack:
+            entries, prefix, ignores = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            is_dir = entry.is_dir()
+            entry_path = f"{prefix}{entry.name}/" if is_dir else prefix + entry.name
+            if excludes.match_file(entry_path):
+                continue
+            if use_gitignore and self._is_ignored(entry_path, entry.name, ignores):
+                continue
+
+            if is_dir:
+                stack.append(self._scan(entry.path, entry_path, use_gitignore, ignores))
+            elif entry.name.endswith(extensions):
+                results.append(entry.path)
+
+    def _scan(
+        self,
+        path: str,
+        prefix: str,
+        use_gitignore: bool,
+        ignores: list[tuple[str, GitIgnoreSpec]],
     ):
-        if not os.path.isdir(path):
-            if path not in excludes and path.endswith(tuple(extensions)):
-                results.append(path)
-
-        for file in os.listdir(path):
-            if os.path.isdir(os.path.join(path, file)) and file not in excludes:
-                self._search(os.path.join(path, file), extensions, excludes, results)
-            elif file not in excludes and file.endswith(tuple(extensions)):
-                results.append(os.path.join(path, file))
+        with os.scandir(path) as iterator:
+            entries = list(iterator)
+        if use_gitignore:
+            spec = self._read_gitignore(path)
+            if spec is not None and prefix not in [p for p, _ in ignores]:
+                ignores = ignores + [(prefix, spec)]
+
+        return iter(entries), prefix, ignores
+
+    @staticmethod
+    def _is_ignored(
+        entry_path: str, name: str, ignores: list[tuple[str, GitIgnoreSpec]]
+    ) -> bool:
+        """
+        ignores are ordered from the outermost directory inwards, like git the
+        last matching pattern wins and a nested negation re-includes the entry
+        """
+        if name == ".git":
+            return True
+        ignored = False
+        for prefix, spec in ignores:
+            result = spec.check_file(entry_path[len(prefix) :])
+            if result.include is not None:
+                ignored = result.include
+        return ignored
@@ -6,14 +6,13 @@ from metripy.Dependency.Dependency import Dependency
 
 
 class Composer:
+    def __init__(self, registry: Packegist | None = None):
+        self.registry = registry or Packegist()
+
     def get_composer_dependencies(self, composer_json_path: str):
         requirements = self.get_composer_json_requirements(composer_json_path)
 
-        packegist = Packegist()
-        packages = []
-        for dependency in requirements:
-            package = packegist.get_info(dependency)
-            packages.append(package)
+        packages = self.registry.client.map(self.registry.get_info, requirements)
 
         return [item for item in packages if item is not None]
 
@@ -1,24 +1,32 @@
 import re
 
-import requests
 from packaging import version
 
 from metripy.Dependency.Dependency import Dependency
+from metripy.Dependency.RegistryClient import RegistryClient
 
 
 class Packegist:
+    BASE_URL = "https://packagist.org"
+
+    def __init__(self, client: RegistryClient | None = None, base_url: str = BASE_URL):
+        self.client = client or RegistryClient()
+        self.base_url = base_url
+        # written by the caller, lookups may run next to the progress bar
+        self.warnings: list[str] = []
+
     def get_info(self, dependency: Dependency) -> Dependency | None:
         if "/" not in dependency.name:
             return None
         [user, name] = dependency.name.split("/", 2)
-        uri = f"https://packagist.org/packages/{user}/{name}.json"
+        uri = f"{self.base_url}/packages/{user}/{name}.json"
 
-        x = requests.get(uri)
+        x = self.client.get(uri)
         d = x.json()
 
         package_info = d.get("package", None)
         if package_info is None:
-            print(f"package of {dependency.name} has no package info")
+            self.warnings.append(f"package of {dependency.name} has no package info")
             return dependency
 
         dependency.type = package_info["type"]
@@ -6,14 +6,13 @@ from metripy.Dependency.Npm.NpmOrg import NpmOrg
 
 
 class Npm:
+    def __init__(self, registry: NpmOrg | None = None):
+        self.registry = registry or NpmOrg()
+
     def get_dependencies(self, path: str) -> list[Dependency]:
         requirements = self._get_requirements(path)
 
-        npm_org = NpmOrg()
-        packages = []
-        for dependency in requirements:
-            package = npm_org.get_info(dependency)
-            packages.append(package)
+        packages = self.registry.client.map(self.registry.get_info, requirements)
 
         return [item for item in packages if item is not None]
 
@@ -23,7 +22,7 @@ class Npm:
             package_json = json.load(file)
             dependencies = package_json.get("dependencies", None)
             if dependencies is None:
-                return None
+                return []
             for name, version in dependencies.items():
                 requirements.append(Dependency(name, version))
 
@@ -1,18 +1,24 @@
-import requests
-
 from metripy.Dependency.Dependency import Dependency
+from metripy.Dependency.RegistryClient import RegistryClient
 
 
 class NpmOrg:
+    BASE_URL = "https://registry.npmjs.org"
+
+    def __init__(self, client: RegistryClient | None = None, base_url: str = BASE_URL):
+        self.client = client or RegistryClient()
+        self.base_url = base_url
+        self.warnings: list[str] = []
+
     def get_info(self, dependency: Dependency) -> Dependency | None:
         if not dependency.name:
             return None
 
-        uri = f"https://registry.npmjs.org/{dependency.name}"
-        response = requests.get(uri)
+        uri = f"{self.base_url}/{dependency.name}"
+        response = self.client.get(uri)
 
         if response.status_code != 200:
-            print(f"Package {dependency.name} not found on npm.org")
+            self.warnings.append(f"Package {dependency.name} not found on npm.org")
             return None
 
         data = response.json()
@@ -7,17 +7,16 @@ from metripy.Dependency.Pip.PyPi import PyPi
 
 
 class Pip:
+    def __init__(self, registry: PyPi | None = None):
+        self.registry = registry or PyPi()
+
     def get_dependencies(self, path: str) -> list[Dependency]:
         try:
             requirements = self.get_from_requirements_txt(path)
         except FileNotFoundError:
             requirements = self.get_from_pyproject_toml(path)
 
-        pypi = PyPi()
-        packages = []
-        for dependency in requirements:
-            package = pypi.get_info(dependency)
-            packages.append(package)
+        packages = self.registry.client.map(self.registry.get_info, requirements)
 
         return [item for item in packages if item is not None]
 
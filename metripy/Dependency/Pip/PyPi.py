@@ -1,19 +1,25 @@
-import requests
-
 from metripy.Dependency.Dependency import Dependency
+from metripy.Dependency.RegistryClient import RegistryClient
 
 
 class PyPi:
+    BASE_URL = "https://pypi.org"
+
+    def __init__(self, client: RegistryClient | None = None, base_url: str = BASE_URL):
+        self.client = client or RegistryClient()
+        self.base_url = base_url
+        self.warnings: list[str] = []
+
     def get_info(self, dependency: Dependency) -> Dependency | None:
-        uri = f"https://pypi.org/pypi/{dependency.name}/json"
-        x = requests.get(uri)
+        uri = f"{self.base_url}/pypi/{dependency.name}/json"
+        x = self.client.get(uri)
         data = x.json()
 
         info = data.get("info", {})
         releases = data.get("releases", {})
 
         if not info:
-            print(f"Package '{dependency.name}' has no info section")
+            self.warnings.append(f"Package '{dependency.name}' has no info section")
             return dependency
 
         dependency.type = "pip"
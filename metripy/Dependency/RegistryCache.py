@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class RegistryCache:
+    """
+    On-disk cache of registry documents, keyed by uri (registry and package).
+
+    Entries younger than ttl seconds are used as they are, older entries are
+    revalidated with their ETag / Last-Modified header before they are used.
+    """
+
+    EXTENSION = ".json"
+
+    def __init__(self, path: str, ttl: int):
+        self.path = path
+        self.ttl = ttl
+
+    def _get_entry_path(self, uri: str) -> str:
+        key = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, key[:2], key + self.EXTENSION)
+
+    def get(self, uri: str) -> dict | None:
+        try:
+            entry_path = self._get_entry_path(uri)
+            with open(entry_path, "r") as file:
+                entry = json.load(file)
+            # the mtime is the last use, AnalysisCache.prune removes unused entries
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # broken entry, it gets overwritten by the next download
+            return None
+
+        if entry.get("uri") != uri:
+            return None
+        return entry
+
+    def set(
+        self,
+        uri: str,
+        content: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> dict:
+        entry = {
+            "uri": uri,
+            "fetched_at": time.time(),
+            "etag": etag,
+            "last_modified": last_modified,
+            "content": content,
+        }
+        self._write(uri, entry)
+
+        return entry
+
+    def touch(self, uri: str, entry: dict) -> None:
+        """the registry confirmed the entry is unchanged, it is fresh again"""
+        entry["fetched_at"] = time.time()
+        self._write(uri, entry)
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def _write(self, uri: str, entry: dict) -> None:
+        entry_path = self._get_entry_path(uri)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        # write to a temp file first, other threads must never see half an entry
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path))
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump(entry, file)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
@@ -0,0 +1,96 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from metripy.Dependency.RegistryCache import RegistryCache
+from metripy.Dependency.RegistryResponse import RegistryResponse
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class RegistryClient:
+    """
+    Shared http client for package registries. Connections are pooled in one
+    session, so every registry host is only connected to once per worker.
+    """
+
+    MAX_WORKERS = 8
+    # connect and read timeout in seconds
+    TIMEOUT = 10
+    RETRIES = 3
+    BACKOFF_FACTOR = 0.5
+    RETRY_STATUSES = [429, 500, 502, 503, 504]
+    # answer for documents that are not cached in offline mode, like only-if-cached
+    OFFLINE_STATUS = 504
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        timeout: float = TIMEOUT,
+        retries: int = RETRIES,
+        backoff_factor: float = BACKOFF_FACTOR,
+        cache: RegistryCache | None = None,
+        offline: bool = False,
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.cache = cache
+        # only answer from the cache, never touch the network
+        self.offline = offline
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUSES,
+            allowed_methods=["GET"],
+            # hand the last response to the registry, it knows what a 404 means
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=max_workers,
+            pool_maxsize=max_workers,
+            max_retries=retry,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, uri: str) -> RegistryResponse:
+        entry = self.cache.get(uri) if self.cache else None
+        if entry and (self.offline or self.cache.is_fresh(entry)):
+            return RegistryResponse(200, entry["content"])
+        if self.offline:
+            return RegistryResponse(self.OFFLINE_STATUS, "{}")
+
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self.session.get(uri, headers=headers, timeout=self.timeout)
+        if entry and response.status_code == 304:
+            self.cache.touch(uri, entry)
+            return RegistryResponse(200, entry["content"])
+
+        if self.cache and response.status_code == 200:
+            self.cache.set(
+                uri,
+                response.text,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+        return RegistryResponse(response.status_code, response.text)
+
+    def map(self, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """calls function for all items in parallel, results keep the item order"""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(function, items))
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,12 @@
+import json
+
+
+class RegistryResponse:
+    """Answer of a registry, either fresh from the network or from the cache"""
+
+    def __init__(self, status_code: int, content: str):
+        self.status_code = status_code
+        self.content = content
+
+    def json(self) -> dict:
+        return json.loads(self.content)
@@ -1,16 +1,26 @@
 from collections import defaultdict
 from datetime import datetime
+from typing import Iterable, Iterator
 
-from git import Repo
+from git import Commit, Repo
 
 from metripy.Application.Config.GitConfig import GitConfig
+from metripy.Git.GitCommitStore import GitCommitStore
 from metripy.Metric.Git.GitMetrics import GitMetrics
 
 
 class GitAnalyzer:
-    def __init__(self, git_config: GitConfig):
+    BACKENDS = ["gitpython", "log"]
+    # every commit starts with a header line: \0sha\0author\0committer date
+    LOG_FORMAT = "%x00%H%x00%an%x00%cI"
+
+    def __init__(self, git_config: GitConfig, store: GitCommitStore | None = None):
+        if git_config.backend not in self.BACKENDS:
+            raise ValueError(f"No git backend found for name: {git_config.backend}")
         self.repo = Repo(git_config.repo)
         self.branch_name = git_config.branch
+        self.backend = git_config.backend
+        self.store = store or GitCommitStore()
 
     def analyze(self) -> GitMetrics:
         """Main analysis method with comprehensive output"""
@@ -41,6 +51,99 @@ class GitAnalyzer:
         }
         return any(file_path.endswith(ext) for ext in source_extensions)
 
+    def _get_commits(self, after: str) -> list[dict]:
+        if self.backend == "log":
+            return self._get_logged_commits(after)
+        return self._get_diffed_commits(after)
+
+    def _get_diffed_commits(self, after: str) -> list[dict]:
+        """stats of the commits since after, only unknown commits are diffed"""
+        shas = self.repo.git.rev_list(
+            self.branch_name, "--", no_merges=True, after=after
+        ).split()
+
+        commits = []
+        for sha in shas:
+            commit = self.store.get(sha)
+            if commit is None:
+                commit = self._read_commit(self.repo.commit(sha))
+                self.store.add(commit)
+            commits.append(commit)
+        self.store.save()
+
+        return commits
+
+    def _get_logged_commits(self, after: str) -> list[dict]:
+        """stats of the commits since after, streamed from a single git log"""
+        process = self.repo.git.log(
+            self.branch_name,
+            "--",
+            no_merges=True,
+            no_renames=True,
+            no_color=True,
+            no_show_signature=True,
+            no_use_mailmap=True,
+            numstat=True,
+            after=after,
+            format=self.LOG_FORMAT,
+            as_process=True,
+        )
+
+        commits = []
+        for commit in self._parse_log(process.stdout):
+            if self.store.get(commit["sha"]) is None:
+                self.store.add(commit)
+            commits.append(commit)
+        process.wait()
+        self.store.save()
+
+        return commits
+
+    def _parse_log(self, lines: Iterable[bytes]) -> Iterator[dict]:
+        """
+        Parses git log --numstat output line by line. Lines are counted the
+        same way as commit.stats does it, binary files count as zero lines
+        """
+        commit = None
+        files = {}
+        for raw_line in lines:
+            line = raw_line.decode("utf-8", "replace").rstrip("\n")
+            if line.startswith("\0"):
+                if commit is not None:
+                    commit["files"] = list(files)
+                    yield commit
+                _, sha, author, committed_date = line.split("\0")
+                commit = {
+                    "sha": sha,
+                    "month": committed_date[:7],
+                    "author": author,
+                    "insertions": 0,
+                    "deletions": 0,
+                    "files": [],
+                }
+                files = {}
+            elif line and commit is not None:
+                insertions, deletions, filename = line.split("\t")
+                commit["insertions"] += 0 if insertions == "-" else int(insertions)
+                commit["deletions"] += 0 if deletions == "-" else int(deletions)
+                files[filename.strip()] = None
+
+        if commit is not None:
+            commit["files"] = list(files)
+            yield commit
+
+    def _read_commit(self, commit: Commit) -> dict:
+        # every access of commit.stats runs a git diff
+        stats = commit.stats
+        return {
+            "sha": commit.hexsha,
+            "month": commit.committed_datetime.strftime("%Y-%m"),
+            "author": commit.author.name,
+            "insertions": stats.total.get("insertions", 0),
+            "deletions": stats.total.get("deletions", 0),
+            "files": list(stats.files),
+        }
+
     def get_metrics(self, after: str) -> GitMetrics:
         commits_per_month = {}
         chrun_per_month = defaultdict(lambda: {"added": 0, "removed": 0})
@@ -49,19 +152,16 @@ class GitAnalyzer:
             lambda: {"commits": 0, "lines_added": 0, "lines_removed": 0}
         )
 
-        for commit in self.repo.iter_commits(
-            self.branch_name, no_merges=True, after=after
-        ):
-            month = commit.committed_datetime.strftime("%Y-%m")
-            author = commit.author.name
+        for commit in self._get_commits(after):
+            month = commit["month"]
+            author = commit["author"]
 
             if month not in commits_per_month.keys():
                 commits_per_month[month] = 0
             commits_per_month[month] += 1
 
-            stats = commit.stats.total
-            insertions = stats.get("insertions", 0)
-            deletions = stats.get("deletions", 0)
+            insertions = commit["insertions"]
+            deletions = commit["deletions"]
             chrun_per_month[month]["added"] += insertions
             chrun_per_month[month]["removed"] += deletions
 
@@ -69,7 +169,7 @@ class GitAnalyzer:
             contributor_stats[author]["lines_added"] += insertions
             contributor_stats[author]["lines_removed"] += deletions
 
-            for file_path in commit.stats.files:
+            for file_path in commit["files"]:
                 if self._is_source_file(file_path):
                     file_contributors[file_path]["contributors"].add(author)
                     file_contributors[file_path]["commits"] += 1
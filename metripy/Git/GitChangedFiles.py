@@ -0,0 +1,20 @@
+import os
+
+from git import Repo
+
+
+class GitChangedFiles:
+    def __init__(self, path: str):
+        self.repo = Repo(path, search_parent_directories=True)
+
+    def get_changed_files(self, diff_range: str) -> set[str]:
+        """real paths of the files added or modified in diff_range"""
+        # without renames a moved file is a deleted and an added file
+        output = self.repo.git.diff(
+            diff_range, "--", z=True, name_only=True, no_renames=True, diff_filter="d"
+        )
+        return {
+            os.path.realpath(os.path.join(self.repo.working_tree_dir, path))
+            for path in output.split("\0")
+            if path
+        }
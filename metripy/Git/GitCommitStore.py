@@ -0,0 +1,52 @@
+import json
+import os
+
+
+class GitCommitStore:
+    """
+    Append only store of the numstat results per commit, keyed by the commit sha.
+
+    A commit never changes, so a stored result stays valid for every later run
+    and every repository that contains the commit. Without a path the store only
+    lives in memory.
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self.commits: dict[str, dict] = {}
+        self.new_commits: list[dict] = []
+        self._load()
+
+    def _load(self) -> None:
+        if self.path is None or not os.path.isfile(self.path):
+            return
+
+        with open(self.path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    commit = json.loads(line)
+                except json.JSONDecodeError:
+                    # interrupted write, the commit is analyzed again
+                    continue
+                self.commits[commit["sha"]] = commit
+        # the mtime is the last use, AnalysisCache.prune removes unused stores first
+        os.utime(self.path)
+
+    def get(self, sha: str) -> dict | None:
+        return self.commits.get(sha)
+
+    def add(self, commit: dict) -> None:
+        self.commits[commit["sha"]] = commit
+        self.new_commits.append(commit)
+
+    def save(self) -> None:
+        """append the commits added since the last save"""
+        if self.path is None or not self.new_commits:
+            self.new_commits = []
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            for commit in self.new_commits:
+                file.write(json.dumps(commit) + "\n")
+        self.new_commits = []
@@ -0,0 +1,32 @@
+import os
+
+from git import Repo
+
+
+class GitFiles:
+    """Files of a directory as git knows them, read from the index"""
+
+    def __init__(self, path: str):
+        self.repo = Repo(path, search_parent_directories=True)
+        # path relative to the root of the working tree, git paths start with it
+        self.prefix = os.path.relpath(
+            os.path.realpath(path), os.path.realpath(self.repo.working_tree_dir)
+        ).replace(os.sep, "/")
+
+    def get_files(self, untracked: bool = False) -> list[str]:
+        """
+        paths relative to path of all files in the index, deleted files stay in
+        it until the deletion is staged. untracked adds the files that are
+        neither tracked nor ignored
+        """
+        pathspec = [] if self.prefix == "." else [self.prefix]
+        files = self._ls_files(pathspec, cached=True)
+        if untracked:
+            files += self._ls_files(pathspec, others=True, exclude_standard=True)
+
+        start = 0 if self.prefix == "." else len(self.prefix) + 1
+        return [file[start:] for file in files]
+
+    def _ls_files(self, pathspec: list[str], **kwargs) -> list[str]:
+        output = self.repo.git.ls_files("-z", "--", *pathspec, **kwargs)
+        return [file for file in output.split("\0") if file]
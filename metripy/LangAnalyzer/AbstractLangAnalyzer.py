@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.Component.Cache.AnalysisCache import AnalysisCache
 from metripy.Component.Output.ProgressBar import ProgressBar
 from metripy.LangAnalyzer.Generic.CodeSmell.CodeSmellDetectorFactory import (
     CodeSmellDetectorFactory,
@@ -30,6 +31,9 @@ from metripy.LangAnalyzer.Generic.Metrics.CyclomaticComplexityAnalyzerFactory im
 from metripy.LangAnalyzer.Generic.Metrics.GenericCyclomaticComplexityAnalyzer import (
     GenericCyclomaticComplexityAnalyzer,
 )
+from metripy.LangAnalyzer.Generic.Metrics.GenericComplexityAnalyzer import (
+    GenericComplexityAnalyzer,
+)
 from metripy.LangAnalyzer.Generic.Metrics.LocAnalyzerFactory import LocAnalyzerFactory
 from metripy.Metric.Code.FileMetrics import FileMetrics
 from metripy.Tree.ModuleNode import ModuleNode
@@ -58,6 +62,11 @@ class AbstractLangAnalyzer(ABC):
         self.config = project_config
         self.files: list[str] = []
         self.modules: dict[str, ModuleNode] = {}
+        # metrics of unchanged files, taken over from a base report
+        self.base_metrics: dict[str, FileMetrics] = {}
+        # position of every file, metrics keep the order of the files
+        self.file_positions: dict[str, int] = {}
+        self.cache: AnalysisCache | None = None
         self.ast_parser: AstParser = AstParserFactory.get_ast_parser(
             self.get_lang_name()
         )
@@ -74,6 +83,10 @@ class AbstractLangAnalyzer(ABC):
                 self.get_lang_name()
             )
         )
+        # both complexities of all functions in one traversal per file
+        self.complexity_analyzer = GenericComplexityAnalyzer(
+            self.cyclomatic_complexity_analyzer, self.cognitive_complexity_analyzer
+        )
         self.halstead_analyzer: GenericHalSteadAnalyzer = (
             HalSteadAnalyzerFactory.get_halstead_analyzer(self.get_lang_name())
         )
@@ -113,16 +126,53 @@ class AbstractLangAnalyzer(ABC):
             filter(lambda file: file.endswith(self.get_supported_extensions()), files)
         )
 
+    def set_base_metrics(self, base_metrics: dict[str, FileMetrics]) -> None:
+        """files with base metrics are not analyzed again"""
+        self.file_positions = {file: i for i, file in enumerate(self.files)}
+        self.base_metrics = {
+            file: base_metrics[file] for file in self.files if file in base_metrics
+        }
+        self.files = [file for file in self.files if file not in self.base_metrics]
+
+    def set_cache(self, cache: AnalysisCache | None) -> None:
+        self.cache = cache
+
     def is_needed(self) -> bool:
-        return len(self.files) > 0
+        return len(self.files) > 0 or len(self.base_metrics) > 0
 
     def run(self, progress_bar: ProgressBar) -> None:
         for file in self.files:
-            with open(file, "r") as f:
-                code = f.read()
-                self.analyze(code, file)
+            self.analyze_file(file)
             progress_bar.advance()
 
+    def analyze_file(self, filename: str) -> ModuleNode:
+        with open(filename, "r") as f:
+            code = f.read()
+        if self.cache is None:
+            self.analyze(code, filename)
+            return self.modules[self.full_name(filename)]
+
+        key = self.cache.get_key(
+            self.get_lang_name(),
+            filename,
+            code,
+            self.config.get_analysis_settings(),
+        )
+        module_node = self.cache.get(key)
+        if module_node is not None:
+            self.add_module(module_node)
+            return module_node
+
+        self.analyze(code, filename)
+        module_node = self.modules[self.full_name(filename)]
+        self.cache.set(key, module_node)
+
+        return module_node
+
+    def add_module(self, module_node: ModuleNode) -> None:
+        """add a module that was analyzed elsewhere, e.g. in a worker process"""
+        self.modules[module_node.full_name] = module_node
+
     def create_module_node(self, filename: str, code: str) -> ModuleNode:
         loc_data = self.loc_analyzer.analyze(code)
         full_name = self.full_name(filename)
@@ -138,11 +188,8 @@ class AbstractLangAnalyzer(ABC):
         )
 
     def add_function_halstead_metrics(
-        self, function_node: FunctionNode, function_code: str
+        self, function_node: FunctionNode, function_metrics: dict
     ) -> None:
-        function_metrics = self.halstead_analyzer.calculate_halstead_metrics(
-            function_code
-        )
         function_node.h1 = function_metrics["n1"]
         function_node.h2 = function_metrics["n2"]
         function_node.N1 = function_metrics["N1"]
@@ -168,14 +215,15 @@ class AbstractLangAnalyzer(ABC):
         return f"{filename}:{class_name}:{item_name}"
 
     def get_duplicates(self) -> list[dict]:
+        self.duplicate_detector.clear()
+        for module in self.modules.values():
+            # the full name of a module is its filename
+            self.duplicate_detector.add_chunks(module.full_name, module.code_chunks)
         return self.duplicate_detector.get_duplicates()
 
     def get_metrics(self) -> list[FileMetrics]:
         metrics: dict[str, FileMetrics] = {}
 
-        efferent_coupling = {}
-        afferent_coupling = {}
-
         for module in self.modules.values():
             full_name = module.full_name
 
@@ -224,15 +272,32 @@ class AbstractLangAnalyzer(ABC):
             )
             metrics[full_name] = file_metric
 
-            if not module.import_name or not module.imports:
+        if self.base_metrics:
+            metrics.update(self.base_metrics)
+            metrics = dict(
+                sorted(metrics.items(), key=lambda item: self.file_positions[item[0]])
+            )
+
+        file_metrics = list(metrics.values())
+        self.set_coupling(file_metrics)
+
+        return file_metrics
+
+    @staticmethod
+    def set_coupling(file_metrics: list[FileMetrics]) -> None:
+        efferent_coupling = {}
+        afferent_coupling = {}
+
+        for file_metric in file_metrics:
+            if not file_metric.import_name or not file_metric.imports:
                 continue
-            efferent_coupling[module.import_name] = len(module.imports)
-            for import_name in module.imports:
+            efferent_coupling[file_metric.import_name] = len(file_metric.imports)
+            for import_name in file_metric.imports:
                 if import_name not in afferent_coupling:
                     afferent_coupling[import_name] = []
-                afferent_coupling[import_name].append(module.import_name)
+                afferent_coupling[import_name].append(file_metric.import_name)
 
-        for file_metric in metrics.values():
+        for file_metric in file_metrics:
             imported_by = afferent_coupling.get(file_metric.import_name, [])
             ca = len(imported_by)
             ce = efferent_coupling.get(file_metric.import_name, 0)
@@ -241,12 +306,10 @@ class AbstractLangAnalyzer(ABC):
             file_metric.efferent_coupling = ce
             file_metric.instability = (ce / (ca + ce)) if (ca + ce) > 0 else 0
 
-        return list(metrics.values())
-
     def analyze(self, code: str, filename: str) -> None:
         self.ast_parser.parse(code)
-        cyclomatic_complexity_data = self.cyclomatic_complexity_analyzer.calculate(
-            self.ast_parser
+        cyclomatic_complexity_data, cognitive_complexities = (
+            self.complexity_analyzer.calculate(self.ast_parser)
         )
 
         classes: dict[str, ClassNode] = {}
@@ -286,10 +349,16 @@ class AbstractLangAnalyzer(ABC):
         module_node.classes.extend(classes.values())
         module_node.functions.extend(functions.values())
 
-        code_lines = code.split("\n")
-        for func_name, function_node in functions.items():
-            lines = code_lines[function_node.lineno:function_node.line_end]
-            self.add_function_halstead_metrics(function_node, "\n".join(lines))
+        # all functions from one pass over the tokens of the file
+        function_metrics = self.halstead_analyzer.calculate_for_line_ranges(
+            code,
+            [
+                (function_node.lineno, function_node.line_end)
+                for function_node in functions.values()
+            ],
+        )
+        for function_node, metrics in zip(functions.values(), function_metrics):
+            self.add_function_halstead_metrics(function_node, metrics)
 
         maintainability_index = self._calculate_maintainability_index(
             functions.values(), module_node
@@ -297,20 +366,18 @@ class AbstractLangAnalyzer(ABC):
         module_node.maintainability_index = maintainability_index
         self.modules[module_node.full_name] = module_node
 
-        # ignore for now - maybe only pass class code, so we dont get import duplicates
-        # self.duplicate_detector.add_code(filename, code)
+        # chunks travel with the module, so pooled and cached files are searched too
+        if self.config.duplicates:
+            module_node.code_chunks = self.duplicate_detector.get_chunks(code)
 
         module_node.import_name, module_node.imports = (
             self.imports_analyzer.get_import_data(filename, self.ast_parser)
         )
 
-        module_node.code_smells = self.code_smell_detector.detect_all(filename, code)
-
-        cognitive_complexities = (
-            self.cognitive_complexity_analyzer.calculate_for_all_functions(
-                self.ast_parser
-            )
+        module_node.code_smells = self.code_smell_detector.detect_all(
+            filename, code, self.ast_parser
         )
+
         for func_name, complexity in cognitive_complexities.items():
             full_name = self.full_name(filename, func_name)
             function_node = functions.get(full_name)
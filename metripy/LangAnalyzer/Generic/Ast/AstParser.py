@@ -1,15 +1,22 @@
 """Generic AST parser using tree-sitter for multiple languages"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
-from tree_sitter import Node, Tree
-from tree_sitter_languages import get_parser
+from tree_sitter import Node, Query, Tree
+from tree_sitter_languages import get_language, get_parser
 
 
 class AstParser(ABC):
     """Base class for language-agnostic AST parsing using tree-sitter"""
 
+    # query name => tree-sitter S-expression query of the language
+    QUERIES: Dict[str, str] = {}
+    # compiled queries by language and query name or node types, shared by
+    # all parsers of the language
+    _compiled_queries: Dict[tuple[str, object], Optional[Query]] = {}
+    _node_kinds: Dict[str, set[tuple[str, bool]]] = {}
+
     def __init__(self, language: str):
         """
         Initialize parser for a specific language.
@@ -21,10 +28,13 @@ class AstParser(ABC):
         self.parser = get_parser(language)
         self.tree: Optional[Tree] = None
         self.code: str = ""
+        # query key => captures over the whole tree, kept until the next parse
+        self.captures: Dict[object, Dict[str, List[Node]]] = {}
 
     def parse(self, code: str) -> Optional[Tree]:
         """Parse code and return tree-sitter tree"""
         self.code = code
+        self.captures = {}
         try:
             self.tree = self.parser.parse(bytes(code, "utf8"))
             return self.tree
@@ -38,39 +48,113 @@ class AstParser(ABC):
         return node.text.decode("utf-8")
         # return self.code[node.start_byte : node.end_byte]
 
+    def get_query(self, name: str) -> Query:
+        """Query of QUERIES, compiled once per language"""
+        key = (self.language, name)
+        query = AstParser._compiled_queries.get(key)
+        if query is None:
+            query = get_language(self.language).query(self.QUERIES[name])
+            AstParser._compiled_queries[key] = query
+        return query
+
+    def get_type_query(self, node_types: tuple[str, ...]) -> Optional[Query]:
+        """
+        Query for all nodes of the given types, compiled once per language.
+        Types the grammar does not know are left out, None if none is left.
+        """
+        key = (self.language, node_types)
+        if key not in AstParser._compiled_queries:
+            language = get_language(self.language)
+            kinds = self._get_node_kinds()
+            patterns = []
+            for node_type in dict.fromkeys(node_types):
+                # named nodes and anonymous tokens share the type namespace
+                if (node_type, True) in kinds:
+                    patterns.append(f"({node_type}) @node")
+                if (node_type, False) in kinds:
+                    escaped = node_type.replace("\\", "\\\\").replace('"', '\\"')
+                    patterns.append(f'"{escaped}" @node')
+            query = language.query("\n".join(patterns)) if patterns else None
+            AstParser._compiled_queries[key] = query
+        return AstParser._compiled_queries[key]
+
+    def _get_node_kinds(self) -> set[tuple[str, bool]]:
+        """node types of the grammar that can show up in a tree, with is named"""
+        kinds = AstParser._node_kinds.get(self.language)
+        if kinds is None:
+            language = get_language(self.language)
+            kinds = {
+                (language.node_kind_for_id(i), language.node_kind_is_named(i))
+                for i in range(language.node_kind_count)
+                if language.node_kind_is_visible(i)
+            }
+            AstParser._node_kinds[self.language] = kinds
+        return kinds
+
+    def capture(self, name: str, root: Optional[Node] = None) -> Dict[str, List[Node]]:
+        """
+        Run a query of QUERIES over the tree, or the subtree of root, and
+        group the captured nodes by capture name in document order.
+        Captures over the whole tree are only run once per parse.
+        """
+        return self._capture(name, self.get_query, root)
+
+    def find_nodes_by_types(
+        self, node_types: List[str], root: Optional[Node] = None
+    ) -> List[Node]:
+        """Find all nodes of any of the types, in document order"""
+        captures = self._capture(tuple(node_types), self.get_type_query, root)
+        return captures.get("node", [])
+
     def find_nodes_by_type(
         self, node_type: str, root: Optional[Node] = None
     ) -> List[Node]:
         """Find all nodes of a specific type"""
+        return self.find_nodes_by_types([node_type], root)
+
+    def _capture(
+        self,
+        key: object,
+        get_query: Callable[[object], Optional[Query]],
+        root: Optional[Node],
+    ) -> Dict[str, List[Node]]:
         if root is None:
             if self.tree is None:
-                return []
-            root = self.tree.root_node
-
-        nodes = []
-        self._find_nodes_recursive(root, node_type, nodes)
-        return nodes
-
-    def _find_nodes_recursive(
-        self, node: Node, node_type: str, results: List[Node]
-    ) -> None:
-        """Recursively find nodes of a specific type"""
-        if node.type == node_type:
-            results.append(node)
-
-        for child in node.children:
-            self._find_nodes_recursive(child, node_type, results)
+                return {}
+            if key not in self.captures:
+                self.captures[key] = self._run_query(
+                    get_query(key), self.tree.root_node
+                )
+            # copies, callers are free to extend the lists
+            return {name: list(nodes) for name, nodes in self.captures[key].items()}
+
+        return self._run_query(get_query(key), root)
+
+    @staticmethod
+    def _run_query(query: Optional[Query], root: Node) -> Dict[str, List[Node]]:
+        captures: Dict[str, List[Node]] = {}
+        if query is None:
+            return captures
+        for node, name in query.captures(root):
+            captures.setdefault(name, []).append(node)
+        return captures
 
     def walk_tree(self, node: Optional[Node] = None):
-        """Generator to walk through all nodes in the tree"""
+        """Generator to walk through all nodes in the tree, in pre-order"""
         if node is None:
             if self.tree is None:
                 return
             node = self.tree.root_node
 
-        yield node
-        for child in node.children:
-            yield from self.walk_tree(child)
+        # a cursor created on node never leaves its subtree
+        cursor = node.walk()
+        while True:
+            yield cursor.node
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return
 
     @abstractmethod
     def get_import_nodes(self) -> List[Node]:
@@ -46,6 +46,18 @@ class CodeSmellSeverity(Enum):
 class CodeSmell:
     """Represents a detected code smell in the codebase"""
 
+    __slots__ = (
+        "smell_type",
+        "severity",
+        "filename",
+        "line_number",
+        "column",
+        "code_line",
+        "message",
+        "symbol",
+        "end_line",
+    )
+
     def __init__(
         self,
         smell_type: CodeSmellType,
@@ -82,6 +94,20 @@ class CodeSmell:
             "code_line": self.code_line,
         }
 
+    @staticmethod
+    def from_dict(data: dict) -> "CodeSmell":
+        return CodeSmell(
+            smell_type=CodeSmellType(data["type"]),
+            severity=CodeSmellSeverity(data["severity"]),
+            filename=data["filename"],
+            line_number=data["line"],
+            column=data["column"],
+            message=data["message"],
+            code_line=data["code_line"],
+            symbol=data.get("symbol"),
+            end_line=data.get("end_line"),
+        )
+
     def __repr__(self) -> str:
         return (
             f"CodeSmell({self.severity.value}: {self.smell_type.value} "
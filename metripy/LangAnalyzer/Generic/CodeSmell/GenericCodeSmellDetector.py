@@ -33,6 +33,7 @@ class GenericCodeSmellDetector:
         parser: AstParser,
         naming_detector_class: Type[BaseCodeSmellDetector] | None = None,
         max_params: int = 5,
+        parsed: bool = False,
     ):
         """
         Initialize generic code smell detector.
@@ -43,6 +44,7 @@ class GenericCodeSmellDetector:
             parser: Language-specific AST parser
             naming_detector_class: Optional language-specific naming convention detector
             max_params: Maximum number of parameters for functions
+            parsed: Whether the parser already holds the tree of the code
         """
         self.config = config
         self.filename = filename
@@ -51,8 +53,9 @@ class GenericCodeSmellDetector:
         self.naming_detector_class = naming_detector_class
         self.max_params = max_params
 
-        # Parse the code
-        self.parser.parse(code)
+        # Parse the code, unless the tree of the caller is reused
+        if not parsed:
+            self.parser.parse(code)
 
     def detect_all(self) -> List[CodeSmell]:
         """Run all code smell detection checks"""
@@ -89,7 +92,10 @@ class GenericCodeSmellDetector:
 
     @staticmethod
     def for_python(
-        config: CodeSmellConfig, filename: str, code: str
+        config: CodeSmellConfig,
+        filename: str,
+        code: str,
+        parser: AstParser | None = None,
     ) -> "GenericCodeSmellDetector":
         """Factory method to create detector for Python"""
         from metripy.LangAnalyzer.Python.Ast.PythonAstParser import PythonAstParser
@@ -97,18 +103,21 @@ class GenericCodeSmellDetector:
             PythonNamingConventionDetector,
         )
 
-        parser = PythonAstParser()
         return GenericCodeSmellDetector(
             config,
             filename,
             code,
-            parser,
+            parser or PythonAstParser(),
             naming_detector_class=PythonNamingConventionDetector,
+            parsed=parser is not None,
         )
 
     @staticmethod
     def for_php(
-        config: CodeSmellConfig, filename: str, code: str
+        config: CodeSmellConfig,
+        filename: str,
+        code: str,
+        parser: AstParser | None = None,
     ) -> "GenericCodeSmellDetector":
         """Factory method to create detector for PHP"""
         from metripy.LangAnalyzer.Php.Ast.PhpAstParser import PhpAstParser
@@ -116,18 +125,21 @@ class GenericCodeSmellDetector:
             PhpNamingConventionDetector,
         )
 
-        parser = PhpAstParser()
         return GenericCodeSmellDetector(
             config,
             filename,
             code,
-            parser,
+            parser or PhpAstParser(),
             naming_detector_class=PhpNamingConventionDetector,
+            parsed=parser is not None,
         )
 
     @staticmethod
     def for_typescript(
-        config: CodeSmellConfig, filename: str, code: str
+        config: CodeSmellConfig,
+        filename: str,
+        code: str,
+        parser: AstParser | None = None,
     ) -> "GenericCodeSmellDetector":
         """Factory method to create detector for TypeScript"""
         from metripy.LangAnalyzer.Typescript.Ast.TypescriptAstParser import (
@@ -137,11 +149,11 @@ class GenericCodeSmellDetector:
             TypescriptNamingConventionDetector,
         )
 
-        parser = TypescriptAstParser()
         return GenericCodeSmellDetector(
             config,
             filename,
             code,
-            parser,
+            parser or TypescriptAstParser(),
             naming_detector_class=TypescriptNamingConventionDetector,
+            parsed=parser is not None,
         )
@@ -4,6 +4,8 @@ from simhash import Simhash
 class CodeChunk:
     """Represents a chunk of code with location information"""
 
+    __slots__ = ("filename", "start_line", "end_line", "code", "hash_value")
+
     def __init__(
         self,
         filename: str,
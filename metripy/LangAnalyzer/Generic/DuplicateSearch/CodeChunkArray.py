@@ -0,0 +1,37 @@
+from array import array
+
+
+class CodeChunkArray:
+    """Chunks of code as compact columns: file id, line range and 64 bit hash"""
+
+    __slots__ = ("file_ids", "start_lines", "end_lines", "hashes")
+
+    def __init__(self):
+        self.file_ids = array("I")
+        self.start_lines = array("I")
+        self.end_lines = array("I")
+        self.hashes = array("Q")
+
+    def __len__(self) -> int:
+        return len(self.hashes)
+
+    def append(
+        self, file_id: int, start_line: int, end_line: int, hash_value: int
+    ) -> None:
+        self.file_ids.append(file_id)
+        self.start_lines.append(start_line)
+        self.end_lines.append(end_line)
+        self.hashes.append(hash_value)
+
+    def extend(self, chunks: "CodeChunkArray", file_id: int) -> None:
+        """append all chunks of another array as chunks of file_id"""
+        self.file_ids.extend(array("I", [file_id]) * len(chunks))
+        self.start_lines.extend(chunks.start_lines)
+        self.end_lines.extend(chunks.end_lines)
+        self.hashes.extend(chunks.hashes)
+
+    def clear(self) -> None:
+        del self.file_ids[:]
+        del self.start_lines[:]
+        del self.end_lines[:]
+        del self.hashes[:]
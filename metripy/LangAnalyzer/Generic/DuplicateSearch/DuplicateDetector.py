@@ -1,12 +1,20 @@
-from typing import Dict, List
+from collections import defaultdict
+from itertools import combinations
+from math import comb
+from typing import Dict, Iterator, List
 
 from simhash import Simhash
 
 from metripy.LangAnalyzer.Generic.DuplicateSearch.CodeChunk import CodeChunk
+from metripy.LangAnalyzer.Generic.DuplicateSearch.CodeChunkArray import CodeChunkArray
 from metripy.LangAnalyzer.Generic.DuplicateSearch.Tokenizer import Tokenizer
 
 
 class DuplicateDetector:
+    HASH_BITS = 64
+    # more agreeing blocks per table mean smaller buckets, but more tables
+    MAX_AGREEING_BLOCKS = 4
+
     def __init__(
         self,
         tokenizer: Tokenizer | None = None,
@@ -22,13 +30,14 @@ class DuplicateDetector:
             min_lines: Minimum number of non-empty lines to consider a chunk
         """
         self.tokenizer = tokenizer or Tokenizer()
-        self.chunks: List[CodeChunk] = []
+        # only file ids, line ranges and hashes are kept, no code
+        self.chunk_array = CodeChunkArray()
+        self.filenames: List[str] = []
+        self.file_ids: Dict[str, int] = {}
         self.chunk_size = chunk_size
         self.min_lines = min_lines
-        # TODO: improve this
-        self.file_contents: Dict[str, str] = (
-            {}
-        )  # Store file contents for code extraction
+        # contents of files added with add_code, others are read from disk
+        self.file_contents: Dict[str, str] = {}
 
     def compute_hash(self, code: str) -> Simhash:
         """Compute SimHash for a code string"""
@@ -37,17 +46,71 @@ class DuplicateDetector:
             return Simhash("")
         return Simhash(tokens)
 
+    @property
+    def chunks(self) -> List[CodeChunk]:
+        """The stored chunks as objects, their code is extracted on access"""
+        chunk_array = self.chunk_array
+        file_lines = [self._get_file_lines(filename) for filename in self.filenames]
+        chunks = []
+        for i in range(len(chunk_array)):
+            file_id = chunk_array.file_ids[i]
+            chunks.append(
+                CodeChunk(
+                    filename=self.filenames[file_id],
+                    start_line=chunk_array.start_lines[i],
+                    end_line=chunk_array.end_lines[i],
+                    code=self._extract_code_lines(
+                        self.filenames[file_id],
+                        chunk_array.start_lines[i],
+                        chunk_array.end_lines[i],
+                        file_lines[file_id],
+                    ),
+                    hash_value=Simhash(chunk_array.hashes[i]),
+                )
+            )
+        return chunks
+
     def add_code(self, filename: str, code: str) -> None:
         """
         Add code from a file and split it into chunks with location tracking.
+        The code is kept in memory to extract the reported snippets.
 
         Args:
             filename: Path to the source file
             code: Full source code content
         """
-        # Store file contents for later code extraction
         self.file_contents[filename] = code
+        self.add_chunks(filename, self.get_chunks(code))
+
+    def add_chunks(self, filename: str, chunks: CodeChunkArray) -> None:
+        """
+        Add the chunks of a file that were created elsewhere, e.g. in a worker
+        process. Reported snippets of the file are read from disk.
+        """
+        file_id = self.file_ids.get(filename)
+        if file_id is None:
+            file_id = len(self.filenames)
+            self.file_ids[filename] = file_id
+            self.filenames.append(filename)
+        self.chunk_array.extend(chunks, file_id)
+
+    def clear(self) -> None:
+        self.chunk_array.clear()
+        self.filenames.clear()
+        self.file_ids.clear()
+        self.file_contents.clear()
+
+    def get_chunks(self, code: str) -> CodeChunkArray:
+        """
+        Split code into overlapping chunks with location tracking.
 
+        Args:
+            code: Full source code content
+
+        Returns:
+            Chunks of the code, one per line that starts a meaningful chunk
+        """
+        chunks = CodeChunkArray()
         lines = code.split("\n")
 
         # Sliding window approach: create overlapping chunks
@@ -73,17 +136,27 @@ class DuplicateDetector:
 
             hash_value = self.compute_hash(chunk_code)
 
-            chunk = CodeChunk(
-                filename=filename,
-                start_line=i + 1,  # 1-indexed
-                end_line=end_idx,  # 1-indexed
-                code=chunk_code,
-                hash_value=hash_value,
-            )
+            # line range is 1-indexed and inclusive
+            chunks.append(0, i + 1, end_idx, hash_value.value)
+
+        return chunks
 
-            self.chunks.append(chunk)
+    def _get_file_lines(self, filename: str) -> List[str]:
+        if filename in self.file_contents:
+            return self.file_contents[filename].split("\n")
+        try:
+            with open(filename, "r") as f:
+                return f.read().split("\n")
+        except OSError:
+            return []
 
-    def _extract_code_lines(self, filename: str, start_line: int, end_line: int) -> str:
+    def _extract_code_lines(
+        self,
+        filename: str,
+        start_line: int,
+        end_line: int,
+        lines: List[str] | None = None,
+    ) -> str:
         """
         Extract code from a file between specified line numbers (1-indexed, inclusive).
 
@@ -91,20 +164,36 @@ class DuplicateDetector:
             filename: Path to the source file
             start_line: Starting line number (1-indexed)
             end_line: Ending line number (1-indexed, inclusive)
+            lines: Lines of the file, if they are already loaded
 
         Returns:
             Extracted code as a string
         """
-        if filename not in self.file_contents:
-            return ""
-
-        lines = self.file_contents[filename].split("\n")
+        if lines is None:
+            lines = self._get_file_lines(filename)
         # Convert to 0-indexed and extract the range
         start_idx = max(0, start_line - 1)
         end_idx = min(len(lines), end_line)
 
         return "\n".join(lines[start_idx:end_idx])
 
+    def _add_code_snippets(self, duplicates: List[Dict]) -> None:
+        """Extract the code of the reported duplicates, reading every file once"""
+        by_file: Dict[str, List[tuple[Dict, str]]] = defaultdict(list)
+        for duplicate in duplicates:
+            by_file[duplicate["file1"]].append((duplicate, "1"))
+            by_file[duplicate["file2"]].append((duplicate, "2"))
+
+        for filename, parts in by_file.items():
+            lines = self._get_file_lines(filename)
+            for duplicate, part in parts:
+                duplicate["code" + part] = self._extract_code_lines(
+                    filename,
+                    duplicate["start_line" + part],
+                    duplicate["end_line" + part],
+                    lines,
+                )
+
     def _do_ranges_overlap(
         self, start1: int, end1: int, start2: int, end2: int
     ) -> bool:
@@ -176,12 +265,8 @@ class DuplicateDetector:
                 "start_line2": start_line2,
                 "end_line2": end_line2,
                 "similarity": max(dup1["similarity"], dup2["similarity"]),
-                "code1": self._extract_code_lines(
-                    dup1["file1"], start_line1, end_line1
-                ),
-                "code2": self._extract_code_lines(
-                    dup1["file2"], start_line2, end_line2
-                ),
+                "code1": None,
+                "code2": None,
                 "lines": end_line1 - start_line1 + 1,
             }
         else:
@@ -199,12 +284,8 @@ class DuplicateDetector:
                 "start_line2": start_line2,
                 "end_line2": end_line2,
                 "similarity": max(dup1["similarity"], dup2["similarity"]),
-                "code1": self._extract_code_lines(
-                    dup1["file1"], start_line1, end_line1
-                ),
-                "code2": self._extract_code_lines(
-                    dup1["file2"], start_line2, end_line2
-                ),
+                "code1": None,
+                "code2": None,
                 "lines": end_line1 - start_line1 + 1,
             }
 
@@ -241,6 +322,95 @@ class DuplicateDetector:
 
         return aggregated
 
+    def _get_max_distance(self, min_similarity: float) -> int:
+        """Largest hamming distance that still reaches min_similarity, -1 if none"""
+        for distance in range(self.HASH_BITS, -1, -1):
+            if (1 - distance / self.HASH_BITS) * 100 >= min_similarity:
+                return distance
+        return -1
+
+    def _get_agreeing_blocks(self, max_distance: int) -> int:
+        """
+        Pick how many blocks two hashes must share to land in the same bucket.
+
+        Split into max_distance + t blocks, two hashes within max_distance differ
+        in at most max_distance blocks, so they agree on t blocks and meet in at
+        least one table. Estimate the work of building the tables and of
+        comparing the expected bucket pairs, and take the cheapest t.
+        """
+        n = len(self.chunk_array)
+        best_cost, best_agreeing = float(n * n), 0
+        for agreeing in range(1, self.MAX_AGREEING_BLOCKS + 1):
+            blocks = max_distance + agreeing
+            if blocks > self.HASH_BITS:
+                break
+            tables = comb(blocks, agreeing)
+            key_bits = self.HASH_BITS * agreeing / blocks
+            cost = tables * n + tables * n * n / 2 ** (key_bits + 1)
+            if cost < best_cost:
+                best_cost, best_agreeing = cost, agreeing
+        return best_agreeing
+
+    def _get_candidate_pairs(self, max_distance: int) -> Iterator[tuple[int, int]]:
+        """
+        Yield every pair of chunk indices (i < j) of different files within
+        max_distance once.
+
+        Permuted table index: the 64 bit hashes are split into blocks, every
+        table buckets the chunks by one combination of blocks. Only chunks that
+        share a bucket are compared.
+        """
+        hashes = self.chunk_array.hashes
+        files = self.chunk_array.file_ids
+        agreeing = self._get_agreeing_blocks(max_distance)
+        if agreeing == 0:
+            tables = [()]
+            masks = []
+        else:
+            block_count = max_distance + agreeing
+            bounds = [
+                self.HASH_BITS * block // block_count
+                for block in range(block_count + 1)
+            ]
+            masks = [
+                ((1 << (bounds[block + 1] - bounds[block])) - 1) << bounds[block]
+                for block in range(block_count)
+            ]
+            tables = list(combinations(range(block_count), agreeing))
+
+        for table in tables:
+            table_mask = 0
+            for block in table:
+                table_mask |= masks[block]
+            buckets: Dict[int, List[int]] = defaultdict(list)
+            for index, hash_value in enumerate(hashes):
+                buckets[hash_value & table_mask].append(index)
+
+            for bucket in buckets.values():
+                for x, i in enumerate(bucket):
+                    for j in bucket[x + 1 :]:
+                        if files[i] == files[j]:
+                            continue
+                        diff = hashes[i] ^ hashes[j]
+                        if diff.bit_count() > max_distance:
+                            continue
+                        # the pair meets in every table of blocks it agrees on,
+                        # only report it in the first of those tables
+                        if self._get_first_table(diff, masks, agreeing) == table:
+                            yield i, j
+
+    def _get_first_table(
+        self, diff: int, masks: List[int], agreeing: int
+    ) -> tuple[int, ...]:
+        """first combination of blocks in which both hashes of diff agree"""
+        table = []
+        for block, mask in enumerate(masks):
+            if len(table) == agreeing:
+                break
+            if not diff & mask:
+                table.append(block)
+        return tuple(table)
+
     def get_duplicates(self, min_similarity: float = 85.0) -> List[Dict]:
         """
         Find duplicate code chunks across all added files.
@@ -254,38 +424,38 @@ class DuplicateDetector:
         """
         duplicates = []
 
-        # Compare all chunk pairs
-        for i in range(len(self.chunks)):
-            for j in range(i + 1, len(self.chunks)):
-                chunk1 = self.chunks[i]
-                chunk2 = self.chunks[j]
-                if chunk1.filename == chunk2.filename:
-                    continue
-
-                # Calculate Hamming distance
-                distance = chunk1.hash_value.distance(chunk2.hash_value)
-                similarity = (1 - distance / 64) * 100
-
-                if similarity >= min_similarity:
-                    duplicates.append(
-                        {
-                            "file1": chunk1.filename,
-                            "start_line1": chunk1.start_line,
-                            "end_line1": chunk1.end_line,
-                            "file2": chunk2.filename,
-                            "start_line2": chunk2.start_line,
-                            "end_line2": chunk2.end_line,
-                            "similarity": round(similarity, 2),
-                            "code1": chunk1.code,
-                            "code2": chunk2.code,
-                            "lines": chunk1.end_line - chunk1.start_line + 1,
-                        }
-                    )
+        max_distance = self._get_max_distance(min_similarity)
+        if max_distance < 0:
+            return []
+
+        # Compare chunk pairs that share a bucket in the hash index
+        chunk_array = self.chunk_array
+        for i, j in self._get_candidate_pairs(max_distance):
+            # Calculate Hamming distance
+            distance = (chunk_array.hashes[i] ^ chunk_array.hashes[j]).bit_count()
+            similarity = (1 - distance / 64) * 100
+
+            duplicates.append(
+                {
+                    "file1": self.filenames[chunk_array.file_ids[i]],
+                    "start_line1": chunk_array.start_lines[i],
+                    "end_line1": chunk_array.end_lines[i],
+                    "file2": self.filenames[chunk_array.file_ids[j]],
+                    "start_line2": chunk_array.start_lines[j],
+                    "end_line2": chunk_array.end_lines[j],
+                    "similarity": round(similarity, 2),
+                    # extracted after the aggregation, for reported regions only
+                    "code1": None,
+                    "code2": None,
+                    "lines": chunk_array.end_lines[i] - chunk_array.start_lines[i] + 1,
+                }
+            )
 
         # Sort by similarity (highest first)
         duplicates.sort(key=lambda x: x["similarity"], reverse=True)
 
         # Always aggregate overlapping duplicates
         duplicates = self._aggregate_overlapping_duplicates(duplicates)
+        self._add_code_snippets(duplicates)
 
         return duplicates
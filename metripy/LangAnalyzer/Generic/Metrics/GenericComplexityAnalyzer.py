@@ -0,0 +1,225 @@
+from tree_sitter import Node
+
+from metripy.LangAnalyzer.Generic.Ast.AstParser import AstParser
+from metripy.LangAnalyzer.Generic.Metrics.GenericCognitiveComplexityAnalyzer import (
+    GenericCognitiveComplexityCalculator,
+)
+from metripy.LangAnalyzer.Generic.Metrics.GenericCyclomaticComplexityAnalyzer import (
+    GenericCyclomaticComplexityAnalyzer,
+)
+
+# nesting, in else-if chain, skipped, inner if when the node is the else of an if
+Context = tuple[int, bool, bool, Node | None]
+
+
+class GenericComplexityAnalyzer:
+    """
+    Cyclomatic and cognitive complexity of all functions and methods of a file
+    from a single traversal, with the same results as the language analyzers
+    compute per function.
+
+    Every function is a boundary. Its counts are collected relative to itself
+    and handed to the enclosing function when the traversal leaves it. A node
+    nested d levels deeper in the enclosing function adds d more to its
+    cognitive complexity, so the enclosing function adds d times the nesting
+    penalties of the nested function instead of walking it again.
+    """
+
+    NESTING_KEYS = ["for", "while", "try", "catch", "except"]
+
+    def __init__(
+        self,
+        cyclomatic_analyzer: GenericCyclomaticComplexityAnalyzer,
+        cognitive_calculator: GenericCognitiveComplexityCalculator,
+    ):
+        self.cyclomatic_analyzer = cyclomatic_analyzer
+        self.decision_types = frozenset(cyclomatic_analyzer.get_decision_types())
+        self.special_types = frozenset(
+            decision_type
+            for decision_type in self.decision_types
+            if cyclomatic_analyzer.has_special_rule(decision_type)
+        )
+
+        node_map = cognitive_calculator.get_node_map()
+        self.if_type = node_map.get("if")
+        self.else_type = node_map.get("else")
+        self.switch_type = node_map.get("switch")
+        self.nesting_types = frozenset(
+            node_map.get(key) for key in self.NESTING_KEYS
+        ) - {None, self.if_type, self.switch_type}
+
+    def calculate(self, parser: AstParser) -> tuple[dict[str, any], dict[str, int]]:
+        """
+        Cyclomatic complexity in the format of
+        GenericCyclomaticComplexityAnalyzer.calculate and cognitive complexity
+        in the format of calculate_for_all_functions
+        """
+        cyclomatic: dict[str, any] = {"classes": [], "functions": []}
+        cognitive: dict[str, int] = {}
+        if parser.tree is None:
+            return cyclomatic, cognitive
+
+        class_methods = [
+            (class_node, parser.get_class_methods(class_node))
+            for class_node in parser.get_class_nodes()
+        ]
+        function_nodes = parser.get_function_nodes()
+
+        boundaries = {node.id for node in function_nodes}
+        for _, methods in class_methods:
+            boundaries.update(method.id for method in methods)
+        complexities = self.walk(parser.tree.root_node, boundaries)
+
+        create_object = self.cyclomatic_analyzer._create_object
+        visited_nodes = set()
+        for class_node, methods in class_methods:
+            class_name = parser.extract_class_name(class_node)
+            class_obj = create_object(
+                type="class",
+                name=class_name,
+                class_name=None,
+                cc=0,
+                line_start=class_node.start_point[0],
+                line_end=class_node.end_point[0] + 1,
+            )
+            for method in methods:
+                visited_nodes.add(method.id)
+                class_obj["methods"].append(
+                    create_object(
+                        type="function",
+                        name=parser.extract_function_name(method),
+                        class_name=class_name,
+                        cc=complexities[method.id][0],
+                        line_start=method.start_point[0],
+                        line_end=method.end_point[0] + 1,
+                    )
+                )
+            cyclomatic["classes"].append(class_obj)
+
+        for function_node in function_nodes:
+            function_name = parser.extract_function_name(function_node)
+            cc, cognitive_complexity = complexities[function_node.id]
+            cognitive[function_name or "<anonymous>"] = cognitive_complexity
+            if function_node.id in visited_nodes:
+                continue
+            cyclomatic["functions"].append(
+                create_object(
+                    type="function",
+                    name=function_name,
+                    class_name=None,
+                    cc=cc,
+                    line_start=function_node.start_point[0],
+                    line_end=function_node.end_point[0] + 1,
+                )
+            )
+
+        return cyclomatic, cognitive
+
+    def walk(self, root: Node, boundaries: set[int]) -> dict[int, tuple[int, int]]:
+        """
+        node id => (cyclomatic, cognitive complexity) of the boundary nodes
+        below root, in one post-order traversal with an explicit stack
+        """
+        results: dict[int, tuple[int, int]] = {}
+        # per open boundary: decisions, cognitive, nesting penalties,
+        # nesting and skipped in the enclosing boundary
+        open_boundaries: list[list] = []
+        # per open node: context of its children, children with another
+        # context and whether the node is a boundary
+        frames: list[tuple[Context, dict[int, Context] | None, bool]] = []
+
+        decision_types = self.decision_types
+        special_types = self.special_types
+        if_type = self.if_type
+        else_type = self.else_type
+        switch_type = self.switch_type
+        nesting_types = self.nesting_types
+        eval_special_rule = self.cyclomatic_analyzer.eval_special_rule
+        top_context: Context = (0, False, False, None)
+
+        cursor = root.walk()
+        while True:
+            node = cursor.node
+            node_type = node.type
+            if frames:
+                children_context, exceptions, _ = frames[-1]
+                context = children_context
+                if exceptions is not None:
+                    context = exceptions.get(node.id, children_context)
+            else:
+                context = top_context
+
+            is_boundary = node.id in boundaries
+            if is_boundary:
+                # counted relative to the function itself from here on
+                open_boundaries.append([0, 0, 0, context[0], context[2]])
+                context = top_context
+            nesting, in_chain, skipped, inner_if = context
+
+            if open_boundaries:
+                counts = open_boundaries[-1]
+                if node_type in decision_types:
+                    if node_type in special_types:
+                        counts[0] += eval_special_rule(node)
+                    else:
+                        counts[0] += 1
+
+            exceptions = None
+            if inner_if is not None or node_type == if_type:
+                if inner_if is not None:
+                    # else of an if, only the if of an else-if is looked at
+                    children_context = (nesting, False, True, None)
+                    exceptions = {inner_if.id: (nesting, True, skipped, None)}
+                else:
+                    if open_boundaries and not skipped:
+                        counts[1] += 1 if in_chain else 1 + nesting
+                        counts[2] += 0 if in_chain else 1
+                    children_context = (nesting + 1, False, skipped, None)
+                    exceptions = {}
+                    for child in node.children:
+                        if child.type == else_type:
+                            else_if = next(
+                                (c for c in child.children if c.type == if_type),
+                                None,
+                            )
+                            exceptions[child.id] = (nesting, False, skipped, else_if)
+                            if else_if is None:
+                                # nothing of this else is looked at
+                                exceptions[child.id] = (nesting, False, True, None)
+            elif node_type == switch_type or node_type in nesting_types:
+                if open_boundaries and not skipped:
+                    counts[1] += 1 + nesting
+                    counts[2] += 1
+                children_context = (nesting + 1, False, skipped, None)
+            elif in_chain:
+                children_context = (nesting, False, skipped, None)
+            else:
+                children_context = context
+
+            frames.append((children_context, exceptions, is_boundary))
+            if cursor.goto_first_child():
+                continue
+
+            while True:
+                if frames.pop()[2]:
+                    self._close_boundary(cursor.node, open_boundaries, results)
+                if cursor.goto_next_sibling():
+                    break
+                if not cursor.goto_parent():
+                    return results
+
+    @staticmethod
+    def _close_boundary(
+        node: Node, open_boundaries: list[list], results: dict[int, tuple[int, int]]
+    ) -> None:
+        decisions, cognitive, penalties, nesting, skipped = open_boundaries.pop()
+        results[node.id] = (1 + decisions, cognitive)
+        if not open_boundaries:
+            return
+
+        counts = open_boundaries[-1]
+        counts[0] += decisions
+        if not skipped:
+            # every penalty grows by the nesting of the function in the parent
+            counts[1] += cognitive + nesting * penalties
+            counts[2] += penalties
@@ -80,17 +80,14 @@ class GenericCyclomaticComplexityAnalyzer(ABC):
         function_name: str,
         class_name: str | None = None,
     ) -> dict[str, int]:
-        decision_types = self.get_decision_types()
-
         count = 1  # Base complexity
-        for node in parser.walk_tree(function_node):
-            if node.type in decision_types:
-                if self.has_special_rule(node.type):
-                    # print(node.type)
-                    count += self.eval_special_rule(node)
-                else:
-                    # print(node.type)
-                    count += 1
+        # all decision nodes of the function in a single query of the parser
+        decision_types = self.get_decision_types()
+        for node in parser.find_nodes_by_types(decision_types, function_node):
+            if self.has_special_rule(node.type):
+                count += self.eval_special_rule(node)
+            else:
+                count += 1
 
         return self._create_object(
             type="function",
@@ -1,36 +1,128 @@
 import math
 import re
 from abc import ABC, abstractmethod
-from collections import Counter
 
 
 # TODO: radon only looks at unary, binary and boolean operators,
 #  assign and function head
 class GenericHalSteadAnalyzer(ABC):
+    # words and single non word characters, tokens never span a line
+    TOKEN_PATTERN = re.compile(r"(\w+)|([^\s\w])")
+
+    def __init__(self):
+        self.operator_set: frozenset[str] | None = None
+
     @abstractmethod
     def get_operators(self) -> list[str]:
         pass
 
+    def get_operator_set(self) -> frozenset[str]:
+        if self.operator_set is None:
+            self.operator_set = frozenset(self.get_operators())
+        return self.operator_set
+
     def calculate_halstead_metrics(self, code: str):
-        # Tokenize the code
-        tokens = re.findall(r"\b\w+\b|[^\s\w]", code)
+        return self.calculate_for_line_ranges(code, [(0, code.count("\n") + 1)])[0]
+
+    def calculate_for_line_ranges(
+        self, code: str, line_ranges: list[tuple[int, int]]
+    ) -> list[dict]:
+        """
+        Metrics of the lines code.split("\\n")[start:end] of every range.
+        The code is tokenized once, counts of lines that are part of several
+        ranges, like nested functions, are attributed to each of them.
+        """
+        lines = code.split("\n")
+        line_ranges = [
+            (min(max(start, 0), len(lines)), min(max(end, start, 0), len(lines)))
+            for start, end in line_ranges
+        ]
+        last_line = max((end for _, end in line_ranges), default=0)
+
+        operators = self.get_operator_set()
+        operators_by_line: list[list[str]] = []
+        operands_by_line: list[list[str]] = []
+        for line in lines[:last_line]:
+            line_operators = []
+            line_operands = []
+            for word, character in self.TOKEN_PATTERN.findall(line):
+                token = word or character
+                if token in operators:
+                    line_operators.append(token)
+                elif word:
+                    line_operands.append(token)
+            operators_by_line.append(line_operators)
+            operands_by_line.append(line_operands)
+
+        n1 = self._count_distinct(operators_by_line, line_ranges)
+        n2 = self._count_distinct(operands_by_line, line_ranges)
+        N1 = self._count_total(operators_by_line, line_ranges)
+        N2 = self._count_total(operands_by_line, line_ranges)
+
+        return [self._create_metrics(*counts) for counts in zip(n1, n2, N1, N2)]
+
+    @staticmethod
+    def _count_total(
+        tokens_by_line: list[list[str]], line_ranges: list[tuple[int, int]]
+    ) -> list[int]:
+        # tokens before each line
+        before = [0]
+        for tokens in tokens_by_line:
+            before.append(before[-1] + len(tokens))
+        return [before[end] - before[start] for start, end in line_ranges]
 
-        # Count operators and operands
-        operator_counts = Counter()
-        operand_counts = Counter()
+    @staticmethod
+    def _count_distinct(
+        tokens_by_line: list[list[str]], line_ranges: list[tuple[int, int]]
+    ) -> list[int]:
+        """
+        Distinct tokens per range. A range nested in another one hands its
+        tokens up when it is done, so every line is only looked at once and
+        the enclosing range merges the distinct tokens of the nested one.
+        """
+        line_sets = [set(tokens) for tokens in tokens_by_line]
+        # ranges in pre-order, outer ranges before the ranges nested in them
+        order = sorted(
+            range(len(line_ranges)),
+            key=lambda i: (line_ranges[i][0], -line_ranges[i][1]),
+        )
+        nested: dict[int, list[int]] = {i: [] for i in order}
+        # open ranges, each one nested in the one below
+        stack: list[int] = []
+        for i in order:
+            start, end = line_ranges[i]
+            while stack and line_ranges[stack[-1]][1] <= start:
+                stack.pop()
+            if stack and end > line_ranges[stack[-1]][1]:
+                # overlaps the open range without being nested, e.g. one
+                # function ends on the line the next one starts
+                nested[i] = None
+                continue
+            if stack:
+                nested[stack[-1]].append(i)
+            stack.append(i)
 
-        for token in tokens:
-            if token in self.get_operators():
-                operator_counts[token] += 1
-            elif re.match(r"\b\w+\b", token):
-                operand_counts[token] += 1
+        counts = [0] * len(line_ranges)
+        tokens_by_range: dict[int, set[str]] = {}
+        # nested ranges are done before the ranges they are nested in
+        for i in reversed(order):
+            start, end = line_ranges[i]
+            tokens = set()
+            line = start
+            for child in nested[i] or []:
+                child_start, child_end = line_ranges[child]
+                tokens.update(*line_sets[line:child_start])
+                tokens.update(tokens_by_range.pop(child))
+                line = child_end
+            tokens.update(*line_sets[line:end])
+            if nested[i] is not None:
+                tokens_by_range[i] = tokens
+            counts[i] = len(tokens)
 
-        # Halstead metrics
-        n1 = len(operator_counts)  # distinct operators
-        n2 = len(operand_counts)  # distinct operands
-        N1 = sum(operator_counts.values())  # total operators
-        N2 = sum(operand_counts.values())  # total operands
+        return counts
 
+    @staticmethod
+    def _create_metrics(n1: int, n2: int, N1: int, N2: int) -> dict:
         vocabulary = n1 + n2
         length = N1 + N2
         volume = length * math.log2(vocabulary) if vocabulary > 0 else 0
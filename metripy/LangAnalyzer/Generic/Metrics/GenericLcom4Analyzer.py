@@ -38,26 +38,57 @@ class GenericLcom4Analyzer(ABC):
             if method in method_attributes:
                 del method_attributes[method]
 
-        # Build graph of connected methods
+        return self._count_components(method_attributes)
+
+    @staticmethod
+    def _count_components(method_attributes: dict[str, set[str]]) -> int:
+        """
+        Methods are connected if they share an attribute, or if one method
+        calls the other, in the direction of the call. Components are
+        collected from the last method on, a method that was reached before
+        is not started from again.
+        """
         methods = list(method_attributes.keys())
-        connected_components = []
-        visited = set()
-
-        def dfs(method, component):
-            visited.add(method)
-            component.add(method)
-            for other_method in methods:
-                sharing_attributes = (
-                    method_attributes[method] & method_attributes[other_method]
-                )
-                using_method = other_method in method_attributes[method]
-                if other_method not in visited and (sharing_attributes or using_method):
-                    dfs(other_method, component)
+        positions = {method: i for i, method in enumerate(methods)}
+
+        # union-find over the methods, sharing an attribute is symmetric
+        parents = list(range(len(methods)))
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        # attribute => first method using it, inverted index of the attributes
+        users: dict[str, int] = {}
+        for i, method in enumerate(methods):
+            for attribute in method_attributes[method]:
+                user = users.setdefault(attribute, i)
+                if user != i:
+                    parents[find(i)] = find(user)
+
+        # calls between groups of methods sharing attributes
+        calls: dict[int, set[int]] = defaultdict(set)
+        for i, method in enumerate(methods):
+            for attribute in method_attributes[method]:
+                called = positions.get(attribute)
+                if called is not None:
+                    calls[find(i)].add(find(called))
 
+        components = 0
+        visited: set[int] = set()
         for method in reversed(methods):
-            if method not in visited:
-                component = set()
-                dfs(method, component)
-                connected_components.append(component)
+            group = find(positions[method])
+            if group in visited:
+                continue
+            components += 1
+            visited.add(group)
+            stack = [group]
+            while stack:
+                for called in calls.get(stack.pop(), ()):
+                    if called not in visited:
+                        visited.add(called)
+                        stack.append(called)
 
-        return len(connected_components)
+        return components
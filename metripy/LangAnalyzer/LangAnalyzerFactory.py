@@ -0,0 +1,29 @@
+from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.LangAnalyzer.AbstractLangAnalyzer import AbstractLangAnalyzer
+from metripy.LangAnalyzer.Php.PhpAnalyzer import PhpAnalyzer
+from metripy.LangAnalyzer.Python.PythonAnalyzer import PythonAnalyzer
+from metripy.LangAnalyzer.Typescript.TypescriptAnalyzer import TypescriptAnalyzer
+
+
+class LangAnalyzerFactory:
+    _ANALYZERS = {
+        "Python": PythonAnalyzer,
+        "PHP": PhpAnalyzer,
+        "Typescript": TypescriptAnalyzer,
+    }
+
+    @staticmethod
+    def get_lang_analyzer(
+        language: str, project_config: ProjectConfig
+    ) -> AbstractLangAnalyzer:
+        try:
+            return LangAnalyzerFactory._ANALYZERS[language](project_config)
+        except KeyError:
+            raise ValueError(f"No lang analyzer found for language: {language}")
+
+    @staticmethod
+    def get_lang_analyzers(project_config: ProjectConfig) -> list[AbstractLangAnalyzer]:
+        return [
+            LangAnalyzerFactory.get_lang_analyzer(language, project_config)
+            for language in LangAnalyzerFactory._ANALYZERS
+        ]
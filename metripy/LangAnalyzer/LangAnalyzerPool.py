@@ -0,0 +1,78 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.Component.Cache.AnalysisCache import AnalysisCache
+from metripy.Component.Output.ProgressBar import ProgressBar
+from metripy.LangAnalyzer.AbstractLangAnalyzer import AbstractLangAnalyzer
+from metripy.LangAnalyzer.LangAnalyzerFactory import LangAnalyzerFactory
+from metripy.Tree.ModuleNode import ModuleNode
+
+# runners of the current worker process, lang name => runner
+_worker_runners: dict[str, AbstractLangAnalyzer] = {}
+
+
+def _init_worker(project_config: ProjectConfig, cache: AnalysisCache | None) -> None:
+    """builds the tree-sitter parsers and analyzers once per worker process"""
+    global _worker_runners
+    _worker_runners = {
+        runner.get_lang_name(): runner
+        for runner in LangAnalyzerFactory.get_lang_analyzers(project_config)
+    }
+    for runner in _worker_runners.values():
+        runner.set_cache(cache)
+        runner.before_run()
+
+
+def _analyze_file(task: tuple[str, str]) -> ModuleNode:
+    lang_name, filename = task
+    runner = _worker_runners[lang_name]
+    module_node = runner.analyze_file(filename)
+    # the parent process owns the result, do not keep it around in the worker
+    del runner.modules[module_node.full_name]
+
+    return module_node
+
+
+class LangAnalyzerPool:
+    """Fans the files of all runners out to a pool of worker processes"""
+
+    MAX_CHUNK_SIZE = 32
+
+    def __init__(
+        self,
+        project_config: ProjectConfig,
+        workers: int,
+        cache: AnalysisCache | None = None,
+    ):
+        self.project_config = project_config
+        self.workers = workers
+        self.cache = cache
+
+    def run(
+        self, runners: list[AbstractLangAnalyzer], progress_bar: ProgressBar
+    ) -> None:
+        indexed_runners = {runner.get_lang_name(): runner for runner in runners}
+        tasks = [
+            (runner.get_lang_name(), file)
+            for runner in runners
+            for file in runner.files
+        ]
+        if not tasks:
+            return
+
+        # big enough chunks to keep ipc overhead low, small enough for the progress bar
+        chunk_size = max(1, min(self.MAX_CHUNK_SIZE, len(tasks) // (self.workers * 4)))
+
+        # spawn instead of fork, tree-sitter parsers are not shared across processes
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.project_config, self.cache),
+        ) as executor:
+            # map keeps the order of the tasks, so the result equals a serial run
+            results = executor.map(_analyze_file, tasks, chunksize=chunk_size)
+            for (lang_name, _), module_node in zip(tasks, results):
+                indexed_runners[lang_name].add_module(module_node)
+                progress_bar.advance()
@@ -14,6 +14,17 @@ class Nodelike:
 
 
 class PhpAstParser(AstParser):
+    QUERIES = {
+        "imports": "(namespace_use_declaration) @import",
+        "functions": """
+            (function_definition) @function
+            (method_declaration) @method
+        """,
+        "methods": "(method_declaration) @method",
+        "classes": "(class_declaration) @class",
+        "identifiers": "(name) @name",
+    }
+
     def __init__(self):
         super().__init__("php")
 
@@ -41,15 +52,14 @@ class PhpAstParser(AstParser):
         return f"{namespace}\\{class_name}"
 
     def get_import_nodes(self) -> List[Node]:
-        return self.find_nodes_by_type("namespace_use_declaration")
+        return self.capture("imports").get("import", [])
 
     def get_function_nodes(self) -> List[Node]:
-        return self.find_nodes_by_type("function_definition") + self.find_nodes_by_type(
-            "method_declaration"
-        )
+        captures = self.capture("functions")
+        return captures.get("function", []) + captures.get("method", [])
 
     def get_class_nodes(self) -> List[Node]:
-        return self.find_nodes_by_type("class_declaration")
+        return self.capture("classes").get("class", [])
 
     def get_interface_nodes(self) -> List[Node]:
         return self.find_nodes_by_type("interface_declaration")
@@ -74,7 +84,8 @@ class PhpAstParser(AstParser):
     # TODO: fix imports being used in docblocks, not yet recognized as usage
     def get_identifier_nodes(self, context: str = "usage") -> List[Node]:
         if context == "usage":
-            return self.find_nodes_by_type("name") + self.find_identifiers_in_comments()
+            names = self.capture("identifiers").get("name", [])
+            return names + self.find_identifiers_in_comments()
         elif context == "definition":
             return self.find_nodes_by_type("variable_declarator")
         return []
@@ -168,11 +179,7 @@ class PhpAstParser(AstParser):
         return properties
 
     def get_class_methods(self, node: Node) -> List[Node]:
-        methods: List[Node] = []
-        for child in self.walk_tree(node):
-            if child.type == "method_declaration":
-                methods.append(child)
-        return methods
+        return self.capture("methods", node).get("method", [])
 
     def get_class_constants(self, node: Node) -> List[str]:
         constants = []
@@ -326,18 +333,20 @@ class PhpAstParser(AstParser):
 
     def get_function_attributes(self, function_node: Node) -> List[str]:
         """Get names of variables used in the function"""
-        attributes: List[str] = []
-        for child in self.walk_tree(function_node):
-            if child.type == "member_access_expression":
-                attributes.append(self.get_node_text(child))
-        return attributes
+        return [
+            self.get_node_text(child)
+            for child in self.find_nodes_by_type(
+                "member_access_expression", function_node
+            )
+        ]
 
     def _get_member_calls(self, function_node: Node) -> List[str]:
-        calls: List[str] = []
-        for child in self.walk_tree(function_node):
-            if child.type == "member_call_expression":
-                calls.append(self.get_node_text(child))
-        return calls
+        return [
+            self.get_node_text(child)
+            for child in self.find_nodes_by_type(
+                "member_call_expression", function_node
+            )
+        ]
 
     def get_function_self_calls(self, function_node: Node) -> List[str]:
         """Get names class methods called in the function"""
@@ -10,22 +10,31 @@ from metripy.LangAnalyzer.Generic.Ast.AstParser import AstParser
 class PythonAstParser(AstParser):
     """Python-specific implementation of AST parser"""
 
+    QUERIES = {
+        "imports": """
+            (import_statement) @import
+            (import_from_statement) @import_from
+        """,
+        "functions": "(function_definition) @function",
+        "classes": "(class_definition) @class",
+        "identifiers": "(identifier) @identifier",
+    }
+
     def __init__(self):
         super().__init__("python")
 
     def get_import_nodes(self) -> List[Node]:
         """Get all import statements"""
-        imports = self.find_nodes_by_type("import_statement")
-        imports.extend(self.find_nodes_by_type("import_from_statement"))
-        return imports
+        captures = self.capture("imports")
+        return captures.get("import", []) + captures.get("import_from", [])
 
     def get_function_nodes(self) -> List[Node]:
         """Get all function definitions"""
-        return self.find_nodes_by_type("function_definition")
+        return self.capture("functions").get("function", [])
 
     def get_class_nodes(self) -> List[Node]:
         """Get all class definitions"""
-        return self.find_nodes_by_type("class_definition")
+        return self.capture("classes").get("class", [])
 
     def get_variable_assignment_nodes(self) -> List[Node]:
         """Get all assignment statements"""
@@ -33,7 +42,7 @@ class PythonAstParser(AstParser):
 
     def get_identifier_nodes(self, context: str = "usage") -> List[Node]:
         """Get identifier nodes based on context"""
-        return self.find_nodes_by_type("identifier")
+        return self.capture("identifiers").get("identifier", [])
 
     def extract_function_name(self, node: Node) -> Optional[str]:
         """Extract function name from function_definition node"""
@@ -126,11 +135,7 @@ class PythonAstParser(AstParser):
         return None
 
     def get_class_methods(self, node: Node) -> List[Node]:
-        methods: List[Node] = []
-        for child in self.walk_tree(node):
-            if child.type == "function_definition":
-                methods.append(child)
-        return methods
+        return self.capture("functions", node).get("function", [])
 
     def get_function_parameters(self, function_node: Node) -> List[str]:
         """Extract parameter names from function definition"""
@@ -151,16 +156,16 @@ class PythonAstParser(AstParser):
     def get_function_attributes(self, function_node: Node) -> List[str]:
         """Get names of variables used in the function"""
         attributes = []
-        for child in self.walk_tree(function_node):
-            if child.type == "attribute" and not child.parent.type == "call":
+        for child in self.find_nodes_by_type("attribute", function_node):
+            if not child.parent.type == "call":
                 attributes.append(self.get_node_text(child))
         return attributes
 
     def _get_function_calls(self, function_node: Node) -> List[str]:
         """Get names of function variables"""
         attributes = []
-        for child in self.walk_tree(function_node):
-            if child.type == "attribute" and child.parent.type == "call":
+        for child in self.find_nodes_by_type("attribute", function_node):
+            if child.parent.type == "call":
                 attributes.append(self.get_node_text(child))
         return attributes
 
@@ -8,6 +8,7 @@ Now uses the generic GenericCodeSmellDetector framework.
 from typing import List
 
 from metripy.Application.Config.CodeSmellConfig import CodeSmellConfig
+from metripy.LangAnalyzer.Generic.Ast.AstParser import AstParser
 from metripy.LangAnalyzer.Generic.CodeSmell.CodeSmell import CodeSmell
 from metripy.LangAnalyzer.Generic.CodeSmell.GenericCodeSmellDetector import (
     GenericCodeSmellDetector,
@@ -25,7 +26,15 @@ class PythonCodeSmellDetector:
     def __init__(self, config: CodeSmellConfig):
         self.config = config
 
-    def detect_all(self, filename: str, code: str) -> List[CodeSmell]:
-        """Run all configured code smell detection checks"""
-        detector = GenericCodeSmellDetector.for_python(self.config, filename, code)
+    def detect_all(
+        self, filename: str, code: str, parser: AstParser | None = None
+    ) -> List[CodeSmell]:
+        """
+        Run all configured code smell detection checks.
+
+        Pass the parser that already parsed the code to avoid parsing it again.
+        """
+        detector = GenericCodeSmellDetector.for_python(
+            self.config, filename, code, parser
+        )
         return detector.detect_all()
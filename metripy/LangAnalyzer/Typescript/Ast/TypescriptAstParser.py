@@ -10,30 +10,48 @@ from metripy.LangAnalyzer.Generic.Ast.AstParser import AstParser
 class TypescriptAstParser(AstParser):
     """TypeScript-specific implementation of AST parser"""
 
+    QUERIES = {
+        "imports": "(import_statement) @import",
+        # arrow functions only count if they are assigned to an identifier,
+        # a sibling identifier before or after them, else it is just a lambda
+        "functions": """
+            (function_declaration) @function
+            (method_definition) @method
+            (_ (identifier) (arrow_function) @arrow)
+            (_ (arrow_function) @arrow (identifier))
+        """,
+        "methods": """
+            (function_declaration) @function
+            (method_definition) @method
+            (arrow_function) @arrow
+        """,
+        "classes": "(class_declaration) @class",
+        "identifiers": """
+            (identifier) @identifier
+            (type_identifier) @type_identifier
+        """,
+    }
+
     def __init__(self):
         super().__init__("typescript")
 
     def get_import_nodes(self) -> List[Node]:
         """Get all import statements"""
-        return self.find_nodes_by_type("import_statement")
+        return self.capture("imports").get("import", [])
 
     def get_function_nodes(self) -> List[Node]:
         """Get all function and method definitions"""
-        functions = self.find_nodes_by_type("function_declaration")
-        functions.extend(self.find_nodes_by_type("method_definition"))
-
-        arrow_function_nodes = self.find_nodes_by_type("arrow_function")
-        for arrow_function_node in arrow_function_nodes:
-            for child in reversed(arrow_function_node.parent.children):
-                # only if parent has another child called identifier are we assigning this function, else its just a lambda expression
-                if child.type == "identifier":
-                    functions.append(arrow_function_node)
-                    break
-        return functions
+        captures = self.capture("functions")
+        # both arrow patterns can match the same node, in pre-order once each
+        arrows = sorted(
+            dict.fromkeys(captures.get("arrow", [])),
+            key=lambda node: (node.start_byte, -node.end_byte),
+        )
+        return captures.get("function", []) + captures.get("method", []) + arrows
 
     def get_class_nodes(self) -> List[Node]:
         """Get all class definitions"""
-        return self.find_nodes_by_type("class_declaration")
+        return self.capture("classes").get("class", [])
 
     def get_variable_assignment_nodes(self) -> List[Node]:
         """Get all variable declarations"""
@@ -43,9 +61,8 @@ class TypescriptAstParser(AstParser):
 
     def get_identifier_nodes(self, context: str = "usage") -> List[Node]:
         """Get identifier nodes"""
-        nodes = self.find_nodes_by_type("identifier")
-        nodes.extend(self.find_nodes_by_type("type_identifier"))
-        return nodes
+        captures = self.capture("identifiers")
+        return captures.get("identifier", []) + captures.get("type_identifier", [])
 
     def extract_function_name(self, node: Node) -> Optional[str]:
         """Extract function name"""
@@ -121,30 +138,26 @@ class TypescriptAstParser(AstParser):
 
     def get_function_attributes(self, function_node: Node) -> List[str]:
         self_calls = []
-        for child in self.walk_tree(function_node):
-            if (
-                child.type == "member_expression"
-                and not child.parent.type == "call_expression"
-            ):
+        for child in self.find_nodes_by_type("member_expression", function_node):
+            if not child.parent.type == "call_expression":
                 self_calls.append(self.get_node_text(child))
         return self_calls
 
     def get_function_self_calls(self, function_node: Node) -> List[str]:
         self_calls = []
-        for child in self.walk_tree(function_node):
-            if (
-                child.type == "member_expression"
-                and child.parent.type == "call_expression"
-            ):
+        for child in self.find_nodes_by_type("member_expression", function_node):
+            if child.parent.type == "call_expression":
                 # cut of "this." prefix
                 self_calls.append(self.get_node_text(child)[5:])
         return self_calls
 
     def get_class_methods(self, class_node: Node) -> List[Node]:
-        functions = self.find_nodes_by_type("function_declaration", class_node)
-        functions.extend(self.find_nodes_by_type("method_definition", class_node))
-        functions.extend(self.find_nodes_by_type("arrow_function", class_node))
-        return functions
+        captures = self.capture("methods", class_node)
+        return (
+            captures.get("function", [])
+            + captures.get("method", [])
+            + captures.get("arrow", [])
+        )
 
     def extract_import_qualified_name(self, node: Node) -> Optional[str]:
         for child in self.walk_tree(node):
@@ -1,6 +1,7 @@
 from typing import List
 
 from metripy.Application.Config.CodeSmellConfig import CodeSmellConfig
+from metripy.LangAnalyzer.Generic.Ast.AstParser import AstParser
 from metripy.LangAnalyzer.Generic.CodeSmell.CodeSmell import CodeSmell
 from metripy.LangAnalyzer.Generic.CodeSmell.GenericCodeSmellDetector import (
     GenericCodeSmellDetector,
@@ -11,6 +12,10 @@ class TypescriptCodeSmellDetector:
     def __init__(self, config: CodeSmellConfig):
         self.config = config
 
-    def detect_all(self, filename: str, code: str) -> List[CodeSmell]:
-        detector = GenericCodeSmellDetector.for_typescript(self.config, filename, code)
+    def detect_all(
+        self, filename: str, code: str, parser: AstParser | None = None
+    ) -> List[CodeSmell]:
+        detector = GenericCodeSmellDetector.for_typescript(
+            self.config, filename, code, parser
+        )
         return detector.detect_all()
@@ -1,3 +1,5 @@
+from typing import Self
+
 from metripy.Metric.Code.SegmentedMetrics import SegmentedMetrics
 from metripy.Metric.Trend.AggregatedTrendMetric import AggregatedTrendMetric
 
@@ -57,6 +59,36 @@ class AggregatedMetrics:
             ),
         }
 
+    def to_history_dict(self) -> dict:
+        """unrounded values and segmentation, to compare a later run with"""
+        return {
+            "loc": self.loc,
+            "avgCcPerFunction": self.avgCcPerFunction,
+            "maintainabilityIndex": self.maintainabilityIndex,
+            "avgLocPerFunction": self.avgLocPerFunction,
+            "avg_cog_complexity_per_function": self.avg_cog_complexity_per_function,
+            "avg_lcom4_per_class": self.avg_lcom4_per_class,
+            "num_files": self.num_files,
+            "segmentation": self.to_dict_segmentation(),
+        }
+
+    @staticmethod
+    def from_history_dict(data: dict) -> Self:
+        metrics = AggregatedMetrics(
+            loc=data["loc"],
+            avgCcPerFunction=data["avgCcPerFunction"],
+            maintainabilityIndex=data["maintainabilityIndex"],
+            avgLocPerFunction=data["avgLocPerFunction"],
+            avg_cog_complexity_per_function=data["avg_cog_complexity_per_function"],
+            avg_lcom4_per_class=data["avg_lcom4_per_class"],
+            num_files=data["num_files"],
+        )
+        metrics.segmentation_data = {
+            name: SegmentedMetrics.from_dict(values)
+            for name, values in data["segmentation"].items()
+        }
+        return metrics
+
     def to_dict_segmentation(self) -> dict:
         return {k: v.to_dict() for k, v in self.segmentation_data.items()}
 
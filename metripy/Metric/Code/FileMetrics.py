@@ -8,6 +8,28 @@ from metripy.Tree.FunctionNode import FunctionNode
 
 
 class FileMetrics:
+    __slots__ = (
+        "full_name",
+        "loc",
+        "totalCc",
+        "avgCcPerFunction",
+        "maintainabilityIndex",
+        "avgLocPerFunction",
+        "class_nodes",
+        "function_nodes",
+        "trend",
+        "import_name",
+        "imports",
+        "imported_by",
+        "afferent_coupling",
+        "efferent_coupling",
+        "instability",
+        "code_smells",
+        "total_cog_complexity",
+        "avg_cog_complexity_per_function",
+        "avg_lcom4_per_class",
+    )
+
     def __init__(
         self,
         full_name: str,
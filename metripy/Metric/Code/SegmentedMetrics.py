@@ -45,6 +45,10 @@ class SegmentedMetrics:
             ),
         }
 
+    @staticmethod
+    def from_dict(data: dict) -> Self:
+        return SegmentedMetrics()._set_values(data)
+
     def _set_values(self, values: dict[str, int]) -> Self:
         self.good = values["good"]
         self.ok = values["ok"]
@@ -52,6 +56,15 @@ class SegmentedMetrics:
         self.critical = values["critical"]
         return self
 
+    def add_counts(self, counts: list[int]) -> Self:
+        """adds counts of good, ok, warning and critical values"""
+        good, ok, warning, critical = counts
+        self.good += int(good)
+        self.ok += int(ok)
+        self.warning += int(warning)
+        self.critical += int(critical)
+        return self
+
     def set_loc(self, values: list[int]) -> Self:
         d = {
             "good": self.good,
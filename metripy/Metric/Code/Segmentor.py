@@ -1,44 +1,55 @@
 class Segmentor:
+    # upper limits of good, ok and warning, anything above is critical
+    LOC_LIMITS = (200, 500, 1000)
+    COMPLEXITY_LIMITS = (5, 10, 20)
+    METHOD_SIZE_LIMITS = (15, 30, 50)
+    # lower limits of warning, ok and good, anything up to the first is critical
+    MAINTAINABILITY_LIMITS = (40, 60, 80)
+
     @staticmethod
     def get_loc_segment(loc: int) -> str:
-        if loc <= 200:
+        good, ok, warning = Segmentor.LOC_LIMITS
+        if loc <= good:
             return "good"
-        elif loc <= 500:
+        elif loc <= ok:
             return "ok"
-        elif loc <= 1000:
+        elif loc <= warning:
             return "warning"
         else:
             return "critical"
 
     @staticmethod
     def get_complexity_segment(complexity: float) -> str:
-        if complexity <= 5:
+        good, ok, warning = Segmentor.COMPLEXITY_LIMITS
+        if complexity <= good:
             return "good"
-        elif complexity <= 10:
+        elif complexity <= ok:
             return "ok"
-        elif complexity <= 20:
+        elif complexity <= warning:
             return "warning"
         else:
             return "critical"
 
     @staticmethod
     def get_maintainability_segment(maintainability: float) -> str:
-        if maintainability > 80:
+        warning, ok, good = Segmentor.MAINTAINABILITY_LIMITS
+        if maintainability > good:
             return "good"
-        elif maintainability > 60:
+        elif maintainability > ok:
             return "ok"
-        elif maintainability > 40:
+        elif maintainability > warning:
             return "warning"
         else:
             return "critical"
 
     @staticmethod
     def get_method_size_segment(method_size: float) -> str:
-        if method_size <= 15:
+        good, ok, warning = Segmentor.METHOD_SIZE_LIMITS
+        if method_size <= good:
             return "good"
-        elif method_size <= 30:
+        elif method_size <= ok:
             return "ok"
-        elif method_size <= 50:
+        elif method_size <= warning:
             return "warning"
         else:
             return "critical"
@@ -0,0 +1,123 @@
+import numpy as np
+
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Metric.Code.SegmentedMetrics import SegmentedMetrics
+from metripy.Metric.Code.Segmentor import Segmentor
+
+
+class MetricStore:
+    """
+    Metrics of all files, classes and functions of a project as one array per
+    metric. Built once after the analysis, the aggregation, the failure
+    evaluation and the reports share it instead of walking the nodes again.
+    """
+
+    FILE = "file"
+    CLASS = "class"
+    FUNCTION = "function"
+
+    SEGMENTS = ["good", "ok", "warning", "critical"]
+
+    FILE_COLUMNS = [
+        "loc",
+        "totalCc",
+        "avgCcPerFunction",
+        "maintainabilityIndex",
+        "avgLocPerFunction",
+        "total_cog_complexity",
+        "avg_cog_complexity_per_function",
+        "avg_lcom4_per_class",
+    ]
+    # loc of classes and functions is line_end - lineno
+    CLASS_COLUMNS = ["lineno", "line_end", "real_complexity", "lcom4"]
+    FUNCTION_COLUMNS = [
+        "lineno",
+        "line_end",
+        "complexity",
+        "maintainability_index",
+        "cognitive_complexity",
+    ]
+
+    def __init__(self, file_metrics: list[FileMetrics]):
+        class_nodes = [
+            class_node
+            for file_metric in file_metrics
+            for class_node in file_metric.class_nodes
+        ]
+        function_nodes = [
+            function_node
+            for file_metric in file_metrics
+            for function_node in file_metric.function_nodes
+        ]
+        self.items: dict[str, list] = {
+            self.FILE: file_metrics,
+            self.CLASS: class_nodes,
+            self.FUNCTION: function_nodes,
+        }
+        self.columns: dict[str, dict[str, np.ndarray]] = {
+            self.FILE: self._create_columns(file_metrics, self.FILE_COLUMNS),
+            self.CLASS: self._create_columns(class_nodes, self.CLASS_COLUMNS),
+            self.FUNCTION: self._create_columns(function_nodes, self.FUNCTION_COLUMNS),
+        }
+        for level in [self.CLASS, self.FUNCTION]:
+            columns = self.columns[level]
+            columns["loc"] = columns["line_end"] - columns["lineno"]
+
+    @staticmethod
+    def _create_columns(items: list, names: list[str]) -> dict[str, np.ndarray]:
+        # None, like the lcom4 of classes without methods, becomes nan
+        return {
+            name: np.fromiter(
+                (getattr(item, name) for item in items),
+                dtype=np.float64,
+                count=len(items),
+            )
+            for name in names
+        }
+
+    def count(self, level: str) -> int:
+        return len(self.items[level])
+
+    def total(self, level: str, name: str) -> int:
+        return int(self.columns[level][name].sum())
+
+    def average(self, level: str, name: str) -> float:
+        column = self.columns[level][name]
+        if len(column) == 0:
+            return 0.0
+        return float(column.mean())
+
+    def top(self, level: str, name: str, amount: int, reverse: bool = True) -> list:
+        """
+        amount items with the highest values, the lowest with reverse False.
+        Items with the same value keep their order, like sorted() does.
+        """
+        column = self.columns[level][name]
+        order = np.argsort(-column if reverse else column, kind="stable")
+        items = self.items[level]
+        return [items[index] for index in order[:amount]]
+
+    def count_segments(self, level: str, name: str, segment: str) -> list[int]:
+        """
+        number of good, ok, warning and critical values, segment is one of
+        loc, complexity, maintainability, method_size and lcom4
+        """
+        column = self.columns[level][name]
+        if segment == "lcom4":
+            indices = np.where(column == 1, 0, np.where(column == 0, 2, 3))
+        elif segment == "maintainability":
+            # above the highest limit is good
+            limits = Segmentor.MAINTAINABILITY_LIMITS
+            indices = len(limits) - np.searchsorted(limits, column, side="left")
+        else:
+            limits = {
+                "loc": Segmentor.LOC_LIMITS,
+                "complexity": Segmentor.COMPLEXITY_LIMITS,
+                "method_size": Segmentor.METHOD_SIZE_LIMITS,
+            }[segment]
+            indices = np.searchsorted(limits, column, side="left")
+
+        return np.bincount(indices, minlength=len(self.SEGMENTS)).tolist()
+
+    def segment(self, level: str, name: str, segment: str) -> SegmentedMetrics:
+        return SegmentedMetrics().add_counts(self.count_segments(level, name, segment))
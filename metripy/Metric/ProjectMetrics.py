@@ -3,8 +3,8 @@ from typing import Self
 from metripy.Dependency.Dependency import Dependency
 from metripy.Metric.Code.AggregatedMetrics import AggregatedMetrics
 from metripy.Metric.Code.FileMetrics import FileMetrics
-from metripy.Metric.Code.SegmentedMetrics import SegmentedMetrics
 from metripy.Metric.Git.GitMetrics import GitMetrics
+from metripy.Metric.MetricStore import MetricStore
 
 
 class ProjectMetrics:
@@ -13,106 +13,87 @@ class ProjectMetrics:
         file_metrics: list[FileMetrics],
         git_metrics: GitMetrics | None,
         dependencies: list[Dependency] | None,
+        duplicates: list[dict] | None = None,
     ):
         self.file_metrics = file_metrics
         self.git_metrics = git_metrics
         self.dependencies = dependencies
-        self.total_code_metrics = self._compile_total_metrics(self.file_metrics)
+        # duplicate code blocks, only searched when enabled in the project config
+        self.duplicates = duplicates
+        self.metric_store = MetricStore(self.file_metrics)
+        self.total_code_metrics = self._compile_total_metrics(self.metric_store)
         self.total_code_metrics_functions = self._compile_total_metrics_functions(
-            self.file_metrics
+            self.metric_store
         )
 
-    def _compile_total_metrics_functions(
-        self, file_metrics: list[FileMetrics]
-    ) -> AggregatedMetrics:
-        num_functions = 0
-        locs = []
-        ccs = []
-        mis = []
-        cog_complexities = []
-        lcom4s = []
-        for file_metric in file_metrics:
-            lcom4s.append(file_metric.avg_lcom4_per_class)
-            for function_node in file_metric.function_nodes:
-                num_functions += 1
-                locs.append(function_node.get_loc())
-                ccs.append(function_node.complexity)
-                mis.append(function_node.maintainability_index)
-                cog_complexities.append(function_node.cognitive_complexity)
-
+    def _compile_total_metrics_functions(self, store: MetricStore) -> AggregatedMetrics:
+        num_functions = store.count(MetricStore.FUNCTION)
         if num_functions == 0:
             return AggregatedMetrics()
 
+        function = MetricStore.FUNCTION
+        file = MetricStore.FILE
         return AggregatedMetrics(
-            loc=sum(locs),
-            avgCcPerFunction=self._avg(ccs),
-            maintainabilityIndex=self._avg(mis),
-            avgLocPerFunction=self._avg(locs),
-            avg_cog_complexity_per_function=self._avg(cog_complexities),
-            avg_lcom4_per_class=self._avg(lcom4s),
+            loc=store.total(function, "loc"),
+            avgCcPerFunction=store.average(function, "complexity"),
+            maintainabilityIndex=store.average(function, "maintainability_index"),
+            avgLocPerFunction=store.average(function, "loc"),
+            avg_cog_complexity_per_function=store.average(
+                function, "cognitive_complexity"
+            ),
+            avg_lcom4_per_class=store.average(file, "avg_lcom4_per_class"),
             num_files=num_functions,
-            segmented_loc=SegmentedMetrics().set_method_size(locs),
-            segmented_complexity=SegmentedMetrics().set_complexity(ccs),
-            segmented_maintainability=SegmentedMetrics().set_maintainability(mis),
-            segmented_method_size=SegmentedMetrics().set_method_size(locs),
-            segmented_cognitive_complexity=SegmentedMetrics().set_complexity(
-                cog_complexities
+            segmented_loc=store.segment(function, "loc", "method_size"),
+            segmented_complexity=store.segment(function, "complexity", "complexity"),
+            segmented_maintainability=store.segment(
+                function, "maintainability_index", "maintainability"
+            ),
+            segmented_method_size=store.segment(function, "loc", "method_size"),
+            segmented_cognitive_complexity=store.segment(
+                function, "cognitive_complexity", "complexity"
             ),
-            segmented_lcom4=SegmentedMetrics().set_lcom4(lcom4s),
+            segmented_lcom4=store.segment(file, "avg_lcom4_per_class", "lcom4"),
         )
 
-    def _compile_total_metrics(
-        self, file_metrics: list[FileMetrics]
-    ) -> AggregatedMetrics:
-        files = 0
-        locs = []
-        avgCcPerFunctions = []
-        maintainabilityIndices = []
-        avgLocPerFunctions = []
-        avg_cog_complexity_per_functions = []
-        avg_lcom4_per_classes = []
-        for file_metric in file_metrics:
-            files += 1
-            locs.append(file_metric.loc)
-            avgCcPerFunctions.append(file_metric.avgCcPerFunction)
-            maintainabilityIndices.append(file_metric.maintainabilityIndex)
-            avgLocPerFunctions.append(file_metric.avgLocPerFunction)
-            avg_cog_complexity_per_functions.append(
-                file_metric.avg_cog_complexity_per_function
-            )
-            avg_lcom4_per_classes.append(file_metric.avg_lcom4_per_class)
-
+    def _compile_total_metrics(self, store: MetricStore) -> AggregatedMetrics:
+        files = store.count(MetricStore.FILE)
         if files == 0:
             return AggregatedMetrics()
 
+        file = MetricStore.FILE
         return AggregatedMetrics(
-            loc=sum(locs),
-            avgCcPerFunction=self._avg(avgCcPerFunctions),
-            maintainabilityIndex=self._avg(maintainabilityIndices),
-            avgLocPerFunction=self._avg(avgLocPerFunctions),
-            avg_cog_complexity_per_function=self._avg(avg_cog_complexity_per_functions),
-            avg_lcom4_per_class=self._avg(avg_lcom4_per_classes),
+            loc=store.total(file, "loc"),
+            avgCcPerFunction=store.average(file, "avgCcPerFunction"),
+            maintainabilityIndex=store.average(file, "maintainabilityIndex"),
+            avgLocPerFunction=store.average(file, "avgLocPerFunction"),
+            avg_cog_complexity_per_function=store.average(
+                file, "avg_cog_complexity_per_function"
+            ),
+            avg_lcom4_per_class=store.average(file, "avg_lcom4_per_class"),
             num_files=files,
-            segmented_loc=SegmentedMetrics().set_loc(locs),
-            segmented_complexity=SegmentedMetrics().set_complexity(avgCcPerFunctions),
-            segmented_maintainability=SegmentedMetrics().set_maintainability(
-                maintainabilityIndices
+            segmented_loc=store.segment(file, "loc", "loc"),
+            segmented_complexity=store.segment(file, "avgCcPerFunction", "complexity"),
+            segmented_maintainability=store.segment(
+                file, "maintainabilityIndex", "maintainability"
             ),
-            segmented_method_size=SegmentedMetrics().set_method_size(
-                avgLocPerFunctions
+            segmented_method_size=store.segment(
+                file, "avgLocPerFunction", "method_size"
             ),
-            segmented_cognitive_complexity=SegmentedMetrics().set_complexity(
-                avg_cog_complexity_per_functions
+            segmented_cognitive_complexity=store.segment(
+                file, "avg_cog_complexity_per_function", "complexity"
             ),
-            segmented_lcom4=SegmentedMetrics().set_lcom4(avg_lcom4_per_classes),
+            segmented_lcom4=store.segment(file, "avg_lcom4_per_class", "lcom4"),
         )
 
-    def _avg(self, items: list[float | int]) -> float:
-        return sum(items) / len(items)
-
     def to_dict(self) -> dict:
-        data = {
+        return {
             "file_metrics": [m.to_dict() for m in self.file_metrics],
+            **self.to_dict_without_files(),
+        }
+
+    def to_dict_without_files(self) -> dict:
+        """everything of to_dict but the file metrics, same order"""
+        data = {
             "aggregated": self.total_code_metrics.to_dict(),
             "aggregated_segmented": self.total_code_metrics.to_dict_segmentation(),
         }
@@ -123,6 +104,8 @@ class ProjectMetrics:
             data["license_distribution"] = Dependency.get_lisence_distribution(
                 self.dependencies
             )
+        if self.duplicates is not None:
+            data["duplicates"] = self.duplicates
         return data
 
     @staticmethod
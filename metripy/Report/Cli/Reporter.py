@@ -17,7 +17,7 @@ class Reporter(ReporterInterface):
 
     def generate(self, metrics: ProjectMetrics):
         self.output.writeln(OverviewFormatter().format(metrics))
-        self.output.writeln(TopOffendersFormatter().format(metrics.file_metrics))
+        self.output.writeln(TopOffendersFormatter().format(metrics))
         self.output.writeln(CouplingMetricsFormatter().format(metrics.file_metrics))
         self.output.writeln(CodeSmellsFormatter().format(metrics.file_metrics))
         if metrics.git_metrics:
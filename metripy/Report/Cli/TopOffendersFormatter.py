@@ -1,21 +1,19 @@
-from metripy.Metric.Code.FileMetrics import FileMetrics
 from metripy.Metric.Code.Segmentor import Segmentor
+from metripy.Metric.MetricStore import MetricStore
+from metripy.Metric.ProjectMetrics import ProjectMetrics
 from metripy.Report.Cli.AbstractFormatter import AbstractFormatter
-from metripy.Tree.FunctionNode import FunctionNode
 
 
 class TopOffendersFormatter(AbstractFormatter):
-    def format(self, file_metrics: list[FileMetrics]):
-        all_functions: list[FunctionNode] = []
-        for fm in file_metrics:
-            all_functions.extend(fm.function_nodes)
+    def format(self, metrics: ProjectMetrics):
+        store = metrics.metric_store
 
         return f"""
 ========= Top Offenders =========
-{self._format_loc_offenders(file_metrics, all_functions)}
-{self._format_cc_offenders(file_metrics, all_functions)}
-{self._format_cog_complexity_offenders(file_metrics, all_functions)}
-{self._format_mi_offenders(file_metrics, all_functions)}
+{self._format_loc_offenders(store)}
+{self._format_cc_offenders(store)}
+{self._format_cog_complexity_offenders(store)}
+{self._format_mi_offenders(store)}
 """
 
     def _format_side_by_side_metrics(self, linfo: list[str], rinfo: list[str]) -> str:
@@ -26,19 +24,15 @@ class TopOffendersFormatter(AbstractFormatter):
             table += f"{l_data.ljust(linfo_width)} | {r_data}\n"
         return table
 
-    def _format_loc_offenders(
-        self, file_metrics: list[FileMetrics], all_functions: list[FunctionNode]
-    ) -> str:
-        files_ordered = sorted(file_metrics, key=lambda x: x.loc, reverse=True)[:5]
+    def _format_loc_offenders(self, store: MetricStore) -> str:
+        files_ordered = store.top(MetricStore.FILE, "loc", 5)
         linfo = ["File Lines of Code"]
         for f in files_ordered:
             segment = Segmentor.get_loc_segment(f.loc)
             color = self.COLORS[segment]
             linfo.append(f"\033[{color}m█\033[0m {f.full_name} ({f.loc})")
 
-        functions_ordered_by_loc = sorted(
-            all_functions, key=lambda x: x.get_loc(), reverse=True
-        )[:5]
+        functions_ordered_by_loc = store.top(MetricStore.FUNCTION, "loc", 5)
         rinfo = ["Function Size"]
         for f in functions_ordered_by_loc:
             segment = Segmentor.get_method_size_segment(f.get_loc())
@@ -46,19 +40,15 @@ class TopOffendersFormatter(AbstractFormatter):
             rinfo.append(f"\033[{color}m█\033[0m {f.full_name} ({f.get_loc()})")
         return self._format_side_by_side_metrics(linfo, rinfo)
 
-    def _format_cc_offenders(
-        self, file_metrics: list[FileMetrics], all_functions: list[FunctionNode]
-    ) -> str:
-        files_ordered = sorted(file_metrics, key=lambda x: x.totalCc, reverse=True)[:5]
+    def _format_cc_offenders(self, store: MetricStore) -> str:
+        files_ordered = store.top(MetricStore.FILE, "totalCc", 5)
         linfo = ["File Cyclomatic Complexity"]
         for f in files_ordered:
             segment = Segmentor.get_complexity_segment(f.totalCc)
             color = self.COLORS[segment]
             linfo.append(f"\033[{color}m█\033[0m {f.full_name} ({f.totalCc})")
 
-        functions_ordered_by_cc = sorted(
-            all_functions, key=lambda x: x.complexity, reverse=True
-        )[:5]
+        functions_ordered_by_cc = store.top(MetricStore.FUNCTION, "complexity", 5)
         rinfo = ["Function Complexity"]
         for f in functions_ordered_by_cc:
             segment = Segmentor.get_complexity_segment(f.complexity)
@@ -66,12 +56,8 @@ class TopOffendersFormatter(AbstractFormatter):
             rinfo.append(f"\033[{color}m█\033[0m {f.full_name} ({f.complexity})")
         return self._format_side_by_side_metrics(linfo, rinfo)
 
-    def _format_cog_complexity_offenders(
-        self, file_metrics: list[FileMetrics], all_functions: list[FunctionNode]
-    ) -> str:
-        files_ordered = sorted(
-            file_metrics, key=lambda x: x.total_cog_complexity, reverse=True
-        )[:5]
+    def _format_cog_complexity_offenders(self, store: MetricStore) -> str:
+        files_ordered = store.top(MetricStore.FILE, "total_cog_complexity", 5)
         linfo = ["File Cognitive Complexity"]
         for f in files_ordered:
             segment = Segmentor.get_complexity_segment(f.total_cog_complexity)
@@ -80,9 +66,9 @@ class TopOffendersFormatter(AbstractFormatter):
                 f"\033[{color}m█\033[0m {f.full_name} ({f.total_cog_complexity})"
             )
 
-        functions_ordered_by_cog_complexity = sorted(
-            all_functions, key=lambda x: x.cognitive_complexity, reverse=True
-        )[:5]
+        functions_ordered_by_cog_complexity = store.top(
+            MetricStore.FUNCTION, "cognitive_complexity", 5
+        )
         rinfo = ["Function Cognitive Complexity"]
         for f in functions_ordered_by_cog_complexity:
             segment = Segmentor.get_complexity_segment(f.cognitive_complexity)
@@ -92,12 +78,10 @@ class TopOffendersFormatter(AbstractFormatter):
             )
         return self._format_side_by_side_metrics(linfo, rinfo)
 
-    def _format_mi_offenders(
-        self, file_metrics: list[FileMetrics], all_functions: list[FunctionNode]
-    ) -> str:
-        files_ordered = sorted(
-            file_metrics, key=lambda x: x.maintainabilityIndex, reverse=False
-        )[:5]
+    def _format_mi_offenders(self, store: MetricStore) -> str:
+        files_ordered = store.top(
+            MetricStore.FILE, "maintainabilityIndex", 5, reverse=False
+        )
         linfo = ["File Maintainability Index"]
         for f in files_ordered:
             segment = Segmentor.get_maintainability_segment(f.maintainabilityIndex)
@@ -106,9 +90,9 @@ class TopOffendersFormatter(AbstractFormatter):
                 f"\033[{color}m█\033[0m {f.full_name} ({round(f.maintainabilityIndex, 2)})"
             )
 
-        functions_ordered_by_mi = sorted(
-            all_functions, key=lambda x: x.maintainability_index, reverse=False
-        )[:5]
+        functions_ordered_by_mi = store.top(
+            MetricStore.FUNCTION, "maintainability_index", 5, reverse=False
+        )
         rinfo = ["Function Maintainability Index"]
         for f in functions_ordered_by_mi:
             segment = Segmentor.get_maintainability_segment(f.maintainability_index)
@@ -1,6 +1,5 @@
-import json
-
 from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Report.Html.DataShardWriter import DataShardWriter
 from metripy.Report.Html.PageRenderer import PageRenderer
 
 
@@ -9,25 +8,35 @@ class CouplingPageRenderer(PageRenderer):
         super().__init__(template_dir, output_dir, project_name)
 
     def render(self, metrics: ProjectMetrics):
-        # Convert file metrics to list of dictionaries for JSON serialization
-        metrics_list = []
-        for file_metric in metrics.file_metrics:
-            metric_dict = {
-                "full_name": file_metric.full_name,
-                "import_name": file_metric.import_name,
-                "imports": file_metric.imports if file_metric.imports else [],
-                "imported_by": (
-                    file_metric.imported_by if file_metric.imported_by else []
-                ),
-                "afferent_coupling": file_metric.afferent_coupling,
-                "efferent_coupling": file_metric.efferent_coupling,
-                "instability": file_metric.instability,
-            }
-            metrics_list.append(metric_dict)
+        files = {
+            file_metric.full_name: file_metric for file_metric in metrics.file_metrics
+        }
+
+        # Convert file metrics to dictionaries for JSON serialization, per directory
+        writer = DataShardWriter(self.output_dir, "coupling")
+        shards = []
+        for shard in DataShardWriter.group_by_directory(list(files)):
+            metrics_list = []
+            for file_name in shard:
+                file_metric = files[file_name]
+                metric_dict = {
+                    "full_name": file_metric.full_name,
+                    "import_name": file_metric.import_name,
+                    "imports": file_metric.imports if file_metric.imports else [],
+                    "imported_by": (
+                        file_metric.imported_by if file_metric.imported_by else []
+                    ),
+                    "afferent_coupling": file_metric.afferent_coupling,
+                    "efferent_coupling": file_metric.efferent_coupling,
+                    "instability": file_metric.instability,
+                }
+                metrics_list.append(metric_dict)
+            shards.append(writer.write(str(len(shards)), metrics_list))
+        manifest = writer.write("manifest", {"shards": shards})
 
         self.render_template(
             "coupling.html",
             {
-                "metrics_json": json.dumps(metrics_list, indent=2),
+                "coupling_manifest": manifest,
             },
         )
@@ -0,0 +1,49 @@
+import json
+import os
+import shutil
+from typing import Any
+
+
+class DataShardWriter:
+    """
+    Writes the data of a page as shards under data/ of the report, one per
+    directory of the project, and a manifest listing them. The pages load the
+    shards on demand with js/data_loader.js. Shards are scripts registering
+    their data, browsers do not fetch json files of reports opened from the
+    file system.
+    """
+
+    # directories with more files are split into several shards
+    MAX_FILES_PER_SHARD = 200
+
+    def __init__(self, output_dir: str, name: str):
+        self.output_dir = output_dir
+        self.name = name
+
+        # shards of a previous report would be left behind otherwise
+        directory = os.path.join(output_dir, "data", name)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory)
+
+    @classmethod
+    def group_by_directory(cls, full_names: list[str]) -> list[list[str]]:
+        """file names per shard, files of the same directory share a shard"""
+        directories: dict[str, list[str]] = {}
+        for full_name in full_names:
+            directories.setdefault(os.path.dirname(full_name), []).append(full_name)
+
+        shards = []
+        for names in directories.values():
+            for start in range(0, len(names), cls.MAX_FILES_PER_SHARD):
+                end = start + cls.MAX_FILES_PER_SHARD
+                shards.append(names[start:end])
+        return shards
+
+    def write(self, shard: str, data: Any) -> str:
+        """writes a shard, returns its path relative to the pages"""
+        path = f"data/{self.name}/{shard}.js"
+        with open(os.path.join(self.output_dir, path), "w") as file:
+            file.write(f"MetripyData.register({json.dumps(path)}, ")
+            json.dump(data, file)
+            file.write(");\n")
+        return path
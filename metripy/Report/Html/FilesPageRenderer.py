@@ -1,28 +1,60 @@
 import json
 
 from metripy.Metric.FileTree.FileTreeParser import FileTreeParser
+from metripy.Metric.MetricStore import MetricStore
 from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Report.Html.DataShardWriter import DataShardWriter
 from metripy.Report.Html.PageRenderer import PageRenderer
 
 
 class FilesPageRenderer(PageRenderer):
+    # segments of a file, the worst one is shown in the file tree
+    SEGMENTS = [
+        "loc_segment",
+        "complexity_segment",
+        "cognitive_complexity_segment",
+        "maintainability_segment",
+        "method_size_segment",
+    ]
+
     def __init__(self, template_dir: str, output_dir: str, project_name: str):
         super().__init__(template_dir, output_dir, project_name)
 
     def render(self, metrics: ProjectMetrics):
         file_names = []
-        file_details = {}
+        files = {}
         for file_metrics in metrics.file_metrics:
             file_name = file_metrics.full_name
-            file_details[file_name] = file_metrics.to_dict()
+            files[file_name] = file_metrics
             file_names.append(file_name)
 
+        # file details per directory, only the shards of opened files are loaded
+        writer = DataShardWriter(self.output_dir, "files")
+        shards = []
+        manifest_files = {}
+        for shard in DataShardWriter.group_by_directory(list(files)):
+            file_details = {}
+            for file_name in shard:
+                file_details[file_name] = files[file_name].to_dict()
+                manifest_files[file_name] = {
+                    "shard": len(shards),
+                    "segment": self._get_worst_segment(file_details[file_name]),
+                }
+            shards.append(writer.write(str(len(shards)), file_details))
+        manifest = writer.write("manifest", {"shards": shards, "files": manifest_files})
+
         filetree = FileTreeParser.parse(file_names, shorten=True)
 
         self.render_template(
             "files.html",
             {
                 "filetree": json.dumps(filetree.to_dict()),
-                "file_details": json.dumps(file_details),
+                "file_manifest": manifest,
             },
         )
+
+    def _get_worst_segment(self, file_details: dict) -> str:
+        return max(
+            (file_details[segment] for segment in self.SEGMENTS),
+            key=MetricStore.SEGMENTS.index,
+        )
@@ -1,5 +1,6 @@
 import os
 from datetime import datetime
+from functools import cache
 
 from py_template_engine import TemplateEngine
 
@@ -16,12 +17,20 @@ class PageRenderer:
             "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "author": "Metripy",
-            "version": Info().get_version(),
+            "version": self._get_version(),
         }
 
+    @staticmethod
+    @cache
+    def _get_version() -> str:
+        """looked up once, not for every page"""
+        return Info().get_version()
+
     @staticmethod
     def _stringify_values(obj):
-        if isinstance(obj, dict):
+        if isinstance(obj, str):
+            return obj
+        elif isinstance(obj, dict):
             return {
                 key: PageRenderer._stringify_values(value) for key, value in obj.items()
             }
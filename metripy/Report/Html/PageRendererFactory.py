@@ -5,11 +5,25 @@ from metripy.Report.Html.FilesPageRenderer import FilesPageRenderer
 from metripy.Report.Html.GitAnalysisPageRenderer import GitAnalysisPageRenderer
 from metripy.Report.Html.IndexPageRenderer import IndexPageRenderer
 from metripy.Report.Html.MetricsPageRenderer import MetricsPageRenderer
+from metripy.Report.Html.PageRenderer import PageRenderer
 from metripy.Report.Html.TopOffendersPageRenderer import TopOffendersPageRenderer
 from metripy.Report.Html.TrendsPageRenderer import TrendsPageRenderer
 
 
 class PageRendererFactory:
+    # pages of the report, in the order they are rendered
+    PAGES = [
+        "index",
+        "files",
+        "top_offenders",
+        "git_analysis",
+        "coupling",
+        "dependencies",
+        "trends",
+        "code_smells",
+        "metrics",
+    ]
+
     def __init__(self, template_dir: str, output_dir: str, project_name: str):
         self.template_dir = template_dir
         self.output_dir = output_dir
@@ -53,3 +67,25 @@ class PageRendererFactory:
         return MetricsPageRenderer(
             self.template_dir, self.output_dir, self.project_name
         )
+
+    def create(self, page: str) -> PageRenderer:
+        if page == "index":
+            return self.create_index_page_renderer()
+        elif page == "files":
+            return self.create_files_page_renderer()
+        elif page == "top_offenders":
+            return self.create_top_offenders_page_renderer()
+        elif page == "git_analysis":
+            return self.create_git_analysis_page_renderer()
+        elif page == "coupling":
+            return self.create_coupling_page_renderer()
+        elif page == "dependencies":
+            return self.create_dependency_page_renderer()
+        elif page == "trends":
+            return self.create_trends_page_renderer()
+        elif page == "code_smells":
+            return self.create_code_smells_page_renderer()
+        elif page == "metrics":
+            return self.create_metrics_page_renderer()
+        else:
+            raise ValueError(f"Unsupported page: {page}")
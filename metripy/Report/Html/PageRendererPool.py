@@ -0,0 +1,47 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator
+
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Report.Html.PageRendererFactory import PageRendererFactory
+
+# factory and metrics of the current worker process
+_worker_factory: PageRendererFactory | None = None
+_worker_metrics: ProjectMetrics | None = None
+
+
+def _init_worker(factory: PageRendererFactory, metrics: ProjectMetrics) -> None:
+    """receives the metrics once per worker process instead of once per page"""
+    global _worker_factory, _worker_metrics
+    _worker_factory = factory
+    _worker_metrics = metrics
+
+
+def _render_page(page: str) -> str:
+    _worker_factory.create(page).render(_worker_metrics)
+    return page
+
+
+class PageRendererPool:
+    """Renders the pages of the html report in a pool of worker processes"""
+
+    # every worker receives all metrics, a few workers are enough for the pages
+    MAX_WORKERS = 4
+
+    def __init__(self, page_renderer_factory: PageRendererFactory, workers: int):
+        self.page_renderer_factory = page_renderer_factory
+        self.workers = workers
+
+    def get_workers(self, pages: int) -> int:
+        return min(self.workers, pages, self.MAX_WORKERS)
+
+    def run(self, metrics: ProjectMetrics, pages: list[str]) -> Iterator[str]:
+        """renders the pages, yields the names of the written pages in order"""
+        # spawn instead of fork, like the analysis pool
+        with ProcessPoolExecutor(
+            max_workers=self.get_workers(len(pages)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.page_renderer_factory, metrics),
+        ) as executor:
+            yield from executor.map(_render_page, pages)
@@ -8,15 +8,25 @@ from metripy.Application.Config.ReportConfig import ReportConfig
 from metripy.Component.Output.CliOutput import CliOutput
 from metripy.Metric.ProjectMetrics import ProjectMetrics
 from metripy.Report.Html.PageRendererFactory import PageRendererFactory
+from metripy.Report.Html.PageRendererPool import PageRendererPool
 from metripy.Report.ReporterInterface import ReporterInterface
 
 
 class Reporter(ReporterInterface):
+    # below, starting the worker processes takes longer than rendering the pages
+    CONCURRENT_MIN_FILES = 5000
+
     def __init__(
-        self, config: ReportConfig, output: CliOutput, project_name: str = "foobar"
+        self,
+        config: ReportConfig,
+        output: CliOutput,
+        project_name: str = "foobar",
+        workers: int = 1,
     ):
         self.config: ReportConfig = config
         self.output = output
+        # processes rendering the pages, one renders them sequentially
+        self.workers = workers
 
         # Find templates directory - works both in development and when installed
         template_dir = self._find_template_dir()
@@ -95,15 +105,18 @@ class Reporter(ReporterInterface):
         # shutil.copytree(os.path.join(self.template_dir, "fonts"), os.path.join(self.config.path, "fonts"), dirs_exist_ok=True)
 
         # Render main pages
-        self.render_index_page(metrics)
-        self.render_files_page(metrics)
-        self.render_top_offenders_page(metrics)
-        self.render_git_analysis_page(metrics)
-        self.render_coupling_page(metrics)
-        self.render_dependencies_page(metrics)
-        self.render_trends_page(metrics)
-        self.render_code_smells_page(metrics)
-        self.render_metrics_page(metrics)
+        if self.workers > 1 and len(metrics.file_metrics) >= self.CONCURRENT_MIN_FILES:
+            self.render_pages_concurrent(metrics)
+        else:
+            self.render_index_page(metrics)
+            self.render_files_page(metrics)
+            self.render_top_offenders_page(metrics)
+            self.render_git_analysis_page(metrics)
+            self.render_coupling_page(metrics)
+            self.render_dependencies_page(metrics)
+            self.render_trends_page(metrics)
+            self.render_code_smells_page(metrics)
+            self.render_metrics_page(metrics)
 
         self.output.writeln(
             f"<success>HTML report generated in {self.config.path} directory</success>"
@@ -112,6 +125,16 @@ class Reporter(ReporterInterface):
             f"<success>Open HTML report: {self.config.path}/index.html</success>"
         )
 
+    def render_pages_concurrent(self, metrics: ProjectMetrics):
+        """Render the pages independently of each other in worker processes"""
+        pool = PageRendererPool(self.page_renderer_factory, self.workers)
+        workers = pool.get_workers(len(PageRendererFactory.PAGES))
+        self.output.writeln(f"<info>Rendering pages with {workers} workers</info>")
+        for page in pool.run(metrics, PageRendererFactory.PAGES):
+            self.output.writeln(
+                f"<success>Done rendering {page.replace('_', ' ')} page</success>"
+            )
+
     def render_index_page(self, metrics: ProjectMetrics):
         self.output.writeln("<info>Rendering index page</info>")
         self.page_renderer_factory.create_index_page_renderer().render(metrics)
@@ -1,7 +1,7 @@
 from metripy.Metric.Code.Segmentor import Segmentor
+from metripy.Metric.MetricStore import MetricStore
 from metripy.Metric.ProjectMetrics import ProjectMetrics
 from metripy.Report.Html.PageRenderer import PageRenderer
-from metripy.Tree.FunctionNode import FunctionNode
 
 
 class TopOffendersPageRenderer(PageRenderer):
@@ -9,36 +9,21 @@ class TopOffendersPageRenderer(PageRenderer):
         super().__init__(template_dir, output_dir, project_name)
 
     def render(self, metrics: ProjectMetrics):
-        orderedByTotalCc = sorted(
-            metrics.file_metrics, key=lambda x: x.totalCc, reverse=True
-        )[:10]
-        orderedByMI = sorted(
-            metrics.file_metrics, key=lambda x: x.maintainabilityIndex, reverse=False
-        )[:10]
-        orderedByLoc = sorted(metrics.file_metrics, key=lambda x: x.loc, reverse=True)[
-            :10
-        ]
+        store = metrics.metric_store
+        file = MetricStore.FILE
+        function = MetricStore.FUNCTION
+        orderedByTotalCc = store.top(file, "totalCc", 10)
+        orderedByMI = store.top(file, "maintainabilityIndex", 10, reverse=False)
+        orderedByLoc = store.top(file, "loc", 10)
 
-        all_functions: list[FunctionNode] = []
-        for fm in metrics.file_metrics:
-            all_functions.extend(fm.function_nodes)
-
-        functionsOrderedByCc = sorted(
-            all_functions, key=lambda x: x.complexity, reverse=True
-        )[:10]
-        functionsOrderedByMi = sorted(
-            all_functions, key=lambda x: x.maintainability_index, reverse=False
-        )[:10]
-        functionsOrderedByLoc = sorted(
-            all_functions, key=lambda x: x.get_loc(), reverse=True
-        )[:10]
+        functionsOrderedByCc = store.top(function, "complexity", 10)
+        functionsOrderedByMi = store.top(
+            function, "maintainability_index", 10, reverse=False
+        )
+        functionsOrderedByLoc = store.top(function, "loc", 10)
 
-        orderedByTotalCogCc = sorted(
-            metrics.file_metrics, key=lambda x: x.total_cog_complexity, reverse=True
-        )[:10]
-        functionsOrderedByCogCc = sorted(
-            all_functions, key=lambda x: x.cognitive_complexity, reverse=True
-        )[:10]
+        orderedByTotalCogCc = store.top(file, "total_cog_complexity", 10)
+        functionsOrderedByCogCc = store.top(function, "cognitive_complexity", 10)
 
         self.render_template(
             "top_offenders.html",
@@ -1,11 +1,19 @@
-import json
 import os
+from contextlib import contextmanager
+from typing import Iterator
 
+from metripy.Report.Json.JsonStreamWriter import JsonStreamWriter
 from metripy.Report.ReporterInterface import ReporterInterface
 
 
 class AbstractJsonReporter(ReporterInterface):
     def put_data(self, data: dict) -> None:
+        with self.open_writer() as writer:
+            writer.write(data)
+
+    @contextmanager
+    def open_writer(self) -> Iterator[JsonStreamWriter]:
+        """writer of the report file, to write large reports piece by piece"""
         os.makedirs(os.path.dirname(self.config.path), exist_ok=True)
-        with open(self.config.path, "w") as file:
-            json.dump(data, file, indent=2)
+        with open(self.config.path, "wb") as file:
+            yield JsonStreamWriter(file)
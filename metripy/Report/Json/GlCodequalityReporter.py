@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from metripy.Application.Config.ReportConfig import ReportConfig
 from metripy.Component.Output.CliOutput import CliOutput
 from metripy.Metric.ProjectMetrics import ProjectMetrics
@@ -11,13 +13,16 @@ class GlCodequalityReporter(AbstractJsonReporter):
         self.output = output
 
     def generate(self, metrics: ProjectMetrics):
-        self.put_data(self.transform_metrics(metrics))
+        with self.open_writer() as writer:
+            writer.begin_array()
+            for item in self.iterate_items(metrics):
+                writer.write(item)
+            writer.end_array()
         self.output.writeln(
             f"<success>Create gl-codequality-report in {self.config.path}</success>"
         )
 
-    def transform_metrics(self, metrics: ProjectMetrics) -> list[dict]:
-        items = []
+    def iterate_items(self, metrics: ProjectMetrics) -> Iterator[dict]:
         for file_metric in metrics.file_metrics:
             for function_node in file_metric.function_nodes:
                 checks = [
@@ -58,23 +63,20 @@ class GlCodequalityReporter(AbstractJsonReporter):
                     severity = self.segment_to_severity(segment_fn(value))
                     if not severity:
                         continue
-                    items.append(
-                        {
-                            "description": f"{label} of {function_node.name} {issue}",
-                            "check_name": check_name,
-                            "fingerprint": hash(
-                                f"{function_node.full_name}_{fp_key}_{value}"
-                            ),
-                            "location": {
-                                "path": file_metric.full_name,
-                                "lines": {
-                                    "begin": function_node.lineno,
-                                },
+                    yield {
+                        "description": f"{label} of {function_node.name} {issue}",
+                        "check_name": check_name,
+                        "fingerprint": hash(
+                            f"{function_node.full_name}_{fp_key}_{value}"
+                        ),
+                        "location": {
+                            "path": file_metric.full_name,
+                            "lines": {
+                                "begin": function_node.lineno,
                             },
-                            "severity": severity,
-                        }
-                    )
-        return items
+                        },
+                        "severity": severity,
+                    }
 
     def segment_to_severity(self, segment: str) -> str | None:
         if segment == "ok":
@@ -10,7 +10,16 @@ class JsonReporter(AbstractJsonReporter):
         self.output = output
 
     def generate(self, metrics: ProjectMetrics):
-        self.put_data(metrics.to_dict())
+        # same document as metrics.to_dict(), one file at a time
+        with self.open_writer() as writer:
+            writer.begin_object()
+            writer.begin_array("file_metrics")
+            for file_metric in metrics.file_metrics:
+                writer.write(file_metric.to_dict())
+            writer.end_array()
+            for key, value in metrics.to_dict_without_files().items():
+                writer.write(value, key)
+            writer.end_object()
         self.output.writeln(
             f"<success>Create json report in {self.config.path}</success>"
         )
@@ -0,0 +1,105 @@
+import json
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonStreamWriter:
+    """
+    Writes a json document piece by piece, in the layout of json.dump with
+    indent=2. Objects and arrays are opened and closed explicitly, every other
+    value is serialized on its own, so only one of them is in memory at a time.
+    orjson is used for the values when it is installed.
+    """
+
+    INDENT = b"  "
+
+    def __init__(self, file: BinaryIO, fast: bool = True):
+        self.file = file
+        self.dumps = self._dumps_orjson if fast and orjson else self._dumps_json
+        # per open object or array: whether it has items yet
+        self.containers: list[bool] = []
+
+    @staticmethod
+    def _dumps_orjson(value: Any) -> bytes:
+        if not JsonStreamWriter._is_orjson_safe(value):
+            return JsonStreamWriter._dumps_json(value)
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    @staticmethod
+    def _is_orjson_safe(value: Any) -> bool:
+        """
+        orjson writes the same bytes as json.dumps, except for NaN and Infinity
+        (null), non-ascii strings (not escaped), floats written with an exponent
+        by json (1e-05 vs 1e-5) and integers beyond 64 bits (not supported)
+        """
+        stack = [value]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                if not item.isascii():
+                    return False
+            elif isinstance(item, float):
+                if item != 0 and not 1e-4 <= abs(item) < 1e16:
+                    # also true for NaN and Infinity
+                    return False
+            elif isinstance(item, bool) or item is None:
+                continue
+            elif isinstance(item, int):
+                if not -(2**63) <= item < 2**64:
+                    return False
+            elif isinstance(item, dict):
+                for key in item:
+                    if isinstance(key, float):
+                        return False
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif isinstance(item, (list, tuple)):
+                stack.extend(item)
+        return True
+
+    @staticmethod
+    def _dumps_json(value: Any) -> bytes:
+        return json.dumps(value, indent=2).encode()
+
+    def _begin_item(self, key: str | None) -> None:
+        """separator, indentation and key of the next item of the open container"""
+        if not self.containers:
+            return
+        self.file.write(b",\n" if self.containers[-1] else b"\n")
+        self.file.write(self.INDENT * len(self.containers))
+        self.containers[-1] = True
+        if key is not None:
+            self.file.write(json.dumps(key).encode() + b": ")
+
+    def write(self, value: Any, key: str | None = None) -> None:
+        """complete value, key is needed for items of objects"""
+        self._begin_item(key)
+        data = self.dumps(value)
+        if self.containers:
+            data = data.replace(b"\n", b"\n" + self.INDENT * len(self.containers))
+        self.file.write(data)
+
+    def begin_object(self, key: str | None = None) -> None:
+        self._begin_item(key)
+        self.file.write(b"{")
+        self.containers.append(False)
+
+    def end_object(self) -> None:
+        self._end(b"}")
+
+    def begin_array(self, key: str | None = None) -> None:
+        self._begin_item(key)
+        self.file.write(b"[")
+        self.containers.append(False)
+
+    def end_array(self) -> None:
+        self._end(b"]")
+
+    def _end(self, bracket: bytes) -> None:
+        if self.containers.pop():
+            self.file.write(b"\n" + self.INDENT * len(self.containers))
+        self.file.write(bracket)
@@ -7,15 +7,16 @@ from metripy.Report.Html.Reporter import Reporter as HtmlReporter
 from metripy.Report.Json.GitJsonReporter import GitJsonReporter
 from metripy.Report.Json.JsonReporter import JsonReporter
 from metripy.Report.Json.GlCodequalityReporter import GlCodequalityReporter
+from metripy.Report.Trend.TrendSnapshotReporter import TrendSnapshotReporter
 
 
 class ReporterFactory:
     @staticmethod
     def create(
-        config: ReportConfig, output: CliOutput, project_name: str
+        config: ReportConfig, output: CliOutput, project_name: str, workers: int = 1
     ) -> ReporterInterface:
         if config.type == "html":
-            return HtmlReporter(config, output, project_name)
+            return HtmlReporter(config, output, project_name, workers)
         elif config.type == "json":
             return JsonReporter(config, output)
         elif config.type == "csv":
@@ -26,5 +27,7 @@ class ReporterFactory:
             return GitJsonReporter(config, output)
         elif config.type == "gl-codequality-report":
             return GlCodequalityReporter(config, output)
+        elif config.type == "trend-snapshot":
+            return TrendSnapshotReporter(config, output)
         else:
             raise ValueError(f"Unsupported report type: {config.type}")
@@ -0,0 +1,22 @@
+import os
+
+from metripy.Application.Config.ReportConfig import ReportConfig
+from metripy.Component.Output.CliOutput import CliOutput
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Report.ReporterInterface import ReporterInterface
+from metripy.Trend.TrendSnapshotWriter import TrendSnapshotWriter
+
+
+class TrendSnapshotReporter(ReporterInterface):
+    """binary snapshot of the run, to be used as trends of a later run"""
+
+    def __init__(self, config: ReportConfig, output: CliOutput):
+        self.config = config
+        self.output = output
+
+    def generate(self, metrics: ProjectMetrics) -> None:
+        os.makedirs(os.path.dirname(self.config.path), exist_ok=True)
+        TrendSnapshotWriter().write(self.config.path, metrics)
+        self.output.writeln(
+            f"<success>Create trend snapshot in {self.config.path}</success>"
+        )
@@ -6,6 +6,17 @@ from metripy.Tree.FunctionNode import FunctionNode
 
 
 class ClassNode:
+    __slots__ = (
+        "full_name",
+        "name",
+        "lineno",
+        "line_end",
+        "real_complexity",
+        "lcom4",
+        "functions",
+        "trend",
+    )
+
     def __init__(
         self,
         full_name: str,
@@ -42,9 +53,6 @@ class ClassNode:
             "functions": [func.to_dict() for func in self.functions],
         }
 
-    def __dict__(self) -> dict:
-        return self.to_dict()
-
     @staticmethod
     def from_dict(data: dict) -> Self:
         node = ClassNode(
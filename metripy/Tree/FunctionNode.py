@@ -6,6 +6,29 @@ from metripy.Metric.Trend.FunctionTrendMetric import FunctionTrendMetric
 
 
 class FunctionNode:
+    __slots__ = (
+        "full_name",
+        "name",
+        "lineno",
+        "line_end",
+        "complexity",
+        "h1",
+        "h2",
+        "N1",
+        "N2",
+        "vocabulary",
+        "length",
+        "calculated_length",
+        "volume",
+        "difficulty",
+        "effort",
+        "time",
+        "bugs",
+        "maintainability_index",
+        "cognitive_complexity",
+        "trend",
+    )
+
     def __init__(
         self, full_name: str, name: str, lineno: int, line_end: int, complexity: int
     ):
@@ -92,9 +115,6 @@ class FunctionNode:
             ),
         }
 
-    def __dict__(self) -> dict:
-        return self.to_dict()
-
     @staticmethod
     def from_dict(data: dict) -> Self:
         node = FunctionNode(
@@ -104,6 +124,10 @@ class FunctionNode:
             line_end=data["line_end"],
             complexity=data["complexity"],
         )
+        node.h1 = data.get("h1", 0)
+        node.h2 = data.get("h2", 0)
+        node.N1 = data.get("N1", 0)
+        node.N2 = data.get("N2", 0)
         node.vocabulary = data["vocabulary"]
         node.length = data["length"]
         node.calculated_length = data["calculated_length"]
@@ -1,9 +1,28 @@
 from metripy.LangAnalyzer.Generic.CodeSmell.CodeSmell import CodeSmell
+from metripy.LangAnalyzer.Generic.DuplicateSearch.CodeChunkArray import CodeChunkArray
 from metripy.Tree.ClassNode import ClassNode
 from metripy.Tree.FunctionNode import FunctionNode
 
 
 class ModuleNode:
+    __slots__ = (
+        "full_name",
+        "loc",
+        "lloc",
+        "sloc",
+        "comments",
+        "multi",
+        "blank",
+        "single_comments",
+        "maintainability_index",
+        "classes",
+        "functions",
+        "imports",
+        "import_name",
+        "code_smells",
+        "code_chunks",
+    )
+
     def __init__(
         self,
         full_name: str,
@@ -29,6 +48,8 @@ class ModuleNode:
         self.imports: list[str] | None = None
         self.import_name: str | None = None
         self.code_smells: list[CodeSmell] = []
+        # input of the duplicate search, not part of the metrics
+        self.code_chunks: CodeChunkArray = CodeChunkArray()
 
     def to_dict(self) -> dict:
         return {
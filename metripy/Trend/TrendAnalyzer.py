@@ -1,3 +1,5 @@
+from typing import Callable
+
 from metripy.Metric.Code.AggregatedMetrics import AggregatedMetrics
 from metripy.Metric.Code.FileMetrics import FileMetrics
 from metripy.Metric.Code.SegmentedMetrics import SegmentedMetrics
@@ -56,13 +58,21 @@ class TrendAnalyzer:
         file_metrics: list[FileMetrics],
         historical_file_metrics: list[FileMetrics],
     ):
-        indexed_file_metrics = {m.full_name: m for m in file_metrics}
         indexed_historical_file_metrics = {
             m.full_name: m for m in historical_file_metrics
         }
+        self.add_file_trends(file_metrics, indexed_historical_file_metrics.get)
+
+    def add_file_trends(
+        self,
+        file_metrics: list[FileMetrics],
+        get_historical_file_metric: Callable[[str], FileMetrics | None],
+    ):
+        """historical metrics are looked up per file, e.g. from a snapshot"""
+        indexed_file_metrics = {m.full_name: m for m in file_metrics}
 
         for full_name, file_metric in indexed_file_metrics.items():
-            historical_file_metric = indexed_historical_file_metrics.get(full_name)
+            historical_file_metric = get_historical_file_metric(full_name)
             if not historical_file_metric:
                 continue
             file_metric.trend = self.create_file_trend_metric(
@@ -154,8 +164,16 @@ class TrendAnalyzer:
         self,
         project_metrics: ProjectMetrics,
         historical_project_metrics: ProjectMetrics,
+    ):
+        self.add_aggregated_trends(
+            project_metrics, historical_project_metrics.total_code_metrics
+        )
+
+    def add_aggregated_trends(
+        self,
+        project_metrics: ProjectMetrics,
+        historical_aggregated_metric: AggregatedMetrics,
     ):
         project_metrics.total_code_metrics.trend = self.create_aggregated_trend_metric(
-            project_metrics.total_code_metrics,
-            historical_project_metrics.total_code_metrics,
+            project_metrics.total_code_metrics, historical_aggregated_metric
         )
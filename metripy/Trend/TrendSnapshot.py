@@ -0,0 +1,40 @@
+import json
+import struct
+import zlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class TrendSnapshot:
+    """
+    Binary snapshot of a run for trends. After a fixed header with the offset
+    of the index, every file metric is a compressed json record of its own.
+    The index at the end maps full names to offset and size of the records,
+    so single files and the aggregated metrics can be read without the rest.
+    """
+
+    MAGIC = b"MPYTRND1"
+    # magic and offset of the index
+    HEADER = struct.Struct("<8sQ")
+
+    @staticmethod
+    def encode(data: any) -> bytes:
+        if orjson:
+            return zlib.compress(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+
+    @staticmethod
+    def decode(record: bytes) -> any:
+        data = zlib.decompress(record)
+        return orjson.loads(data) if orjson else json.loads(data)
+
+    @staticmethod
+    def is_snapshot(path: str) -> bool:
+        try:
+            with open(path, "rb") as file:
+                return file.read(len(TrendSnapshot.MAGIC)) == TrendSnapshot.MAGIC
+        except OSError:
+            return False
@@ -0,0 +1,48 @@
+from typing import Self
+
+from metripy.Metric.Code.AggregatedMetrics import AggregatedMetrics
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Trend.TrendSnapshot import TrendSnapshot
+
+
+class TrendSnapshotReader:
+    """Reads the records of a snapshot on demand, only the index is loaded upfront"""
+
+    def __init__(self, path: str):
+        self.file = open(path, "rb")
+        try:
+            header = self.file.read(TrendSnapshot.HEADER.size)
+            if not header.startswith(TrendSnapshot.MAGIC):
+                raise ValueError(f"Not a trend snapshot: {path}")
+            _, index_offset = TrendSnapshot.HEADER.unpack(header)
+            self.file.seek(index_offset)
+            index = TrendSnapshot.decode(self.file.read())
+        except Exception:
+            self.file.close()
+            raise
+        self.aggregated: tuple[int, int] = index["aggregated"]
+        self.files: dict[str, tuple[int, int]] = index["files"]
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.file.close()
+
+    def _read_record(self, offset: int, size: int) -> dict:
+        self.file.seek(offset)
+        return TrendSnapshot.decode(self.file.read(size))
+
+    def get_file_names(self) -> list[str]:
+        return list(self.files)
+
+    def get_file_metrics(self, full_name: str) -> FileMetrics | None:
+        if full_name not in self.files:
+            return None
+        return FileMetrics.from_dict(self._read_record(*self.files[full_name]))
+
+    def get_aggregated_metrics(self) -> AggregatedMetrics:
+        return AggregatedMetrics.from_history_dict(self._read_record(*self.aggregated))
@@ -0,0 +1,27 @@
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Trend.TrendSnapshot import TrendSnapshot
+
+
+class TrendSnapshotWriter:
+    def write(self, path: str, project_metrics: ProjectMetrics) -> None:
+        with open(path, "wb") as file:
+            file.write(TrendSnapshot.HEADER.pack(TrendSnapshot.MAGIC, 0))
+            # full name => offset and size of the record
+            files: dict[str, tuple[int, int]] = {}
+            for file_metric in project_metrics.file_metrics:
+                files[file_metric.full_name] = self._write_record(
+                    file, file_metric.to_dict()
+                )
+            aggregated = self._write_record(
+                file, project_metrics.total_code_metrics.to_history_dict()
+            )
+
+            index_offset = file.tell()
+            file.write(TrendSnapshot.encode({"aggregated": aggregated, "files": files}))
+            file.seek(0)
+            file.write(TrendSnapshot.HEADER.pack(TrendSnapshot.MAGIC, index_offset))
+
+    @staticmethod
+    def _write_record(file, data: dict) -> tuple[int, int]:
+        offset = file.tell()
+        return offset, file.write(TrendSnapshot.encode(data))
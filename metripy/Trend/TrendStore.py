@@ -0,0 +1,312 @@
+import json
+import sqlite3
+from typing import Self
+
+from metripy.Metric.Code.AggregatedMetrics import AggregatedMetrics
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Tree.ClassNode import ClassNode
+from metripy.Tree.FunctionNode import FunctionNode
+
+
+class TrendStore:
+    """
+    Metrics of every run of a project in a SQLite database. A run is compared
+    with the last stored one file by file, and the metrics of a file, class or
+    function over the last runs are a single indexed query.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY,
+            project TEXT NOT NULL,
+            timestamp INTEGER NOT NULL,
+            aggregated TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS runs_project ON runs (project, timestamp);
+        CREATE TABLE IF NOT EXISTS files (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            full_name TEXT NOT NULL,
+            loc INTEGER,
+            totalCc REAL,
+            avgCcPerFunction REAL,
+            maintainabilityIndex REAL,
+            avgLocPerFunction REAL,
+            total_cog_complexity REAL,
+            avg_cog_complexity_per_function REAL,
+            avg_lcom4_per_class REAL
+        );
+        CREATE INDEX IF NOT EXISTS files_run ON files (run_id, full_name);
+        CREATE INDEX IF NOT EXISTS files_name ON files (full_name, run_id);
+        CREATE TABLE IF NOT EXISTS classes (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            file_name TEXT NOT NULL,
+            full_name TEXT NOT NULL,
+            name TEXT,
+            lineno INTEGER,
+            line_end INTEGER,
+            real_complexity REAL,
+            lcom4 REAL
+        );
+        CREATE INDEX IF NOT EXISTS classes_run ON classes (run_id, file_name);
+        CREATE INDEX IF NOT EXISTS classes_name ON classes (full_name, run_id);
+        CREATE TABLE IF NOT EXISTS functions (
+            run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+            file_name TEXT NOT NULL,
+            -- full name of the class of methods
+            class_name TEXT,
+            full_name TEXT NOT NULL,
+            name TEXT,
+            lineno INTEGER,
+            line_end INTEGER,
+            complexity REAL,
+            maintainability_index REAL,
+            cognitive_complexity REAL
+        );
+        CREATE INDEX IF NOT EXISTS functions_run ON functions (run_id, file_name);
+        CREATE INDEX IF NOT EXISTS functions_name ON functions (full_name, run_id);
+    """
+
+    # queryable metrics per table
+    METRICS = {
+        "files": [
+            "loc",
+            "totalCc",
+            "avgCcPerFunction",
+            "maintainabilityIndex",
+            "avgLocPerFunction",
+            "total_cog_complexity",
+            "avg_cog_complexity_per_function",
+            "avg_lcom4_per_class",
+        ],
+        "classes": ["lineno", "line_end", "real_complexity", "lcom4"],
+        "functions": [
+            "lineno",
+            "line_end",
+            "complexity",
+            "maintainability_index",
+            "cognitive_complexity",
+        ],
+    }
+
+    def __init__(self, path: str, project: str):
+        self.project = project
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(self.SCHEMA)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_run(self, project_metrics: ProjectMetrics, timestamp: int) -> int:
+        aggregated = project_metrics.total_code_metrics
+        with self.connection:
+            run_id = self.connection.execute(
+                "INSERT INTO runs (project, timestamp, aggregated) VALUES (?, ?, ?)",
+                (self.project, timestamp, json.dumps(aggregated.to_history_dict())),
+            ).lastrowid
+            file_metrics = project_metrics.file_metrics
+            self.connection.executemany(
+                "INSERT INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (run_id, file_metric.full_name)
+                    + tuple(
+                        getattr(file_metric, name) for name in self.METRICS["files"]
+                    )
+                    for file_metric in file_metrics
+                ),
+            )
+            self.connection.executemany(
+                "INSERT INTO classes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        run_id,
+                        file_metric.full_name,
+                        class_node.full_name,
+                        class_node.name,
+                        class_node.lineno,
+                        class_node.line_end,
+                        class_node.real_complexity,
+                        class_node.lcom4,
+                    )
+                    for file_metric in file_metrics
+                    for class_node in file_metric.class_nodes
+                ),
+            )
+            self.connection.executemany(
+                "INSERT INTO functions VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (run_id, file_name, class_name)
+                    + self._function_to_row(function_node)
+                    for file_name, class_name, function_node in self._iterate_functions(
+                        file_metrics
+                    )
+                ),
+            )
+        return run_id
+
+    @staticmethod
+    def _iterate_functions(file_metrics: list[FileMetrics]):
+        """file name, class name or None and node of all functions and methods"""
+        for file_metric in file_metrics:
+            for class_node in file_metric.class_nodes:
+                for function_node in class_node.functions:
+                    yield file_metric.full_name, class_node.full_name, function_node
+            for function_node in file_metric.function_nodes:
+                yield file_metric.full_name, None, function_node
+
+    @staticmethod
+    def _function_to_row(function_node: FunctionNode) -> tuple:
+        return (
+            function_node.full_name,
+            function_node.name,
+            function_node.lineno,
+            function_node.line_end,
+            function_node.complexity,
+            function_node.maintainability_index,
+            function_node.cognitive_complexity,
+        )
+
+    def get_last_run(self) -> int | None:
+        row = self.connection.execute(
+            "SELECT id FROM runs WHERE project = ? ORDER BY timestamp DESC, id DESC",
+            (self.project,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_aggregated_metrics(self, run_id: int) -> AggregatedMetrics:
+        (aggregated,) = self.connection.execute(
+            "SELECT aggregated FROM runs WHERE id = ?", (run_id,)
+        ).fetchone()
+        return AggregatedMetrics.from_history_dict(json.loads(aggregated))
+
+    def get_file_metrics(self, run_id: int, full_name: str) -> FileMetrics | None:
+        """
+        metrics of a file in a run, with its classes and functions, without
+        imports and code smells
+        """
+        row = self.connection.execute(
+            "SELECT * FROM files WHERE run_id = ? AND full_name = ?",
+            (run_id, full_name),
+        ).fetchone()
+        if row is None:
+            return None
+        values = dict(zip(self.METRICS["files"], row[2:]))
+
+        class_nodes = {}
+        for (
+            _,
+            _,
+            class_name,
+            name,
+            lineno,
+            line_end,
+            cc,
+            lcom4,
+        ) in self.connection.execute(
+            "SELECT * FROM classes WHERE run_id = ? AND file_name = ?",
+            (run_id, full_name),
+        ):
+            class_node = ClassNode(class_name, name, lineno, line_end, cc)
+            class_node.lcom4 = lcom4
+            class_nodes[class_name] = class_node
+
+        function_nodes = []
+        for row in self.connection.execute(
+            "SELECT * FROM functions WHERE run_id = ? AND file_name = ?",
+            (run_id, full_name),
+        ):
+            class_name, full_function_name, name, lineno, line_end = row[2:7]
+            function_node = FunctionNode(
+                full_function_name, name, lineno, line_end, row[7]
+            )
+            function_node.maintainability_index = row[8]
+            function_node.cognitive_complexity = row[9]
+            if class_name is None:
+                function_nodes.append(function_node)
+            elif class_name in class_nodes:
+                class_nodes[class_name].functions.append(function_node)
+
+        return FileMetrics(
+            full_name=full_name,
+            loc=values["loc"],
+            totalCc=values["totalCc"],
+            avgCcPerFunction=values["avgCcPerFunction"],
+            maintainabilityIndex=values["maintainabilityIndex"],
+            avgLocPerFunction=values["avgLocPerFunction"],
+            class_nodes=list(class_nodes.values()),
+            function_nodes=function_nodes,
+            import_name=None,
+            imports=None,
+            code_smells=[],
+            total_cog_complexity=values["total_cog_complexity"],
+            avg_cog_complexity_per_function=values["avg_cog_complexity_per_function"],
+            avg_lcom4_per_class=values["avg_lcom4_per_class"],
+        )
+
+    def get_series(
+        self, table: str, full_name: str, metric: str, points: int
+    ) -> list[tuple[int, float]]:
+        """
+        timestamp and value of a metric of a file, class or function in the
+        last runs, oldest first. table is one of files, classes and functions
+        """
+        if metric not in self.METRICS.get(table, []):
+            raise ValueError(f"Unknown metric {metric} of {table}")
+        rows = self.connection.execute(
+            f"SELECT runs.timestamp, {table}.{metric} FROM {table} "
+            f"JOIN runs ON runs.id = {table}.run_id "
+            f"WHERE {table}.full_name = ? AND runs.project = ? "
+            "ORDER BY runs.timestamp DESC, runs.id DESC LIMIT ?",
+            (full_name, self.project, points),
+        ).fetchall()
+        return rows[::-1]
+
+    def get_project_series(self, points: int) -> list[tuple[int, AggregatedMetrics]]:
+        """timestamp and aggregated metrics of the last runs, oldest first"""
+        rows = self.connection.execute(
+            "SELECT id, timestamp FROM runs WHERE project = ? "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (self.project, points),
+        ).fetchall()
+        return [
+            (timestamp, self.get_aggregated_metrics(run_id))
+            for run_id, timestamp in reversed(rows)
+        ]
+
+    def apply_retention(
+        self, timestamp: int, retention_days: int, downsample_days: int
+    ) -> None:
+        """
+        deletes runs older than retention_days and all but the last run per
+        day of the runs older than downsample_days
+        """
+        day = 24 * 60 * 60
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM runs WHERE project = ? AND timestamp < ?",
+                (self.project, timestamp - retention_days * day),
+            )
+            downsample_before = timestamp - downsample_days * day
+            self.connection.execute(
+                "DELETE FROM runs WHERE project = ? AND timestamp < ? AND id NOT IN ("
+                "  SELECT id FROM ("
+                "    SELECT id, ROW_NUMBER() OVER ("
+                "      PARTITION BY timestamp / ? ORDER BY timestamp DESC, id DESC"
+                "    ) AS position FROM runs WHERE project = ? AND timestamp < ?"
+                "  ) WHERE position = 1"
+                ")",
+                (
+                    self.project,
+                    downsample_before,
+                    day,
+                    self.project,
+                    downsample_before,
+                ),
+            )
@@ -8,7 +8,8 @@ from metripy.Application.Application import Application
 def main():
     """cli entry point to application"""
     application = Application()
-    application.run(sys.argv)
+    # the parser consumes its arguments, spawned worker processes still need argv
+    application.run(sys.argv[:])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+/**
+ * Data Loader JavaScript
+ * Loads the data shards written to data/ next to the pages on demand.
+ * Shards are scripts registering their data, fetch is not allowed for
+ * reports opened from the file system.
+ */
+
+const MetripyData = {
+    data: {},
+    pending: {},
+
+    register(path, data) {
+        this.data[path] = data;
+    },
+
+    get(path) {
+        return this.data[path];
+    },
+
+    load(path) {
+        if (path in this.data) {
+            return Promise.resolve(this.data[path]);
+        }
+        if (!(path in this.pending)) {
+            this.pending[path] = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = path;
+                script.onload = () => resolve(this.data[path]);
+                script.onerror = () => {
+                    delete this.pending[path];
+                    reject(new Error(`Could not load ${path}`));
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return this.pending[path];
+    }
+};
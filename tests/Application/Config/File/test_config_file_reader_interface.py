@@ -50,6 +50,24 @@ class TestConfigFileReaderInterface(TestCase):
         data = {"git": {"branch": "test"}}
         project_config = self.reader.parse_config_json("test", data)
         self.assertEqual(project_config.git.branch, "test")
+        self.assertEqual(project_config.git.backend, "gitpython")
+
+    def test_parse_config_json_git_backend(self):
+        data = {"git": {"branch": "test", "backend": "log"}}
+        project_config = self.reader.parse_config_json("test", data)
+        self.assertEqual(project_config.git.backend, "log")
+
+    def test_parse_config_json_changed(self):
+        data = {"changed": {"base_report": "base.json", "range": "main...HEAD"}}
+        project_config = self.reader.parse_config_json("test", data)
+        self.assertEqual(project_config.changed.range, "main...HEAD")
+        self.assertTrue(project_config.changed.base_report.endswith("base.json"))
+
+    def test_parse_config_json_changed_without_base_report(self):
+        data = {"changed": {"range": "main...HEAD"}}
+        project_config = self.reader.parse_config_json("test", data)
+        with self.assertRaises(ValueError):
+            project_config.validate()
 
     def test_parse_config_json_composer(self):
         data = {"composer": True}
@@ -71,6 +89,19 @@ class TestConfigFileReaderInterface(TestCase):
         project_config = self.reader.parse_config_json("test", data)
         self.assertEqual(project_config.history_path, "test")
 
+    def test_parse_config_json_duplicates(self):
+        self.assertFalse(self.reader.parse_config_json("test", {}).duplicates)
+        data = {"duplicates": True}
+        project_config = self.reader.parse_config_json("test", data)
+        self.assertTrue(project_config.duplicates)
+
+    def test_parse_config_json_trend_store(self):
+        data = {"trend_store": {"path": "metrics.db", "retention_days": 30}}
+        project_config = self.reader.parse_config_json("test", data)
+        self.assertTrue(project_config.trend_store.path.endswith("metrics.db"))
+        self.assertEqual(project_config.trend_store.retention_days, 30)
+        self.assertEqual(project_config.trend_store.downsample_days, 14)
+
     def test_parse_config_json_code_smells_default(self):
         data = {}
         project_config = self.reader.parse_config_json("test", data)
@@ -160,3 +160,73 @@ class TestParser(TestCase):
 
         # Values are stored as strings, not converted to boolean
         self.assertTrue(config.debug)
+
+    def test_parse_workers(self):
+        """Test parsing the number of worker processes"""
+        argv = ["metripy", "--workers=4"]
+        config = self.parser.parse(argv)
+
+        self.assertEqual(config.get_workers(), 4)
+
+    def test_parse_invalid_workers(self):
+        """Test that workers must be a positive number or auto"""
+        for value in ["abc", "0", "-2", ""]:
+            with self.assertRaises(ValueError):
+                self.parser.parse(["metripy", f"--workers={value}"])
+        with self.assertRaises(ValueError):
+            self.parser.parse(["metripy", "--workers"])
+
+    @patch("metripy.Application.Config.Config.os.cpu_count", return_value=8)
+    def test_parse_workers_auto(self, mock_cpu_count):
+        """Test that workers default to the number of cpus"""
+        argv = ["metripy"]
+        config = self.parser.parse(argv)
+
+        self.assertEqual(config.workers, "auto")
+        self.assertEqual(config.get_workers(), 8)
+
+    def test_parse_sequential(self):
+        """Test that --sequential disables concurrent analysis"""
+        argv = ["metripy", "--sequential"]
+        config = self.parser.parse(argv)
+
+        self.assertFalse(config.concurrent)
+
+    def test_parse_offline(self):
+        """Test that --offline only uses cached registry documents"""
+        argv = ["metripy", "--offline"]
+        config = self.parser.parse(argv)
+
+        self.assertTrue(config.offline)
+
+    def test_parse_offline_without_cache(self):
+        """Test that --offline needs the cache of registry documents"""
+        with self.assertRaises(ValueError):
+            self.parser.parse(["metripy", "--offline", "--no-cache"])
+
+    def test_parse_trend_store_without_path(self):
+        """Test that the trend store is only enabled with a path"""
+        with self.assertRaises(ValueError):
+            self.parser.parse(["metripy", "--configs.p.trend_store.retention_days=30"])
+
+        config = self.parser.parse(
+            [
+                "metripy",
+                "--configs.p.trend_store.retention_days=30",
+                "--configs.p.trend_store.path=metrics.db",
+            ]
+        )
+        self.assertEqual(config.project_configs[0].trend_store.path, "metrics.db")
+
+    def test_parse_changed_without_base_report(self):
+        """Test that changed files are only analyzed against a base report"""
+        with self.assertRaises(ValueError):
+            self.parser.parse(["metripy", "--configs.p.changed.range=main...HEAD"])
+
+    def test_parse_no_cache(self):
+        """Test that --no-cache disables the analysis cache"""
+        argv = ["metripy", "--no-cache"]
+        config = self.parser.parse(argv)
+
+        self.assertIsNone(config.cache)
+        self.assertEqual(len(argv), 0)
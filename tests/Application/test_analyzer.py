@@ -1,8 +1,17 @@
+import json
+import os
+import tempfile
+import threading
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
+
+from git import Repo
 
 from metripy.Application.Analyzer import Analyzer
+from metripy.Application.Config.ChangedConfig import ChangedConfig
+from metripy.Application.Config.ProjectConfig import ProjectConfig
 from metripy.Dependency.Dependency import Dependency
+from metripy.LangAnalyzer.AbstractLangAnalyzer import AbstractLangAnalyzer
 from metripy.Metric.Code.FileMetrics import FileMetrics
 from metripy.Metric.Git.GitMetrics import GitMetrics
 from metripy.Metric.ProjectMetrics import ProjectMetrics
@@ -16,6 +25,9 @@ class TestAnalyzer(TestCase):
         self.mock_config.pip = True
         self.mock_config.npm = False
         self.mock_config.base_path = "/mock/path"
+        self.mock_config.changed = None
+        self.mock_config.trend_store = None
+        self.mock_config.duplicates = False
 
         self.mock_output = MagicMock()
         self.mock_debugger = MagicMock()
@@ -49,6 +61,137 @@ class TestAnalyzer(TestCase):
         self.mock_output.writeln.assert_any_call("<info>Analyzing code...</info>")
         self.mock_output.writeln.assert_any_call("<success>Code analyzed</success>")
 
+    def test_analyze_code_with_workers_equals_serial(self):
+        code = """
+import os
+
+
+class Example:
+    def __init__(self):
+        self.a = 0
+
+    def method(self, b):
+        if b > self.a:
+            return os.path.join("a", "b")
+        return None
+
+
+def function(x):
+    for i in range(x):
+        print(i)
+"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for i in range(3):
+                file = os.path.join(tmp_dir, f"module{i}.py")
+                with open(file, "w") as f:
+                    f.write(code)
+                files.append(file)
+
+            results = []
+            for workers in (1, 2):
+                analyzer = Analyzer(
+                    ProjectConfig("test"), self.mock_output, self.mock_debugger, workers
+                )
+                results.append([m.to_dict() for m in analyzer.analyze_code(files)])
+
+        self.assertEqual(len(results[0]), 3)
+        self.assertEqual(results[0], results[1])
+
+    def test_analyze_code_chunks_only_for_duplicates(self):
+        code = "def f(x):\n    y = x + 1\n    z = y * 2\n    return z\n" * 5
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file = os.path.join(tmp_dir, "module.py")
+            with open(file, "w") as f:
+                f.write(code)
+
+            chunks = []
+            for duplicates in (False, True):
+                config = ProjectConfig("test")
+                config.duplicates = duplicates
+                analyzer = Analyzer(config, self.mock_output, self.mock_debugger)
+                analyzer.analyze_code([file])
+                (module_node,) = analyzer.runners[0].modules.values()
+                chunks.append(len(module_node.code_chunks))
+
+        self.assertEqual(chunks[0], 0)
+        self.assertGreater(chunks[1], 0)
+
+    def test_run_reports_duplicates(self):
+        code = "def f(x):\n    y = x + 1\n    z = y * 2\n    return z\n"
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            files = []
+            for name in ("a", "b"):
+                file = os.path.join(tmp_dir, f"{name}.py")
+                with open(file, "w") as f:
+                    f.write(code)
+                files.append(file)
+
+            reports = []
+            for duplicates in (False, True):
+                config = ProjectConfig("test")
+                config.duplicates = duplicates
+                analyzer = Analyzer(config, self.mock_output, self.mock_debugger)
+                reports.append(analyzer.run(files).to_dict())
+
+        self.assertNotIn("duplicates", reports[0])
+        self.assertEqual(len(reports[1]["duplicates"]), 1)
+        self.assertEqual(
+            {
+                reports[1]["duplicates"][0]["file1"],
+                reports[1]["duplicates"][0]["file2"],
+            },
+            set(files),
+        )
+
+    def test_analyze_code_changed_files_only(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            repo = Repo.init(tmp_dir)
+            files = []
+            for name in ("a", "b", "c"):
+                file = os.path.join(tmp_dir, f"{name}.py")
+                with open(file, "w") as f:
+                    f.write(f"def {name}(x):\n    return x\n")
+                files.append(file)
+            repo.index.add(files)
+            repo.index.commit("base")
+
+            config = ProjectConfig("test")
+            config.base_path = tmp_dir
+            base_metrics = Analyzer(
+                config, self.mock_output, self.mock_debugger
+            ).analyze_code(files)
+            base_report = os.path.join(tmp_dir, "base.json")
+            with open(base_report, "w") as f:
+                json.dump(ProjectMetrics(base_metrics, None, None).to_dict(), f)
+
+            with open(files[1], "w") as f:
+                f.write("def b(x):\n    if x:\n        return x\n    return 0\n")
+            repo.index.add([files[1]])
+            repo.index.commit("change b")
+            repo.close()
+
+            expected = [
+                m.to_dict()
+                for m in Analyzer(
+                    config, self.mock_output, self.mock_debugger
+                ).analyze_code(files)
+            ]
+            config.changed = ChangedConfig()
+            config.changed.base_report = base_report
+            config.changed.range = "HEAD~1"
+            analyzer = Analyzer(config, self.mock_output, self.mock_debugger)
+            with patch.object(
+                AbstractLangAnalyzer,
+                "analyze_file",
+                autospec=True,
+                side_effect=AbstractLangAnalyzer.analyze_file,
+            ) as mock_analyze_file:
+                result = [m.to_dict() for m in analyzer.analyze_code(files)]
+
+        mock_analyze_file.assert_called_once_with(analyzer.runners[0], files[1])
+        self.assertEqual(result, expected)
+
     @patch("metripy.Application.Analyzer.Composer")
     def test_analyze_composer(self, mock_composer):
         mock_dependencies = [MagicMock(spec=Dependency)]
@@ -124,3 +267,104 @@ class TestAnalyzer(TestCase):
         self.assertEqual(result.git_metrics, mock_git_metrics)
         self.assertEqual(result.file_metrics, mock_file_metrics)
         self.assertEqual(result.dependencies, mock_dependencies)
+
+    @patch.object(Analyzer, "_get_pip_dependencies")
+    @patch.object(Analyzer, "_get_git_metrics")
+    @patch.object(Analyzer, "analyze_code")
+    def test_run_concurrent(
+        self, mock_analyze_code, mock_get_git_metrics, mock_get_pip_dependencies
+    ):
+        self.mock_config.history_path = None
+        code_analyzed = threading.Event()
+        mock_git_metrics = MagicMock(spec=GitMetrics)
+        mock_file_metrics = [MagicMock(spec=FileMetrics)]
+        mock_dependencies = [MagicMock(spec=Dependency)]
+
+        def analyze_code(files):
+            code_analyzed.set()
+            return mock_file_metrics
+
+        def get_git_metrics():
+            # only returns if the code is analyzed at the same time
+            self.assertTrue(code_analyzed.wait(timeout=5))
+            return mock_git_metrics
+
+        mock_analyze_code.side_effect = analyze_code
+        mock_get_git_metrics.side_effect = get_git_metrics
+        mock_get_pip_dependencies.return_value = mock_dependencies
+
+        analyzer = Analyzer(
+            self.mock_config, self.mock_output, self.mock_debugger, concurrent=True
+        )
+        with patch.object(ProjectMetrics, "__init__", return_value=None) as mock_init:
+            analyzer.run(["file1.py"])
+
+        mock_init.assert_called_once_with(
+            mock_file_metrics, mock_git_metrics, mock_dependencies, None
+        )
+        self.mock_output.writeln.assert_any_call(
+            "<success>Git history analyzed</success>"
+        )
+
+    @patch.object(Analyzer, "_get_pip_dependencies")
+    @patch.object(Analyzer, "analyze_code")
+    def test_run_concurrent_writes_dependency_warnings_after_code_analysis(
+        self, mock_analyze_code, mock_get_pip_dependencies
+    ):
+        self.mock_config.history_path = None
+        self.mock_config.git = None
+        analyzer = Analyzer(
+            self.mock_config, self.mock_output, self.mock_debugger, concurrent=True
+        )
+        dependencies_analyzed = threading.Event()
+
+        def analyze_code(files):
+            self.assertTrue(dependencies_analyzed.wait(timeout=5))
+            self.assertNotIn(
+                call("<warning>Package 'unknown' has no info section</warning>"),
+                self.mock_output.writeln.call_args_list,
+            )
+            return []
+
+        def get_pip_dependencies():
+            analyzer.dependency_warnings.append("Package 'unknown' has no info section")
+            dependencies_analyzed.set()
+            return []
+
+        mock_analyze_code.side_effect = analyze_code
+        mock_get_pip_dependencies.side_effect = get_pip_dependencies
+
+        with patch.object(ProjectMetrics, "__init__", return_value=None):
+            analyzer.run(["file1.py"])
+
+        self.mock_output.writeln.assert_any_call(
+            "<warning>Package 'unknown' has no info section</warning>"
+        )
+        self.assertEqual(analyzer.dependency_warnings, [])
+
+    @patch.object(Analyzer, "_get_pip_dependencies")
+    @patch.object(Analyzer, "_get_git_metrics")
+    @patch.object(Analyzer, "analyze_code")
+    def test_run_concurrent_prunes_cache_after_background_work(
+        self, mock_analyze_code, mock_get_git_metrics, mock_get_pip_dependencies
+    ):
+        self.mock_config.history_path = None
+        calls = []
+        mock_cache = MagicMock()
+        mock_cache.prune.side_effect = lambda: calls.append("prune")
+        mock_analyze_code.side_effect = lambda files: calls.append("code") or []
+        mock_get_git_metrics.side_effect = lambda: calls.append("git")
+        mock_get_pip_dependencies.side_effect = lambda: calls.append("pip") or []
+
+        analyzer = Analyzer(
+            self.mock_config,
+            self.mock_output,
+            self.mock_debugger,
+            cache=mock_cache,
+            concurrent=True,
+        )
+        with patch.object(ProjectMetrics, "__init__", return_value=None):
+            analyzer.run(["file1.py"])
+
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(calls[-1], "prune")
@@ -69,3 +69,19 @@ class TestApplicationRun(TestCase):
             f"<success>Reports generated for {mock_project_config.name}</success>"
         )
         mock_reporter.generate.assert_called_once_with(mock_metrics)
+
+    @patch("metripy.Application.Application.CliOutput")
+    @patch("metripy.Application.Application.Analyzer")
+    def test_run_invalid_config(self, mock_analyzer, mock_cli_output):
+        mock_output = MagicMock()
+        mock_cli_output.return_value = mock_output
+
+        app = Application()
+        with self.assertRaises(SystemExit) as context:
+            app.run(["metripy", "--workers=abc"])
+        self.assertEqual(context.exception.code, 1)
+
+        mock_output.writeln.assert_called_once_with(
+            "<error>Invalid number of workers: abc, expected a number or auto</error>"
+        )
+        mock_analyzer.assert_not_called()
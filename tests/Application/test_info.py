@@ -0,0 +1,35 @@
+import os
+import tempfile
+from importlib.metadata import PackageNotFoundError
+from unittest import TestCase
+from unittest.mock import patch
+
+import toml
+
+from metripy.Application.Info import PYPROJECT_PATH, Info
+
+
+@patch("metripy.Application.Info.metadata", side_effect=PackageNotFoundError)
+@patch("metripy.Application.Info.version", side_effect=PackageNotFoundError)
+class TestInfo(TestCase):
+    def test_version_of_source_checkout_outside_of_it(self, *mocks):
+        with open(PYPROJECT_PATH) as file:
+            project = toml.load(file)["project"]
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as path:
+            os.chdir(path)
+            try:
+                info = Info()
+            finally:
+                os.chdir(cwd)
+
+        self.assertEqual(info.get_version(), project["version"])
+        self.assertEqual(info.url, project["urls"]["Homepage"])
+
+    def test_version_without_pyproject(self, *mocks):
+        with patch("metripy.Application.Info.PYPROJECT_PATH", "/missing.toml"):
+            info = Info()
+
+        self.assertEqual(info.get_version(), "unknown")
+        self.assertEqual(info.url, "no homepage found")
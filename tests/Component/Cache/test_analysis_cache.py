@@ -0,0 +1,129 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from metripy.Application.Config.CacheConfig import CacheConfig
+from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.Component.Cache.AnalysisCache import AnalysisCache
+from metripy.Dependency.RegistryCache import RegistryCache
+from metripy.Git.GitCommitStore import GitCommitStore
+from metripy.LangAnalyzer.Python.PythonAnalyzer import PythonAnalyzer
+from metripy.Tree.ModuleNode import ModuleNode
+
+
+class TestAnalysisCache(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        config = CacheConfig()
+        config.path = self.temp_dir.name
+        self.cache = AnalysisCache(config, "1.0.0")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_get_key_depends_on_content_language_settings_and_version(self):
+        key = self.cache.get_key("Python", "a.py", "x = 1", "{}")
+
+        self.assertEqual(key, self.cache.get_key("Python", "a.py", "x = 1", "{}"))
+        self.assertNotEqual(key, self.cache.get_key("Python", "a.py", "x = 2", "{}"))
+        self.assertNotEqual(key, self.cache.get_key("PHP", "a.py", "x = 1", "{}"))
+        self.assertNotEqual(key, self.cache.get_key("Python", "b.py", "x = 1", "{}"))
+        self.assertNotEqual(key, self.cache.get_key("Python", "a.py", "x = 1", "[]"))
+
+        other_config = CacheConfig()
+        other_config.path = self.temp_dir.name
+        other_version = AnalysisCache(other_config, "1.0.1")
+        self.assertNotEqual(key, other_version.get_key("Python", "a.py", "x = 1", "{}"))
+
+    def test_get_missing_entry(self):
+        self.assertIsNone(
+            self.cache.get(self.cache.get_key("Python", "a.py", "", "{}"))
+        )
+
+    def test_set_and_get(self):
+        key = self.cache.get_key("Python", "a.py", "x = 1", "{}")
+        self.cache.set(key, ModuleNode("a.py", 1, 1, 1, 0, 0, 0, 0))
+
+        module_node = self.cache.get(key)
+
+        self.assertIsInstance(module_node, ModuleNode)
+        self.assertEqual(module_node.full_name, "a.py")
+        self.assertEqual(module_node.loc, 1)
+
+    def test_get_broken_entry(self):
+        key = self.cache.get_key("Python", "a.py", "x = 1", "{}")
+        self.cache.set(key, ModuleNode("a.py", 1, 1, 1, 0, 0, 0, 0))
+        with open(self.cache._get_entry_path(key), "wb") as file:
+            file.write(b"broken")
+
+        self.assertIsNone(self.cache.get(key))
+
+    def test_prune_removes_least_recently_used(self):
+        self.cache.max_size = 0
+        keys = [self.cache.get_key("Python", f"{i}.py", "", "{}") for i in range(3)]
+        for i, key in enumerate(keys):
+            self.cache.set(key, ModuleNode(f"{i}.py", 1, 1, 1, 0, 0, 0, 0))
+            os.utime(self.cache._get_entry_path(key), (i, i))
+        entry_size = os.path.getsize(self.cache._get_entry_path(keys[2]))
+        self.cache.max_size = entry_size * 2
+
+        self.cache.prune()
+
+        self.assertIsNone(self.cache.get(keys[0]))
+        self.assertIsNotNone(self.cache.get(keys[1]))
+        self.assertIsNotNone(self.cache.get(keys[2]))
+
+    def test_prune_counts_git_commits(self):
+        key = self.cache.get_key("Python", "a.py", "", "{}")
+        self.cache.set(key, ModuleNode("a.py", 1, 1, 1, 0, 0, 0, 0))
+        store = GitCommitStore(self.cache.get_git_commits_path())
+        store.add({"sha": "abc", "files": {}})
+        store.save()
+        git_commits_path = self.cache.get_git_commits_path()
+        os.utime(git_commits_path, (0, 0))
+        self.cache.max_size = os.path.getsize(self.cache._get_entry_path(key))
+
+        self.cache.prune()
+
+        self.assertFalse(os.path.exists(git_commits_path))
+        self.assertIsNotNone(self.cache.get(key))
+
+    def test_prune_counts_registry_documents(self):
+        key = self.cache.get_key("Python", "a.py", "", "{}")
+        self.cache.set(key, ModuleNode("a.py", 1, 1, 1, 0, 0, 0, 0))
+        registry = RegistryCache(self.cache.get_registry_path(), 60)
+        registry.set("https://pypi.org/pypi/package/json", "{}")
+        registry_path = registry._get_entry_path("https://pypi.org/pypi/package/json")
+        os.utime(registry_path, (0, 0))
+        self.cache.max_size = os.path.getsize(self.cache._get_entry_path(key))
+
+        self.cache.prune()
+
+        self.assertFalse(os.path.exists(registry_path))
+        self.assertIsNotNone(self.cache.get(key))
+
+    def test_loading_git_commits_marks_them_used(self):
+        store = GitCommitStore(self.cache.get_git_commits_path())
+        store.add({"sha": "abc", "files": {}})
+        store.save()
+        os.utime(self.cache.get_git_commits_path(), (0, 0))
+
+        self.assertIsNotNone(
+            GitCommitStore(self.cache.get_git_commits_path()).get("abc")
+        )
+        self.assertGreater(os.path.getmtime(self.cache.get_git_commits_path()), 0)
+
+    def test_analysis_settings_change_invalidates_entries(self):
+        filename = os.path.join(self.temp_dir.name, "module.py")
+        with open(filename, "w") as file:
+            file.write("import os\n\n\ndef someFunction():\n    return 1\n")
+        project_config = ProjectConfig("project")
+
+        analyzer = PythonAnalyzer(project_config)
+        analyzer.set_cache(self.cache)
+        self.assertGreater(len(analyzer.analyze_file(filename).code_smells), 0)
+
+        project_config.code_smells.disable_all()
+        analyzer = PythonAnalyzer(project_config)
+        analyzer.set_cache(self.cache)
+        self.assertEqual(len(analyzer.analyze_file(filename).code_smells), 0)
@@ -0,0 +1,203 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from git import Repo
+
+from metripy.Application.Config.ProjectConfig import ProjectConfig
+from metripy.Component.File.Finder import Finder
+
+
+class TestFinder(TestCase):
+    FILES = [
+        "main.py",
+        "main.test.py",
+        "README.md",
+        "src/app.py",
+        "src/generated/model.py",
+        "src/build/out.py",
+        "build/lib/app.py",
+        "node_modules/package/index.py",
+        "lib/vendor/package.py",
+    ]
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_path = self.temp_dir.name
+        for file in self.FILES:
+            self._write(file, "")
+        self.config = ProjectConfig("test")
+        self.config.base_path = self.base_path
+        self.config.includes = ["./"]
+        self.config.extensions = ["py"]
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _write(self, file: str, content: str) -> None:
+        path = os.path.join(self.base_path, file)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+
+    def _fetch(self) -> list[str]:
+        files = Finder().fetch([self.config])["test"]
+        return sorted(
+            os.path.relpath(file, self.base_path).replace(os.sep, "/") for file in files
+        )
+
+    def test_fetch(self):
+        self.assertEqual(
+            self._fetch(), sorted(f for f in self.FILES if f.endswith(".py"))
+        )
+
+    def test_fetch_excludes_names(self):
+        self.config.excludes = ["node_modules", "build", "main.py"]
+
+        self.assertEqual(
+            self._fetch(),
+            [
+                "lib/vendor/package.py",
+                "main.test.py",
+                "src/app.py",
+                "src/generated/model.py",
+            ],
+        )
+
+    def test_fetch_excludes_patterns(self):
+        self.config.excludes = ["*.test.py", "/build/", "src/generated", "**/vendor"]
+
+        self.assertEqual(
+            self._fetch(),
+            [
+                "main.py",
+                "node_modules/package/index.py",
+                "src/app.py",
+                "src/build/out.py",
+            ],
+        )
+
+    def test_fetch_excludes_single_file_include(self):
+        self.config.includes = ["main.py", "main.test.py"]
+        self.config.excludes = ["*.test.py"]
+
+        self.assertEqual(self._fetch(), ["main.py"])
+
+    def test_fetch_gitignore(self):
+        self._write(".gitignore", "node_modules/\nbuild/\n")
+        self._write("src/.gitignore", "generated/\n")
+        self._write(".git/hooks/hook.py", "")
+
+        self.assertIn(".git/hooks/hook.py", self._fetch())
+
+        self.config.gitignore = True
+        self.assertEqual(
+            self._fetch(),
+            ["lib/vendor/package.py", "main.py", "main.test.py", "src/app.py"],
+        )
+
+    def test_fetch_gitignore_of_parent_directory(self):
+        self._write(".gitignore", "*.py\n!app.py\n")
+        self.config.includes = ["src"]
+        self.config.gitignore = True
+
+        self.assertEqual(self._fetch(), ["src/app.py"])
+
+    def test_fetch_gitignore_nested_negation(self):
+        self._write(".gitignore", "*.test.py\nvendor/\n")
+        self._write("src/.gitignore", "!*.test.py\n")
+        self._write("src/app.test.py", "")
+        self._write("lib/.gitignore", "!vendor/\n")
+        self.config.gitignore = True
+
+        self.assertEqual(
+            self._fetch(),
+            [
+                "build/lib/app.py",
+                "lib/vendor/package.py",
+                "main.py",
+                "node_modules/package/index.py",
+                "src/app.py",
+                "src/app.test.py",
+                "src/build/out.py",
+                "src/generated/model.py",
+            ],
+        )
+
+    def test_fetch_keeps_walk_order(self):
+        def walk(path: str):
+            for name in os.listdir(path):
+                if os.path.isdir(os.path.join(path, name)):
+                    yield from walk(os.path.join(path, name))
+                elif name.endswith("py"):
+                    yield os.path.join(path, name)
+
+        files = Finder().fetch([self.config])["test"]
+
+        self.assertEqual(files, list(walk(os.path.join(self.base_path, "./"))))
+
+    def _init_repo(self) -> None:
+        self._write(".gitignore", "build/\n")
+        repo = Repo.init(self.base_path)
+        repo.index.add([f for f in self.FILES if not f.startswith("node_modules")])
+        repo.index.add([".gitignore"])
+        repo.index.commit("init")
+        repo.close()
+        os.remove(os.path.join(self.base_path, "lib/vendor/package.py"))
+
+    def test_fetch_git(self):
+        self._init_repo()
+        self.config.source = "git"
+        self.config.excludes = ["*.test.py"]
+
+        self.assertEqual(
+            self._fetch(),
+            [
+                "build/lib/app.py",
+                "main.py",
+                "src/app.py",
+                "src/build/out.py",
+                "src/generated/model.py",
+            ],
+        )
+
+    def test_fetch_git_untracked(self):
+        self._init_repo()
+        self._write("src/new.py", "")
+        self._write("build/new.py", "")
+        self.config.source = "git"
+        self.config.untracked = True
+        self.config.includes = ["src/", "main.py"]
+
+        self.assertEqual(
+            self._fetch(),
+            [
+                "main.py",
+                "src/app.py",
+                "src/build/out.py",
+                "src/generated/model.py",
+                "src/new.py",
+            ],
+        )
+
+    def test_fetch_git_paths_equal_filesystem_paths(self):
+        self._init_repo()
+        self.config.includes = ["src/"]
+        files = Finder().fetch([self.config])["test"]
+
+        self.config.source = "git"
+
+        self.assertEqual(sorted(Finder().fetch([self.config])["test"]), sorted(files))
+
+    def test_fetch_git_without_repository_walks_files(self):
+        self.config.source = "git"
+
+        self.assertEqual(
+            self._fetch(), sorted(f for f in self.FILES if f.endswith(".py"))
+        )
+
+    def test_fetch_unknown_source(self):
+        self.config.source = "svn"
+
+        with self.assertRaises(ValueError):
+            Finder().fetch([self.config])
@@ -0,0 +1,249 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+
+import requests
+
+from metripy.Dependency.Composer.Composer import Composer
+from metripy.Dependency.Composer.Packegist import Packegist
+from metripy.Dependency.Npm.Npm import Npm
+from metripy.Dependency.Npm.NpmOrg import NpmOrg
+from metripy.Dependency.Pip.Pip import Pip
+from metripy.Dependency.Pip.PyPi import PyPi
+from metripy.Dependency.RegistryCache import RegistryCache
+from metripy.Dependency.RegistryClient import RegistryClient
+
+
+class RegistryStub:
+    """local http server answering registry requests with canned json"""
+
+    def __init__(self, routes: dict[str, dict]):
+        # path => json body, paths not in routes answer 404
+        self.routes = routes
+        # path => status codes answered before the json body
+        self.failures: dict[str, list[int]] = {}
+        self.requests: list[str] = []
+        # path => ETag of the json body, requests with a matching etag get a 304
+        self.etags: dict[str, str] = {}
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stub.requests.append(self.path)
+                failures = stub.failures.get(self.path)
+                if failures:
+                    self._send(failures.pop(0), {})
+                elif (
+                    self.path in stub.etags
+                    and self.headers.get("If-None-Match") == stub.etags[self.path]
+                ):
+                    self.send_response(304)
+                    self.end_headers()
+                elif self.path in stub.routes:
+                    self._send(200, stub.routes[self.path])
+                else:
+                    self._send(404, {})
+
+            def _send(self, status: int, data: dict):
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if self.path in stub.etags:
+                    self.send_header("ETag", stub.etags[self.path])
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever, args=(0.01,), daemon=True
+        )
+
+    def __enter__(self) -> "RegistryStub":
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class TestRegistryClient(TestCase):
+    def setUp(self):
+        self.client = RegistryClient(backoff_factor=0)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_get(self):
+        with RegistryStub({"/a": {"name": "a"}}) as stub:
+            response = self.client.get(f"{stub.url}/a")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"name": "a"})
+
+    def test_get_retries_server_errors(self):
+        with RegistryStub({"/a": {"name": "a"}}) as stub:
+            stub.failures["/a"] = [503, 502]
+            response = self.client.get(f"{stub.url}/a")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(stub.requests, ["/a", "/a", "/a"])
+
+    def test_get_returns_last_response_after_retries(self):
+        with RegistryStub({"/a": {"name": "a"}}) as stub:
+            stub.failures["/a"] = [503] * 10
+            response = self.client.get(f"{stub.url}/a")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(len(stub.requests), RegistryClient.RETRIES + 1)
+
+    def test_get_does_not_retry_not_found(self):
+        with RegistryStub({}) as stub:
+            response = self.client.get(f"{stub.url}/missing")
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(stub.requests, ["/missing"])
+
+    def test_get_times_out(self):
+        client = RegistryClient(timeout=0.2, retries=0)
+        with RegistryStub({}) as stub:
+            stub.server.RequestHandlerClass.do_GET = lambda handler: time.sleep(1)
+            with self.assertRaises(requests.RequestException):
+                client.get(f"{stub.url}/slow")
+        client.close()
+
+    def test_map_keeps_order(self):
+        routes = {f"/{i}": {"index": i} for i in range(20)}
+        with RegistryStub(routes) as stub:
+            results = self.client.map(
+                lambda i: self.client.get(f"{stub.url}/{i}").json()["index"],
+                range(20),
+            )
+
+        self.assertEqual(results, list(range(20)))
+
+    def test_pip_dependencies(self):
+        routes = {
+            f"/pypi/package-{i}/json": {
+                "info": {"summary": f"package {i}", "version": "2.0"},
+                "releases": {},
+            }
+            for i in range(10)
+        }
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "requirements.txt"), "w") as file:
+                file.writelines(f"package-{i}==1.0\n" for i in range(10))
+            with RegistryStub(routes) as stub:
+                dependencies = Pip(PyPi(self.client, stub.url)).get_dependencies(path)
+
+        self.assertEqual(
+            [d.name for d in dependencies], [f"package-{i}" for i in range(10)]
+        )
+        self.assertEqual(dependencies[3].description, "package 3")
+        self.assertEqual(dependencies[3].status, "outdated")
+
+    def test_npm_dependencies_skip_unknown(self):
+        routes = {"/known": {"description": "known", "dist-tags": {"latest": "1.0"}}}
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "package.json"), "w") as file:
+                json.dump({"dependencies": {"known": "1.0", "unknown": "1.0"}}, file)
+            with RegistryStub(routes) as stub:
+                dependencies = Npm(NpmOrg(self.client, stub.url)).get_dependencies(path)
+
+        self.assertEqual([d.name for d in dependencies], ["known"])
+        self.assertEqual(dependencies[0].status, "latest")
+
+    def test_npm_without_dependencies(self):
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "package.json"), "w") as file:
+                json.dump({}, file)
+
+            self.assertEqual(Npm(NpmOrg(self.client)).get_dependencies(path), [])
+
+    def test_composer_dependencies(self):
+        package = {
+            "type": "library",
+            "description": "vendor package",
+            "repository": "https://example.com/vendor/package",
+            "github_stars": 1,
+            "downloads": {"total": 3, "monthly": 2, "daily": 1},
+            "versions": {"v1.2.0": {"license": ["MIT"]}, "dev-main": {}},
+        }
+        routes = {"/packages/vendor/package.json": {"package": package}}
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "composer.json"), "w") as file:
+                json.dump({"require": {"vendor/package": "1.2.0", "php": "8"}}, file)
+            with RegistryStub(routes) as stub:
+                dependencies = Composer(
+                    Packegist(self.client, stub.url)
+                ).get_composer_dependencies(path)
+
+        self.assertEqual([d.name for d in dependencies], ["vendor/package"])
+        self.assertEqual(dependencies[0].latest, "1.2.0")
+        self.assertEqual(dependencies[0].status, "latest")
+
+    def test_get_uses_fresh_cache_entry(self):
+        with tempfile.TemporaryDirectory() as path:
+            client = RegistryClient(cache=RegistryCache(path, 60))
+            with RegistryStub({"/a": {"name": "a"}}) as stub:
+                client.get(f"{stub.url}/a")
+                response = client.get(f"{stub.url}/a")
+            client.close()
+
+        self.assertEqual(response.json(), {"name": "a"})
+        self.assertEqual(stub.requests, ["/a"])
+
+    def test_get_revalidates_stale_cache_entry(self):
+        with tempfile.TemporaryDirectory() as path:
+            client = RegistryClient(cache=RegistryCache(path, 0))
+            with RegistryStub({"/a": {"name": "a"}}) as stub:
+                stub.etags["/a"] = '"v1"'
+                client.get(f"{stub.url}/a")
+                stub.routes["/a"] = {"name": "changed"}
+                unchanged = client.get(f"{stub.url}/a")
+                stub.etags["/a"] = '"v2"'
+                changed = client.get(f"{stub.url}/a")
+            client.close()
+
+        self.assertEqual(unchanged.status_code, 200)
+        self.assertEqual(unchanged.json(), {"name": "a"})
+        self.assertEqual(changed.json(), {"name": "changed"})
+        self.assertEqual(len(stub.requests), 3)
+
+    def test_get_offline(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = RegistryCache(path, 0)
+            with RegistryStub({"/a": {"name": "a"}}) as stub:
+                RegistryClient(cache=cache).get(f"{stub.url}/a")
+                client = RegistryClient(cache=cache, offline=True)
+                cached = client.get(f"{stub.url}/a")
+                missing = client.get(f"{stub.url}/b")
+
+        self.assertEqual(cached.json(), {"name": "a"})
+        self.assertEqual(missing.status_code, RegistryClient.OFFLINE_STATUS)
+        self.assertEqual(stub.requests, ["/a"])
+
+    def test_pip_dependencies_offline(self):
+        routes = {"/pypi/package/json": {"info": {"version": "1.0"}, "releases": {}}}
+        with tempfile.TemporaryDirectory() as path:
+            with open(os.path.join(path, "requirements.txt"), "w") as file:
+                file.write("package==1.0\nunknown==1.0\n")
+            cache = RegistryCache(os.path.join(path, "registry"), 60)
+            with RegistryStub(routes) as stub:
+                Pip(PyPi(RegistryClient(cache=cache), stub.url)).get_dependencies(path)
+            registry = PyPi(RegistryClient(cache=cache, offline=True), stub.url)
+            dependencies = Pip(registry).get_dependencies(path)
+
+        self.assertEqual([d.status for d in dependencies], ["latest", "unknown"])
+        self.assertEqual(registry.warnings, ["Package 'unknown' has no info section"])
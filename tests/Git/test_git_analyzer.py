@@ -0,0 +1,95 @@
+import os
+import tempfile
+from datetime import datetime, timedelta
+from unittest import TestCase
+from unittest.mock import patch
+
+from git import Actor, Repo
+
+from metripy.Application.Config.GitConfig import GitConfig
+from metripy.Git.GitAnalyzer import GitAnalyzer
+from metripy.Git.GitCommitStore import GitCommitStore
+
+
+class TestGitAnalyzer(TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.repo_path = os.path.join(self.temp_dir.name, "repo")
+        repo = Repo.init(self.repo_path, initial_branch="main")
+        date = datetime.now() - timedelta(days=40)
+        for i, (author, content) in enumerate(
+            [("Alice", "a = 1\n"), ("Bob", "a = 1\nb = 2\n"), ("Alice", "b = 2\n")]
+        ):
+            with open(os.path.join(self.repo_path, "main.py"), "w") as file:
+                file.write(content)
+            with open(os.path.join(self.repo_path, "README.md"), "w") as file:
+                file.write(f"readme {i}\n")
+            repo.index.add(["main.py", "README.md"])
+            commit_date = (date + timedelta(days=i * 10)).strftime("%Y-%m-%dT%H:%M:%S")
+            repo.index.commit(
+                f"commit {i}",
+                author=Actor(author, f"{author}@example.com"),
+                committer=Actor(author, f"{author}@example.com"),
+                author_date=commit_date,
+                commit_date=commit_date,
+            )
+        self.repo = repo
+        self.config = GitConfig()
+        self.config.repo = self.repo_path
+        self.store_path = os.path.join(self.temp_dir.name, "git_commits.jsonl")
+
+    def tearDown(self):
+        self.repo.close()
+        self.temp_dir.cleanup()
+
+    def test_analyze(self):
+        metrics = GitAnalyzer(self.config).analyze().to_dict()
+
+        self.assertEqual(sum(metrics["commit_stats_per_month"].values()), 3)
+        contributors = metrics["contributors"]
+        self.assertEqual(contributors["Alice"]["commits_count"], 2)
+        self.assertEqual(contributors["Bob"]["commits_count"], 1)
+        self.assertEqual(contributors["Bob"]["lines_added"], 2)
+        self.assertEqual(contributors["Bob"]["lines_removed"], 1)
+
+    def test_analyze_with_store_only_reads_new_commits(self):
+        expected = GitAnalyzer(self.config).analyze().to_dict()
+
+        GitAnalyzer(self.config, GitCommitStore(self.store_path)).analyze()
+        with patch.object(GitAnalyzer, "_read_commit") as mock_read_commit:
+            metrics = GitAnalyzer(
+                self.config, GitCommitStore(self.store_path)
+            ).analyze()
+
+        mock_read_commit.assert_not_called()
+        self.assertEqual(metrics.to_dict(), expected)
+
+    def test_analyze_log_backend_equals_gitpython_backend(self):
+        expected = GitAnalyzer(self.config).analyze().to_dict()
+
+        self.config.backend = "log"
+        metrics = GitAnalyzer(self.config).analyze().to_dict()
+
+        self.assertEqual(metrics, expected)
+
+    def test_log_backend_fills_store(self):
+        self.config.backend = "log"
+        GitAnalyzer(self.config, GitCommitStore(self.store_path)).analyze()
+
+        store = GitCommitStore(self.store_path)
+
+        self.assertEqual(len(store.commits), 3)
+
+    def test_unknown_backend(self):
+        self.config.backend = "svn"
+        with self.assertRaises(ValueError):
+            GitAnalyzer(self.config)
+
+    def test_store_ignores_broken_lines(self):
+        GitAnalyzer(self.config, GitCommitStore(self.store_path)).analyze()
+        with open(self.store_path, "a") as file:
+            file.write('{"sha": "abc", "mon')
+
+        store = GitCommitStore(self.store_path)
+
+        self.assertEqual(len(store.commits), 3)
@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from metripy.LangAnalyzer.Php.Ast.PhpAstParser import PhpAstParser
+from metripy.LangAnalyzer.Python.Ast.PythonAstParser import PythonAstParser
+
+
+class TestAstParser(TestCase):
+    code = """
+from os import path
+import sys
+
+class Foo:
+    def bar(self, a):
+        if a and sys.argv:
+            return path.join(a)
+        return None
+
+def qux():
+    pass
+"""
+
+    def setUp(self):
+        self.parser = PythonAstParser()
+        self.parser.parse(self.code)
+
+    def _walk(self, node):
+        yield node
+        for child in node.children:
+            yield from self._walk(child)
+
+    def _find(self, node_types, root):
+        return [node for node in self._walk(root) if node.type in node_types]
+
+    def test_queries_are_compiled_once_per_language(self):
+        other = PythonAstParser()
+
+        self.assertIs(other.get_query("functions"), self.parser.get_query("functions"))
+        self.assertIsNot(
+            PhpAstParser().get_query("functions"),
+            self.parser.get_query("functions"),
+        )
+
+    def test_capture_groups_by_capture_name(self):
+        captures = self.parser.capture("imports")
+
+        self.assertEqual(
+            [node.type for node in captures["import"]], ["import_statement"]
+        )
+        self.assertEqual(
+            [node.type for node in captures["import_from"]], ["import_from_statement"]
+        )
+        # statements first, same as before queries
+        self.assertEqual(
+            [node.type for node in self.parser.get_import_nodes()],
+            ["import_statement", "import_from_statement"],
+        )
+
+    def test_capture_returns_copies(self):
+        self.parser.get_function_nodes().clear()
+
+        self.assertEqual(len(self.parser.get_function_nodes()), 2)
+
+    def test_find_nodes_by_types(self):
+        root = self.parser.tree.root_node
+        types = ["if_statement", "boolean_operator", "and", "return_statement"]
+
+        self.assertEqual(
+            self.parser.find_nodes_by_types(types), self._find(types, root)
+        )
+        function_node = self.parser.get_function_nodes()[0]
+        self.assertEqual(
+            self.parser.find_nodes_by_types(types, function_node),
+            self._find(types, function_node),
+        )
+
+    def test_find_nodes_by_unknown_type(self):
+        self.assertEqual(self.parser.find_nodes_by_type("unknown_type"), [])
+        self.assertEqual(
+            len(self.parser.find_nodes_by_types(["unknown_type", "class_definition"])),
+            1,
+        )
+
+    def test_walk_tree(self):
+        class_node = self.parser.get_class_nodes()[0]
+
+        self.assertEqual(
+            list(self.parser.walk_tree(class_node)), list(self._walk(class_node))
+        )
+        self.assertEqual(
+            list(self.parser.walk_tree()), list(self._walk(self.parser.tree.root_node))
+        )
+
+    def test_parse_resets_captures(self):
+        self.assertEqual(len(self.parser.get_function_nodes()), 2)
+        self.parser.parse("x = 1")
+
+        self.assertEqual(self.parser.get_function_nodes(), [])
+        self.assertEqual(self.parser.find_nodes_by_type("function_definition"), [])
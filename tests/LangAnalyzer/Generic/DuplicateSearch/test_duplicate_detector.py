@@ -1,8 +1,12 @@
+import os
+import random
+import tempfile
 from unittest import TestCase
 
 from simhash import Simhash
 
 from metripy.LangAnalyzer.Generic.DuplicateSearch.CodeChunk import CodeChunk
+from metripy.LangAnalyzer.Generic.DuplicateSearch.CodeChunkArray import CodeChunkArray
 from metripy.LangAnalyzer.Generic.DuplicateSearch.DuplicateDetector import (
     DuplicateDetector,
 )
@@ -231,9 +235,14 @@ def func():
         detector.add_code("exact1.py", exact)
         detector.add_code("exact2.py", exact)
         detector.add_code("near.py", near)
+        detector.add_code("different.py", different)
 
         duplicates = detector.get_duplicates(min_similarity=70.0)
 
+        self.assertGreater(len(duplicates), 0)
+        for duplicate in duplicates:
+            self.assertNotIn("different.py", (duplicate["file1"], duplicate["file2"]))
+
         # Should be sorted by similarity descending
         if len(duplicates) > 1:
             for i in range(len(duplicates) - 1):
@@ -581,6 +590,65 @@ line 5"""
         extracted = detector._extract_code_lines("nonexistent.py", 1, 3)
         self.assertEqual(extracted, "")
 
+    def test_add_chunks_reads_code_from_disk(self):
+        """Test that chunks of other processes are reported with code from disk"""
+        code = """def calculate_sum(a, b):
+    result = a + b
+    print(result)
+    return result"""
+        detector = DuplicateDetector(chunk_size=5, min_lines=3)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for name in ("file1.py", "file2.py"):
+                filename = os.path.join(temp_dir, name)
+                with open(filename, "w") as f:
+                    f.write(code)
+                detector.add_chunks(filename, detector.get_chunks(code))
+
+            self.assertEqual(detector.file_contents, {})
+            duplicates = detector.get_duplicates(min_similarity=95.0)
+
+        self.assertEqual(len(duplicates), 1)
+        self.assertEqual(duplicates[0]["code1"], code)
+        self.assertEqual(duplicates[0]["code2"], code)
+
+    def test_candidate_pairs_equal_all_pairs(self):
+        """Test that the hash index finds exactly the pairs of a full comparison"""
+        rng = random.Random(42)
+        detector = DuplicateDetector()
+        # clusters of similar hashes plus random noise
+        base = 0
+        for i in range(300):
+            if i % 10 == 0:
+                base = rng.getrandbits(64)
+            value = base
+            for _ in range(rng.randint(0, 12)):
+                value ^= 1 << rng.randrange(64)
+            chunks = CodeChunkArray()
+            chunks.append(0, i, i + 4, value)
+            detector.add_chunks(f"file{i % 7}.py", chunks)
+
+        chunks = detector.chunks
+        for max_distance in (0, 3, 9, 20, 64):
+            expected = {
+                (i, j)
+                for i in range(len(chunks))
+                for j in range(i + 1, len(chunks))
+                if chunks[i].filename != chunks[j].filename
+                and chunks[i].hash_value.distance(chunks[j].hash_value) <= max_distance
+            }
+            pairs = list(detector._get_candidate_pairs(max_distance))
+
+            self.assertEqual(len(pairs), len(set(pairs)))
+            self.assertEqual(set(pairs), expected)
+
+    def test_get_max_distance(self):
+        """Test the translation of similarity into hamming distance"""
+        detector = DuplicateDetector()
+        self.assertEqual(detector._get_max_distance(100.0), 0)
+        self.assertEqual(detector._get_max_distance(85.0), 9)
+        self.assertEqual(detector._get_max_distance(0.0), 64)
+        self.assertEqual(detector._get_max_distance(101.0), -1)
+
 
 class TestCodeChunk(TestCase):
     """Test cases for CodeChunk class"""
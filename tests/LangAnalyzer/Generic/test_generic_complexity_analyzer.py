@@ -0,0 +1,137 @@
+from unittest import TestCase
+
+from metripy.LangAnalyzer.Generic.Ast.AstParserFactory import AstParserFactory
+from metripy.LangAnalyzer.Generic.Metrics.CognitiveComplexityAnalyzerFactory import (
+    CognitiveComplexityAnalyzerFactory,
+)
+from metripy.LangAnalyzer.Generic.Metrics.CyclomaticComplexityAnalyzerFactory import (
+    CyclomaticComplexityAnalyzerFactory,
+)
+from metripy.LangAnalyzer.Generic.Metrics.GenericComplexityAnalyzer import (
+    GenericComplexityAnalyzer,
+)
+
+
+class TestGenericComplexityAnalyzer(TestCase):
+    PYTHON_SCRIPT = """
+def outer(items):
+    for item in items:
+        def inner():
+            if item:
+                while item:
+                    pass
+        if item:
+            pass
+        else:
+            def skipped():
+                if item:
+                    pass
+
+class Example:
+    def method(self):
+        def closure():
+            if self:
+                try:
+                    pass
+                except Exception:
+                    pass
+        return closure
+"""
+
+    PHP_SCRIPT = """<?php
+class Example {
+    public function method($x) {
+        if ($x) {
+            foo();
+        } else if ($y) {
+            if ($z) { bar(); }
+        } else {
+            $f = function() { if ($a && $b) { for (;;) {} } };
+        }
+        foreach ($x as $item) {
+            $g = function($k) {
+                switch ($k) { case 1: break; default: return; }
+            };
+        }
+    }
+}
+function outer() {
+    if (1) {
+        function inner() { if (2) { while (3) {} } else if (4) {} }
+    }
+}
+"""
+
+    TYPESCRIPT_SCRIPT = """
+class Example {
+    method(x: number) {
+        if (x) {
+            const a = () => { if (x) { for (;;) {} } else if (y) { while (1) {} } };
+        } else {
+            const b = () => { try {} catch (e) { if (e) {} } };
+        }
+        [1].map((v) => { if (v) { switch (v) { case 1: break; } } });
+    }
+}
+function outer() {
+    function inner() { if (1) { const q = () => { while (1) { if (2) {} } }; } }
+    if (3) { inner(); } else if (4) {} else { function dead() { if (5) {} } }
+}
+"""
+
+    def _calculate(self, language: str, code: str):
+        parser = AstParserFactory.get_ast_parser(language)
+        parser.parse(code)
+        cyclomatic = (
+            CyclomaticComplexityAnalyzerFactory.get_cyclomatic_complexity_analyzer(
+                language
+            )
+        )
+        cognitive = (
+            CognitiveComplexityAnalyzerFactory.get_cognitive_complexity_analyzer(
+                language
+            )
+        )
+        analyzer = GenericComplexityAnalyzer(cyclomatic, cognitive)
+
+        expected = (
+            cyclomatic.calculate(parser),
+            cognitive.calculate_for_all_functions(parser),
+        )
+        return analyzer.calculate(parser), expected
+
+    def test_python_nested_functions(self):
+        (cyclomatic, cognitive), expected = self._calculate(
+            "Python", self.PYTHON_SCRIPT
+        )
+
+        self.assertEqual((cyclomatic, cognitive), expected)
+        self.assertEqual(
+            cognitive, {"outer": 8, "inner": 3, "skipped": 1, "method": 6, "closure": 6}
+        )
+        self.assertEqual(
+            [function["complexity"] for function in cyclomatic["functions"]], [7, 3, 2]
+        )
+        self.assertEqual(
+            [
+                (method["name"], method["complexity"])
+                for method in cyclomatic["classes"][0]["methods"]
+            ],
+            [("method", 4), ("closure", 4)],
+        )
+
+    def test_php_else_if_chains_and_closures(self):
+        result, expected = self._calculate("PHP", self.PHP_SCRIPT)
+
+        self.assertEqual(result, expected)
+
+    def test_typescript_arrow_functions(self):
+        result, expected = self._calculate("Typescript", self.TYPESCRIPT_SCRIPT)
+
+        self.assertEqual(result, expected)
+
+    def test_empty_file(self):
+        (cyclomatic, cognitive), _ = self._calculate("Python", "")
+
+        self.assertEqual(cyclomatic, {"classes": [], "functions": []})
+        self.assertEqual(cognitive, {})
@@ -60,3 +60,21 @@ class TestGenericHalSteadAnalyzer(TestCase):
         self.assertEqual(metrics["calculated_length"], 97.21928094887363)
         self.assertEqual(metrics["bugs"], 0.07678134626668279)
         self.assertEqual(metrics["time"], 194.21955779819095)
+
+    def test_calculate_for_line_ranges(self):
+        lines = self.EXAMPLE_CODE.split("\n")
+        # nested, equal, overlapping without nesting, empty and out of bounds
+        line_ranges = [(0, 17), (1, 3), (4, 9), (4, 9), (6, 8), (8, 12), (5, 5)]
+        line_ranges.append((15, 40))
+
+        metrics = self.analyzer.calculate_for_line_ranges(
+            self.EXAMPLE_CODE, line_ranges
+        )
+
+        self.assertEqual(len(metrics), len(line_ranges))
+        for (start, end), range_metrics in zip(line_ranges, metrics):
+            self.assertEqual(
+                range_metrics,
+                self.analyzer.calculate_halstead_metrics("\n".join(lines[start:end])),
+            )
+        self.assertEqual(self.analyzer.calculate_for_line_ranges("", []), [])
@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+from metripy.LangAnalyzer.Generic.Metrics.GenericLcom4Analyzer import (
+    GenericLcom4Analyzer,
+)
+
+
+class TestGenericLcom4Analyzer(TestCase):
+    def test_shared_attributes_connect_methods(self):
+        method_attributes = {
+            "a": {"self.x"},
+            "b": {"self.y"},
+            "c": {"self.x", "self.y"},
+            "d": {"self.z"},
+        }
+
+        self.assertEqual(GenericLcom4Analyzer._count_components(method_attributes), 2)
+
+    def test_calls_connect_in_call_direction(self):
+        # components are collected from the last method on
+        self.assertEqual(
+            GenericLcom4Analyzer._count_components({"b": set(), "a": {"b"}}), 1
+        )
+        self.assertEqual(
+            GenericLcom4Analyzer._count_components({"a": {"b"}, "b": set()}), 2
+        )
+
+    def test_calls_reach_methods_sharing_attributes(self):
+        method_attributes = {
+            "c": {"self.x"},
+            "b": {"self.x"},
+            "a": {"b"},
+            "d": {"a"},
+        }
+
+        self.assertEqual(GenericLcom4Analyzer._count_components(method_attributes), 1)
+
+    def test_no_methods(self):
+        self.assertEqual(GenericLcom4Analyzer._count_components({}), 0)
@@ -0,0 +1,34 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from metripy.Application.Config.CodeSmellConfig import CodeSmellConfig
+from metripy.LangAnalyzer.Python.Ast.PythonAstParser import PythonAstParser
+from metripy.LangAnalyzer.Python.CodeSmell.PythonCodeSmellDetector import (
+    PythonCodeSmellDetector,
+)
+
+
+class TestPythonCodeSmellDetector(TestCase):
+    code = """
+import os
+
+class badName:
+    def method(self, a, b, c, d, e, f):
+        return a
+"""
+
+    def test_detect_all_reuses_parsed_tree(self):
+        detector = PythonCodeSmellDetector(CodeSmellConfig())
+        expected = detector.detect_all("test.py", self.code)
+
+        parser = PythonAstParser()
+        parser.parse(self.code)
+        with patch.object(parser, "parse") as mock_parse:
+            smells = detector.detect_all("test.py", self.code, parser)
+
+        mock_parse.assert_not_called()
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(
+            [smell.to_dict() for smell in smells],
+            [smell.to_dict() for smell in expected],
+        )
@@ -81,3 +81,13 @@ class TestPythonLcom4Analyzer(TestCase):
         parser.parse(self.CODE_LCOM4_2)
         result = self.analyzer.get_lcom4(parser)
         self.assertEqual(result["Example"], 2)
+
+    def test_get_lcom4_large_generated_class(self):
+        methods = "".join(
+            f"    def field_{i}(self):\n        return self.value\n\n"
+            for i in range(3000)
+        )
+        parser = PythonAstParser()
+        parser.parse(f"class Generated:\n{methods}")
+        result = self.analyzer.get_lcom4(parser)
+        self.assertEqual(result["Generated"], 1)
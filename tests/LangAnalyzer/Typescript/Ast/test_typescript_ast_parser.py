@@ -102,3 +102,18 @@ if __name__ == "__main__":
     dumper.dump_all()
     exit()
     functions = parser.get_identifier_nodes("usage")
+
+    def test_get_function_nodes_only_counts_assigned_arrow_functions(self):
+        self.parser.parse("""
+            const outer = (a) => {
+                const inner = () => a;
+                return [1, 2].map((x) => x * 2);
+            };
+            let later;
+            later = () => 1;
+            """)
+        nodes = self.parser.get_function_nodes()
+        self.assertEqual(
+            [self.parser.extract_function_name(node) for node in nodes],
+            ["outer", "inner", "later"],
+        )
@@ -0,0 +1,139 @@
+from unittest import TestCase
+
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Metric.Code.Segmentor import Segmentor
+from metripy.Metric.MetricStore import MetricStore
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Tree.ClassNode import ClassNode
+from metripy.Tree.FunctionNode import FunctionNode
+
+
+class TestMetricStore(TestCase):
+    VALUES = [0, 1, 4.5, 5, 5.5, 10, 15, 20, 20.5, 30, 40, 40.5, 50, 60, 80, 80.1]
+
+    def _create_file_metrics(self, name: str, value: float) -> FileMetrics:
+        function_node = FunctionNode(f"{name}:f", "f", 1, 1 + int(value), value)
+        function_node.maintainability_index = value
+        function_node.cognitive_complexity = value
+        class_node = ClassNode(f"{name}:C", "C", 1, 1 + int(value) * 30, value)
+        class_node.lcom4 = None if value == 60 else value
+        return FileMetrics(
+            full_name=name,
+            loc=int(value) * 30,
+            totalCc=value,
+            avgCcPerFunction=value,
+            maintainabilityIndex=value,
+            avgLocPerFunction=value,
+            class_nodes=[class_node],
+            function_nodes=[function_node],
+            import_name=None,
+            imports=None,
+            code_smells=[],
+            total_cog_complexity=value,
+            avg_cog_complexity_per_function=value,
+            avg_lcom4_per_class=value,
+        )
+
+    def setUp(self):
+        self.file_metrics = [
+            self._create_file_metrics(f"file{i}", value)
+            for i, value in enumerate(self.VALUES)
+        ]
+        self.store = MetricStore(self.file_metrics)
+
+    def _count(self, segment_of, values) -> list[int]:
+        segments = [segment_of(value) for value in values]
+        return [segments.count(segment) for segment in MetricStore.SEGMENTS]
+
+    def test_count_segments_matches_segmentor(self):
+        cases = [
+            (MetricStore.FILE, "loc", "loc", Segmentor.get_loc_segment),
+            (
+                MetricStore.FILE,
+                "avgCcPerFunction",
+                "complexity",
+                Segmentor.get_complexity_segment,
+            ),
+            (
+                MetricStore.FUNCTION,
+                "maintainability_index",
+                "maintainability",
+                Segmentor.get_maintainability_segment,
+            ),
+            (
+                MetricStore.FUNCTION,
+                "loc",
+                "method_size",
+                Segmentor.get_method_size_segment,
+            ),
+            (MetricStore.CLASS, "lcom4", "lcom4", Segmentor.get_lcom4_segment),
+        ]
+        values = {
+            MetricStore.FILE: self.file_metrics,
+            MetricStore.CLASS: [fm.class_nodes[0] for fm in self.file_metrics],
+            MetricStore.FUNCTION: [fm.function_nodes[0] for fm in self.file_metrics],
+        }
+        for level, column, segment, segment_of in cases:
+            items = values[level]
+            if level != MetricStore.FILE and column == "loc":
+                column_values = [item.get_loc() for item in items]
+            else:
+                column_values = [getattr(item, column) for item in items]
+            self.assertEqual(
+                self.store.count_segments(level, column, segment),
+                self._count(segment_of, column_values),
+                column,
+            )
+
+    def test_top_keeps_order_of_equal_values(self):
+        store = MetricStore(
+            [
+                self._create_file_metrics("a", 5),
+                self._create_file_metrics("b", 10),
+                self._create_file_metrics("c", 5),
+                self._create_file_metrics("d", 10),
+            ]
+        )
+
+        self.assertEqual(
+            [fm.full_name for fm in store.top(MetricStore.FILE, "totalCc", 3)],
+            ["b", "d", "a"],
+        )
+        self.assertEqual(
+            [
+                fm.full_name
+                for fm in store.top(MetricStore.FILE, "totalCc", 3, reverse=False)
+            ],
+            ["a", "c", "b"],
+        )
+
+    def test_project_metrics_aggregation(self):
+        metrics = ProjectMetrics(self.file_metrics, None, None)
+        functions = metrics.total_code_metrics_functions
+
+        self.assertEqual(
+            metrics.total_code_metrics.loc, sum(fm.loc for fm in self.file_metrics)
+        )
+        self.assertAlmostEqual(
+            metrics.total_code_metrics.avgCcPerFunction,
+            sum(self.VALUES) / len(self.VALUES),
+        )
+        self.assertEqual(functions.num_files, len(self.VALUES))
+        self.assertEqual(
+            functions.segmentation_data["complexity"].to_dict(),
+            dict(
+                zip(
+                    MetricStore.SEGMENTS,
+                    self._count(Segmentor.get_complexity_segment, self.VALUES),
+                )
+            ),
+        )
+
+    def test_empty_project(self):
+        metrics = ProjectMetrics([], None, None)
+
+        self.assertEqual(metrics.total_code_metrics.num_files, 0)
+        self.assertEqual(
+            metrics.metric_store.count_segments("file", "loc", "loc"), [0] * 4
+        )
+        self.assertEqual(metrics.metric_store.top("function", "loc", 10), [])
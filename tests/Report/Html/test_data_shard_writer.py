@@ -0,0 +1,45 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from metripy.Report.Html.DataShardWriter import DataShardWriter
+
+
+class TestDataShardWriter(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_group_by_directory(self):
+        full_names = ["src/a.py", "src/b/c.py", "src/d.py", "main.py", "src/e.py"]
+        with patch.object(DataShardWriter, "MAX_FILES_PER_SHARD", 2):
+            shards = DataShardWriter.group_by_directory(full_names)
+
+        self.assertEqual(
+            shards,
+            [["src/a.py", "src/d.py"], ["src/e.py"], ["src/b/c.py"], ["main.py"]],
+        )
+
+    def test_write(self):
+        writer = DataShardWriter(self.directory.name, "files")
+        path = writer.write("0", {"src/a.py": {"loc": 10}})
+
+        self.assertEqual(path, "data/files/0.js")
+        with open(os.path.join(self.directory.name, path)) as file:
+            content = file.read()
+        prefix, data = content.split(", ", 1)
+        self.assertEqual(prefix, 'MetripyData.register("data/files/0.js"')
+        self.assertTrue(data.endswith(");\n"))
+        self.assertEqual(json.loads(data[:-3]), {"src/a.py": {"loc": 10}})
+
+    def test_removes_shards_of_previous_report(self):
+        DataShardWriter(self.directory.name, "files").write("7", [])
+        DataShardWriter(self.directory.name, "files")
+
+        self.assertEqual(
+            os.listdir(os.path.join(self.directory.name, "data", "files")), []
+        )
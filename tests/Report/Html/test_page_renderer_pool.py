@@ -0,0 +1,86 @@
+import os
+import re
+import tempfile
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from metripy.Application.Config.ReportConfig import ReportConfig
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Report.Html.PageRendererFactory import PageRendererFactory
+from metripy.Report.Html.PageRendererPool import PageRendererPool
+from metripy.Report.Html.Reporter import Reporter
+from metripy.Tree.FunctionNode import FunctionNode
+
+
+class TestPageRendererPool(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        reporter = Reporter(
+            ReportConfig("html", self.directory.name), MagicMock(), "test"
+        )
+        self.factory = PageRendererFactory(
+            reporter.template_dir, self.directory.name, "test"
+        )
+        self.metrics = ProjectMetrics(
+            [
+                FileMetrics(
+                    full_name="src/file.py",
+                    loc=20,
+                    totalCc=3,
+                    avgCcPerFunction=3,
+                    maintainabilityIndex=70,
+                    avgLocPerFunction=10,
+                    class_nodes=[],
+                    function_nodes=[FunctionNode("src/file.py:f", "f", 1, 10, 3)],
+                    import_name=None,
+                    imports=None,
+                    code_smells=[],
+                    total_cog_complexity=2,
+                    avg_cog_complexity_per_function=2,
+                    avg_lcom4_per_class=0,
+                )
+            ],
+            None,
+            None,
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _read(self, page: str) -> str:
+        with open(os.path.join(self.directory.name, page)) as file:
+            return file.read()
+
+    @staticmethod
+    def _strip_dates(content: str) -> str:
+        return re.sub(r"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d", "", content)
+
+    def test_create_all_pages(self):
+        for page in PageRendererFactory.PAGES:
+            self.assertIsNotNone(self.factory.create(page))
+        with self.assertRaises(ValueError):
+            self.factory.create("unknown")
+
+    def test_get_workers_is_limited(self):
+        self.assertEqual(PageRendererPool(self.factory, 2).get_workers(9), 2)
+        self.assertEqual(PageRendererPool(self.factory, 64).get_workers(2), 2)
+        self.assertEqual(
+            PageRendererPool(self.factory, 64).get_workers(9),
+            PageRendererPool.MAX_WORKERS,
+        )
+
+    def test_same_pages_as_sequential(self):
+        pages = ["files", "top_offenders"]
+        self.assertEqual(
+            list(PageRendererPool(self.factory, 2).run(self.metrics, pages)), pages
+        )
+        concurrent = {page: self._read(f"{page}.html") for page in pages}
+
+        for page in pages:
+            self.factory.create(page).render(self.metrics)
+            self.assertIn("src/file.py", concurrent[page])
+            self.assertEqual(
+                self._strip_dates(concurrent[page]),
+                self._strip_dates(self._read(f"{page}.html")),
+            )
@@ -0,0 +1,73 @@
+import io
+import json
+from unittest import TestCase, skipIf
+
+from metripy.Report.Json.JsonStreamWriter import JsonStreamWriter, orjson
+
+
+class TestJsonStreamWriter(TestCase):
+    DOCUMENT = {
+        "files": [
+            {"name": "a.py", "functions": [], "lines": {"begin": 1, "end": 2}},
+            {"name": "b.py", "functions": [{"cc": 1.5}], "imports": None},
+        ],
+        "empty": [],
+        "nested": {"empty": {}, "values": [1, "two", True]},
+        "unicode": "äöü",
+        "floats": [0.0, 1e-05, 0.25, 1e16, float("inf"), float("nan")],
+    }
+    BACKENDS = (False, True) if orjson else (False,)
+
+    def _stream(self, fast: bool) -> bytes:
+        file = io.BytesIO()
+        writer = JsonStreamWriter(file, fast)
+        writer.begin_object()
+        writer.begin_array("files")
+        for item in self.DOCUMENT["files"]:
+            writer.write(item)
+        writer.end_array()
+        writer.begin_array("empty")
+        writer.end_array()
+        writer.begin_object("nested")
+        writer.write({}, "empty")
+        writer.write(self.DOCUMENT["nested"]["values"], "values")
+        writer.end_object()
+        writer.write(self.DOCUMENT["unicode"], "unicode")
+        writer.write(self.DOCUMENT["floats"], "floats")
+        writer.end_object()
+        return file.getvalue()
+
+    def test_same_layout_as_json_dump(self):
+        for fast in self.BACKENDS:
+            with self.subTest(fast=fast):
+                self.assertEqual(
+                    self._stream(fast), json.dumps(self.DOCUMENT, indent=2).encode()
+                )
+
+    def test_top_level_value(self):
+        for fast in self.BACKENDS:
+            with self.subTest(fast=fast):
+                file = io.BytesIO()
+                JsonStreamWriter(file, fast).write([1, {"a": None, 2: 1e-4}])
+
+                self.assertEqual(
+                    file.getvalue(),
+                    json.dumps([1, {"a": None, 2: 1e-4}], indent=2).encode(),
+                )
+
+    @skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_safe_values(self):
+        self.assertTrue(JsonStreamWriter._is_orjson_safe(self.DOCUMENT["files"]))
+        self.assertTrue(JsonStreamWriter._is_orjson_safe({1: [0.0, 1e-4, 2**63]}))
+        for value in [
+            "ä",
+            {"ä": 1},
+            [1e-05],
+            {"a": 1e16},
+            float("nan"),
+            -float("inf"),
+            {1.5: 1},
+            2**64,
+        ]:
+            with self.subTest(value=value):
+                self.assertFalse(JsonStreamWriter._is_orjson_safe(value))
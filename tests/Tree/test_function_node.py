@@ -0,0 +1,74 @@
+import pickle
+from unittest import TestCase
+
+from metripy.LangAnalyzer.Generic.CodeSmell.CodeSmell import (
+    CodeSmell,
+    CodeSmellSeverity,
+    CodeSmellType,
+)
+from metripy.Tree.ClassNode import ClassNode
+from metripy.Tree.FunctionNode import FunctionNode
+from metripy.Tree.ModuleNode import ModuleNode
+
+
+class TestFunctionNode(TestCase):
+    def _create_function_node(self) -> FunctionNode:
+        node = FunctionNode("file.py:Foo:bar", "bar", 3, 10, 4)
+        node.h1 = 5
+        node.h2 = 7
+        node.N1 = 11
+        node.N2 = 13
+        node.vocabulary = 12
+        node.length = 24
+        node.calculated_length = 31.2
+        node.volume = 86.0
+        node.difficulty = 4.6
+        node.effort = 398.4
+        node.time = 22.1
+        node.bugs = 0.02
+        node.cognitive_complexity = 3
+        node.calc_mi()
+        return node
+
+    def test_nodes_have_no_instance_dict(self):
+        class_node = ClassNode("file.py:Foo", "Foo", 1, 20, 4)
+        smell = CodeSmell(
+            CodeSmellType.LONG_FUNCTION,
+            CodeSmellSeverity.MINOR,
+            "file.py",
+            3,
+            0,
+            "too long",
+            "def bar(self):",
+        )
+        module_node = ModuleNode("file.py", 20, 15, 15, 2, 0, 3, 2)
+
+        for node in [self._create_function_node(), class_node, smell, module_node]:
+            self.assertFalse(hasattr(node, "__dict__"))
+            with self.assertRaises(AttributeError):
+                node.unknown = 1
+
+    def test_dict_round_trip(self):
+        node = self._create_function_node()
+        class_node = ClassNode("file.py:Foo", "Foo", 1, 20, 4)
+        class_node.lcom4 = 2
+        class_node.functions = [node]
+
+        self.assertEqual(
+            FunctionNode.from_dict(node.to_dict()).to_dict(), node.to_dict()
+        )
+        self.assertEqual(
+            ClassNode.from_dict(class_node.to_dict()).to_dict(), class_node.to_dict()
+        )
+
+    def test_pickle_round_trip(self):
+        module_node = ModuleNode("file.py", 20, 15, 15, 2, 0, 3, 2)
+        class_node = ClassNode("file.py:Foo", "Foo", 1, 20, 4)
+        class_node.functions = [self._create_function_node()]
+        module_node.classes = [class_node]
+        module_node.code_chunks.append(0, 1, 5, 2**63)
+
+        loaded = pickle.loads(pickle.dumps(module_node))
+
+        self.assertEqual(loaded.to_dict(), module_node.to_dict())
+        self.assertEqual(list(loaded.code_chunks.hashes), [2**63])
@@ -0,0 +1,103 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Trend.TrendAnalyzer import TrendAnalyzer
+from metripy.Trend.TrendSnapshot import TrendSnapshot
+from metripy.Trend.TrendSnapshotReader import TrendSnapshotReader
+from metripy.Trend.TrendSnapshotWriter import TrendSnapshotWriter
+from metripy.Tree.ClassNode import ClassNode
+from metripy.Tree.FunctionNode import FunctionNode
+
+
+class TestTrendSnapshot(TestCase):
+    def _create_file_metrics(self, name: str, complexity: int) -> FileMetrics:
+        function_node = FunctionNode(f"{name}:f", "f", 1, 10, complexity)
+        function_node.maintainability_index = 71.123456
+        class_node = ClassNode(f"{name}:C", "C", 12, 40, complexity)
+        class_node.functions = [FunctionNode(f"{name}:C:m", "m", 13, 20, 2)]
+        return FileMetrics(
+            full_name=name,
+            loc=40 * complexity,
+            totalCc=complexity,
+            avgCcPerFunction=complexity / 2,
+            maintainabilityIndex=55.5,
+            avgLocPerFunction=8.5,
+            class_nodes=[class_node],
+            function_nodes=[function_node],
+            import_name=None,
+            imports=None,
+            code_smells=[],
+            total_cog_complexity=complexity,
+            avg_cog_complexity_per_function=complexity / 3,
+            avg_lcom4_per_class=1,
+        )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "history.snapshot")
+        self.project_metrics = ProjectMetrics(
+            [self._create_file_metrics(f"src/file{i}.py", i) for i in range(1, 4)],
+            None,
+            None,
+        )
+        TrendSnapshotWriter().write(self.path, self.project_metrics)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_read_single_files(self):
+        with TrendSnapshotReader(self.path) as snapshot:
+            self.assertEqual(
+                snapshot.get_file_names(),
+                ["src/file1.py", "src/file2.py", "src/file3.py"],
+            )
+            file_metrics = snapshot.get_file_metrics("src/file2.py")
+            self.assertIsNone(snapshot.get_file_metrics("src/unknown.py"))
+
+        self.assertEqual(
+            file_metrics.to_dict(), self.project_metrics.file_metrics[1].to_dict()
+        )
+
+    def test_read_aggregated_metrics(self):
+        with TrendSnapshotReader(self.path) as snapshot:
+            aggregated = snapshot.get_aggregated_metrics()
+
+        total = self.project_metrics.total_code_metrics
+        self.assertEqual(aggregated.avgCcPerFunction, total.avgCcPerFunction)
+        self.assertEqual(aggregated.to_dict(), total.to_dict())
+        self.assertEqual(
+            aggregated.to_dict_segmentation(), total.to_dict_segmentation()
+        )
+
+    def test_trends_from_snapshot(self):
+        current = ProjectMetrics(
+            [self._create_file_metrics("src/file2.py", 5)], None, None
+        )
+
+        with TrendSnapshotReader(self.path) as snapshot:
+            TrendAnalyzer().add_file_trends(
+                current.file_metrics, snapshot.get_file_metrics
+            )
+            TrendAnalyzer().add_aggregated_trends(
+                current, snapshot.get_aggregated_metrics()
+            )
+
+        file_metrics = current.file_metrics[0]
+        self.assertEqual(file_metrics.trend.totalCc_delta, 3)
+        self.assertEqual(file_metrics.class_nodes[0].trend.real_complexity_delta, 3)
+        self.assertIsNotNone(file_metrics.function_nodes[0].trend)
+        self.assertEqual(current.total_code_metrics.trend.num_files_delta, -2)
+
+    def test_is_snapshot(self):
+        json_path = os.path.join(self.directory.name, "report.json")
+        with open(json_path, "w") as file:
+            file.write("{}")
+
+        self.assertTrue(TrendSnapshot.is_snapshot(self.path))
+        self.assertFalse(TrendSnapshot.is_snapshot(json_path))
+        self.assertFalse(TrendSnapshot.is_snapshot(json_path + ".missing"))
+        with self.assertRaises(ValueError):
+            TrendSnapshotReader(json_path)
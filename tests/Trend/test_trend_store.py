@@ -0,0 +1,152 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from metripy.Metric.Code.FileMetrics import FileMetrics
+from metripy.Metric.ProjectMetrics import ProjectMetrics
+from metripy.Trend.TrendAnalyzer import TrendAnalyzer
+from metripy.Trend.TrendStore import TrendStore
+from metripy.Tree.ClassNode import ClassNode
+from metripy.Tree.FunctionNode import FunctionNode
+
+DAY = 24 * 60 * 60
+
+
+class TestTrendStore(TestCase):
+    def _create_file_metrics(self, name: str, complexity: int) -> FileMetrics:
+        function_node = FunctionNode(f"{name}:f", "f", 1, 10, complexity)
+        function_node.maintainability_index = 71.123456
+        function_node.cognitive_complexity = complexity + 1
+        class_node = ClassNode(f"{name}:C", "C", 12, 40, complexity)
+        class_node.lcom4 = 2
+        class_node.functions = [FunctionNode(f"{name}:C:m", "m", 13, 20, 2)]
+        return FileMetrics(
+            full_name=name,
+            loc=40 * complexity,
+            totalCc=complexity,
+            avgCcPerFunction=complexity / 2,
+            maintainabilityIndex=55.5,
+            avgLocPerFunction=8.5,
+            class_nodes=[class_node],
+            function_nodes=[function_node],
+            import_name=None,
+            imports=None,
+            code_smells=[],
+            total_cog_complexity=complexity,
+            avg_cog_complexity_per_function=complexity / 3,
+            avg_lcom4_per_class=1,
+        )
+
+    def _create_project_metrics(self, complexity: int) -> ProjectMetrics:
+        return ProjectMetrics(
+            [
+                self._create_file_metrics(f"src/file{i}.py", i * complexity)
+                for i in range(1, 4)
+            ],
+            None,
+            None,
+        )
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "metrics.db")
+        self.store = TrendStore(self.path, "project")
+
+    def tearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_file_metrics_round_trip(self):
+        project_metrics = self._create_project_metrics(1)
+        run_id = self.store.add_run(project_metrics, 1000)
+
+        file_metrics = self.store.get_file_metrics(run_id, "src/file2.py")
+
+        self.assertEqual(self.store.get_last_run(), run_id)
+        self.assertEqual(
+            file_metrics.to_dict(), project_metrics.file_metrics[1].to_dict()
+        )
+        self.assertEqual(
+            file_metrics.class_nodes[0].functions[0].full_name, "src/file2.py:C:m"
+        )
+        self.assertIsNone(self.store.get_file_metrics(run_id, "src/unknown.py"))
+
+    def test_aggregated_metrics_round_trip(self):
+        project_metrics = self._create_project_metrics(1)
+        run_id = self.store.add_run(project_metrics, 1000)
+
+        aggregated = self.store.get_aggregated_metrics(run_id)
+
+        total = project_metrics.total_code_metrics
+        self.assertEqual(aggregated.to_dict(), total.to_dict())
+        self.assertEqual(
+            aggregated.to_dict_segmentation(), total.to_dict_segmentation()
+        )
+
+    def test_series(self):
+        for complexity in range(1, 5):
+            self.store.add_run(self._create_project_metrics(complexity), complexity)
+        with TrendStore(self.path, "other") as other_project:
+            other_project.add_run(self._create_project_metrics(10), 10)
+
+        self.assertEqual(
+            self.store.get_series("files", "src/file1.py", "totalCc", 3),
+            [(2, 2), (3, 3), (4, 4)],
+        )
+        self.assertEqual(
+            self.store.get_series("functions", "src/file2.py:f", "complexity", 2),
+            [(3, 6), (4, 8)],
+        )
+        self.assertEqual(
+            [
+                (timestamp, aggregated.num_files)
+                for timestamp, aggregated in self.store.get_project_series(2)
+            ],
+            [(3, 3), (4, 3)],
+        )
+        with self.assertRaises(ValueError):
+            self.store.get_series("files", "src/file1.py", "run_id; --", 3)
+
+    def test_retention(self):
+        now = 100 * DAY
+        timestamps = [
+            now - 120 * DAY,  # deleted
+            now - 30 * DAY + 10,  # downsampled away
+            now - 30 * DAY + 20,
+            now - DAY + 10,  # kept, newer than downsample_days
+            now - DAY + 20,
+        ]
+        for timestamp in timestamps:
+            self.store.add_run(self._create_project_metrics(1), timestamp)
+
+        self.store.apply_retention(now, 90, 14)
+
+        self.assertEqual(
+            [timestamp for timestamp, _ in self.store.get_project_series(10)],
+            timestamps[2:],
+        )
+        (file_rows,) = self.store.connection.execute(
+            "SELECT COUNT(*) FROM files"
+        ).fetchone()
+        self.assertEqual(file_rows, 3 * 3)
+
+    def test_trends_from_last_run(self):
+        self.store.add_run(self._create_project_metrics(1), 1000)
+        run_id = self.store.add_run(self._create_project_metrics(2), 2000)
+        current = ProjectMetrics(
+            [self._create_file_metrics("src/file2.py", 5)], None, None
+        )
+
+        TrendAnalyzer().add_file_trends(
+            current.file_metrics,
+            lambda full_name: self.store.get_file_metrics(run_id, full_name),
+        )
+        TrendAnalyzer().add_aggregated_trends(
+            current, self.store.get_aggregated_metrics(run_id)
+        )
+
+        file_metrics = current.file_metrics[0]
+        self.assertEqual(file_metrics.trend.totalCc_delta, 1)
+        self.assertEqual(file_metrics.class_nodes[0].trend.real_complexity_delta, 1)
+        self.assertIsNotNone(file_metrics.function_nodes[0].trend)
+        self.assertEqual(current.total_code_metrics.trend.num_files_delta, -2)
@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs the cli like the console script, the worker processes are spawned from it
+SCRIPT = """
+from metripy.metripy import main
+from metripy.Report.Html.Reporter import Reporter
+
+if __name__ == "__main__":
+    # render the pages in the pool without creating thousands of files
+    Reporter.CONCURRENT_MIN_FILES = 1
+    main()
+"""
+
+
+class TestMetripy(TestCase):
+    def test_main_with_worker_processes(self):
+        with tempfile.TemporaryDirectory() as path:
+            os.makedirs(os.path.join(path, "src"))
+            for i in range(3):
+                with open(os.path.join(path, "src", f"module_{i}.py"), "w") as file:
+                    file.write(f"def function_{i}(a):\n    return a + {i}\n")
+            with open(os.path.join(path, "config.json"), "w") as file:
+                json.dump(
+                    {
+                        "configs": {
+                            "project": {
+                                "base_path": path,
+                                "includes": ["src/"],
+                                "extensions": ["py"],
+                                "reports": {"html": os.path.join(path, "report")},
+                            }
+                        }
+                    },
+                    file,
+                )
+            script = os.path.join(path, "metripy")
+            with open(script, "w") as file:
+                file.write(SCRIPT)
+
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    script,
+                    f"--config={os.path.join(path, 'config.json')}",
+                    "--workers=2",
+                    "--no-cache",
+                ],
+                env={**os.environ, "PYTHONPATH": ROOT},
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+
+            self.assertEqual(result.returncode, 0, result.stderr)
+            self.assertIn("Rendering pages with 2 workers", result.stdout)
+            self.assertTrue(os.path.isfile(os.path.join(path, "report", "index.html")))